@@ -1,3 +1,5 @@
+import atexit
+import functools
 import os
 import sys
 from logging.config import fileConfig
@@ -12,41 +14,89 @@ from alembic import context
 # access to the values within the .ini file in use.
 config = context.config
 
-# Interpret the config file for Python logging.
-fileConfig(config.config_file_name)
+
+def _configure_logging():
+    # Interpret the config file for Python logging, unless we're embedded in a
+    # host that manages logging itself.
+    if config.config_file_name is None or os.getenv("ALEMBIC_SKIP_LOG_CONFIG") == "1":
+        return
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
 
 # add your model's MetaData object here for 'autogenerate' support
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-from app.db.base import Base
-from app.db import models  # noqa: F401
-target_metadata = Base.metadata
+_target_metadata = None
+
+
+def _load_metadata():
+    # Importing the ORM models is deferred until a migration actually runs.
+    global _target_metadata
+    if _target_metadata is None:
+        from app.db.base import Base
+        from app.db import models  # noqa: F401
+        _target_metadata = Base.metadata
+    return _target_metadata
 
 
+_PG_PREFIX = "postgresql://"
+_PSYCOPG_PREFIX = "postgresql+psycopg://"
+
+
+@functools.lru_cache(maxsize=1)
 def get_url():
     url = os.getenv("DATABASE_URL") or os.getenv("SUPABASE_DB_URL")
-    if url and url.startswith("postgresql://"):
-        return url.replace("postgresql://", "postgresql+psycopg://", 1)
+    if url and url.startswith(_PG_PREFIX):
+        return _PSYCOPG_PREFIX + url[len(_PG_PREFIX):]
     return url
 
 
 def run_migrations_offline():
+    _configure_logging()
     url = get_url()
-    context.configure(url=url, target_metadata=target_metadata, literal_binds=True)
+    context.configure(url=url, target_metadata=_load_metadata(), literal_binds=True, transaction_per_migration=True)
 
     with context.begin_transaction():
         context.run_migrations()
 
 
+def _get_engine(url):
+    # env.py is re-executed for every alembic command, so the engine is cached on
+    # the Config object; callers that reuse one Config across command.upgrade /
+    # command.current / ... keep a warm pooled connection instead of reconnecting.
+    engine = config.attributes.get("strategos_engine")
+    if engine is not None:
+        return engine
+
+    # Migrations are a one-shot batch of DDL: keep compiled statements cached
+    # and never server-side prepare them (multi-statement scripts can't be, and
+    # transaction poolers such as Supabase's reject prepared statements).
+    connect_args = {"prepare_threshold": None} if url.startswith(_PSYCOPG_PREFIX) else {}
+    if os.getenv("ALEMBIC_NULLPOOL") == "1":
+        pool_kwargs = {"poolclass": pool.NullPool}
+    else:
+        pool_kwargs = {"poolclass": pool.QueuePool, "pool_size": 1, "pool_pre_ping": True, "pool_recycle": 3600}
+    engine = create_engine(url, query_cache_size=1200, connect_args=connect_args, **pool_kwargs)
+    config.attributes["strategos_engine"] = engine
+    atexit.register(engine.dispose)
+    return engine
+
+
 def run_migrations_online():
-    connectable = None
+    _configure_logging()
     url = get_url()
     if url is None:
         raise RuntimeError("DATABASE_URL is required for online migrations")
 
-    connectable = create_engine(url, poolclass=pool.NullPool)
+    connectable = _get_engine(url)
+    # Opt-in: statement-level commits release DDL locks eagerly when several
+    # deploys race on the same schema. Transactional DDL stays the default.
+    if os.getenv("ALEMBIC_AUTOCOMMIT") == "1":
+        connectable = connectable.execution_options(isolation_level="AUTOCOMMIT")
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        # One transaction per revision, so a revision can step out into an
+        # autocommit_block() for CREATE INDEX CONCURRENTLY.
+        context.configure(connection=connection, target_metadata=_load_metadata(), transaction_per_migration=True)
 
         with context.begin_transaction():
             context.run_migrations()
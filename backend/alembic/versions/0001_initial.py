@@ -8,6 +8,7 @@ Create Date: 2026-02-23 00:00:00.000000
 from alembic import op
 import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateTable
 
 # revision identifiers, used by Alembic.
 revision = '0001_initial'
@@ -16,157 +17,120 @@ branch_labels = None
 depends_on = None
 
 
+# Type and default instances are immutable, so every column shares one of each.
+_UUID = postgresql.UUID(as_uuid=True)
+_NAME = sa.String(length=255)
+_TEXT = sa.Text()
+_TS = sa.DateTime()
+_BOOL = sa.Boolean()
+_NOW = sa.text('now()')
+_TRUE = sa.text('true')
+
+# Every table gets `id` first and `created_at` after its own columns; `tracked`
+# tables also get `updated_at`, `active` tables get `is_active`.
+# Column spec: (name, type, nullable[, foreign key target]).
+_SCHEMA = (
+    ('tenants', [
+        ('name', _NAME, False),
+    ], {}),
+    ('model_versions', [
+        ('tenant_id', _UUID, False),
+        ('name', _NAME, False),
+        ('description', _TEXT, True),
+    ], {'tracked': True, 'active': True}),
+    ('metrics', [
+        ('tenant_id', _UUID, False),
+        ('model_version_id', _UUID, True, 'model_versions.id'),
+        ('name', _NAME, False),
+    ], {'tracked': True, 'active': True}),
+    ('coefficients', [
+        ('tenant_id', _UUID, False),
+        ('model_version_id', _UUID, True, 'model_versions.id'),
+        ('name', _NAME, False),
+        ('value', _NAME, False),
+    ], {'tracked': True, 'active': True}),
+    ('rules', [
+        ('tenant_id', _UUID, False),
+        ('model_version_id', _UUID, False, 'model_versions.id'),
+        ('name', _NAME, False),
+        ('description', _TEXT, True),
+    ], {'tracked': True, 'active': True}),
+    ('rule_conditions', [
+        ('tenant_id', _UUID, False),
+        ('rule_id', _UUID, False, 'rules.id'),
+        ('expression', _TEXT, False),
+    ], {'active': True}),
+    ('rule_impacts', [
+        ('tenant_id', _UUID, False),
+        ('rule_id', _UUID, False, 'rules.id'),
+        ('impact', _TEXT, False),
+    ], {'active': True}),
+    ('state_definitions', [
+        ('tenant_id', _UUID, False),
+        ('name', sa.String(length=128), False),
+        ('description', _TEXT, True),
+    ], {}),
+    ('state_thresholds', [
+        ('tenant_id', _UUID, False),
+        ('state_definition_id', _UUID, False, 'state_definitions.id'),
+        ('threshold', _NAME, False),
+    ], {}),
+    ('restructuring_templates', [
+        ('tenant_id', _UUID, False),
+        ('name', _NAME, False),
+        ('payload', _TEXT, True),
+    ], {}),
+    ('restructuring_rules', [
+        ('tenant_id', _UUID, False),
+        ('template_id', _UUID, False, 'restructuring_templates.id'),
+    ], {}),
+    ('transformation_sessions', [
+        ('tenant_id', _UUID, False),
+        ('model_version_id', _UUID, False, 'model_versions.id'),
+        ('name', _NAME, True),
+        ('snapshot', _TEXT, True),
+    ], {}),
+    ('transformation_scenarios', [
+        ('tenant_id', _UUID, False),
+        ('session_id', _UUID, False, 'transformation_sessions.id'),
+        ('name', _NAME, True),
+    ], {}),
+    ('audit_logs', [
+        ('tenant_id', _UUID, True),
+        ('actor', _NAME, True),
+        ('action', _NAME, False),
+        ('payload', _TEXT, True),
+    ], {}),
+)
+
+
+def _build_table(metadata, name, columns, tracked=False, active=False):
+    cols = [sa.Column('id', _UUID, primary_key=True, nullable=False)]
+    for col_name, col_type, nullable, *fk in columns:
+        args = [sa.ForeignKey(fk[0])] if fk else []
+        cols.append(sa.Column(col_name, col_type, *args, nullable=nullable))
+    cols.append(sa.Column('created_at', _TS, nullable=False, server_default=_NOW))
+    if tracked:
+        cols.append(sa.Column('updated_at', _TS, nullable=True))
+    if active:
+        cols.append(sa.Column('is_active', _BOOL, nullable=False, server_default=_TRUE))
+    return sa.Table(name, metadata, *cols)
+
+
+_metadata = sa.MetaData()
+# Dependency order; downgrade walks it in reverse.
+_TABLES = tuple(_build_table(_metadata, name, columns, **flags) for name, columns, flags in _SCHEMA)
+
+
+def _create_ddl(dialect):
+    return ';\n'.join(str(CreateTable(table).compile(dialect=dialect)).strip() for table in _TABLES)
+
+
 def upgrade():
-    op.create_table(
-        'tenants',
-        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
-        sa.Column('name', sa.String(length=255), nullable=False),
-        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
-    )
-
-    op.create_table(
-        'model_versions',
-        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
-        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('name', sa.String(length=255), nullable=False),
-        sa.Column('description', sa.Text(), nullable=True),
-        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
-        sa.Column('updated_at', sa.DateTime(), nullable=True),
-        sa.Column('is_active', sa.Boolean(), nullable=False, server_default=sa.text('true')),
-    )
-
-    op.create_table(
-        'metrics',
-        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
-        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('model_version_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('model_versions.id'), nullable=True),
-        sa.Column('name', sa.String(length=255), nullable=False),
-        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
-        sa.Column('updated_at', sa.DateTime(), nullable=True),
-        sa.Column('is_active', sa.Boolean(), nullable=False, server_default=sa.text('true')),
-    )
-
-    op.create_table(
-        'coefficients',
-        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
-        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('model_version_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('model_versions.id'), nullable=True),
-        sa.Column('name', sa.String(length=255), nullable=False),
-        sa.Column('value', sa.String(length=255), nullable=False),
-        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
-        sa.Column('updated_at', sa.DateTime(), nullable=True),
-        sa.Column('is_active', sa.Boolean(), nullable=False, server_default=sa.text('true')),
-    )
-
-    op.create_table(
-        'rules',
-        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
-        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('model_version_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('model_versions.id'), nullable=False),
-        sa.Column('name', sa.String(length=255), nullable=False),
-        sa.Column('description', sa.Text(), nullable=True),
-        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
-        sa.Column('updated_at', sa.DateTime(), nullable=True),
-        sa.Column('is_active', sa.Boolean(), nullable=False, server_default=sa.text('true')),
-    )
-
-    op.create_table(
-        'rule_conditions',
-        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
-        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('rule_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('rules.id'), nullable=False),
-        sa.Column('expression', sa.Text(), nullable=False),
-        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
-        sa.Column('is_active', sa.Boolean(), nullable=False, server_default=sa.text('true')),
-    )
-
-    op.create_table(
-        'rule_impacts',
-        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
-        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('rule_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('rules.id'), nullable=False),
-        sa.Column('impact', sa.Text(), nullable=False),
-        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
-        sa.Column('is_active', sa.Boolean(), nullable=False, server_default=sa.text('true')),
-    )
-
-    op.create_table(
-        'state_definitions',
-        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
-        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('name', sa.String(length=128), nullable=False),
-        sa.Column('description', sa.Text(), nullable=True),
-        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
-    )
-
-    op.create_table(
-        'state_thresholds',
-        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
-        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('state_definition_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('state_definitions.id'), nullable=False),
-        sa.Column('threshold', sa.String(length=255), nullable=False),
-        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
-    )
-
-    op.create_table(
-        'restructuring_templates',
-        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
-        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('name', sa.String(length=255), nullable=False),
-        sa.Column('payload', sa.Text(), nullable=True),
-        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
-    )
-
-    op.create_table(
-        'restructuring_rules',
-        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
-        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('template_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('restructuring_templates.id'), nullable=False),
-        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
-    )
-
-    op.create_table(
-        'transformation_sessions',
-        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
-        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('model_version_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('model_versions.id'), nullable=False),
-        sa.Column('name', sa.String(length=255), nullable=True),
-        sa.Column('snapshot', sa.Text(), nullable=True),
-        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
-    )
-
-    op.create_table(
-        'transformation_scenarios',
-        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
-        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('session_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('transformation_sessions.id'), nullable=False),
-        sa.Column('name', sa.String(length=255), nullable=True),
-        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
-    )
-
-    op.create_table(
-        'audit_logs',
-        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
-        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), nullable=True),
-        sa.Column('actor', sa.String(length=255), nullable=True),
-        sa.Column('action', sa.String(length=255), nullable=False),
-        sa.Column('payload', sa.Text(), nullable=True),
-        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
-    )
+    # One round-trip for the whole schema instead of one per table.
+    op.execute(_create_ddl(op.get_context().dialect))
 
 
 def downgrade():
-    op.drop_table('audit_logs')
-    op.drop_table('transformation_scenarios')
-    op.drop_table('transformation_sessions')
-    op.drop_table('restructuring_rules')
-    op.drop_table('restructuring_templates')
-    op.drop_table('state_thresholds')
-    op.drop_table('state_definitions')
-    op.drop_table('rule_impacts')
-    op.drop_table('rule_conditions')
-    op.drop_table('rules')
-    op.drop_table('coefficients')
-    op.drop_table('metrics')
-    op.drop_table('model_versions')
-    op.drop_table('tenants')
+    # Single pass over the dependency graph; IF EXISTS lets CI tear down half-applied schemas.
+    op.execute('DROP TABLE IF EXISTS ' + ', '.join(table.name for table in reversed(_TABLES)) + ' CASCADE')
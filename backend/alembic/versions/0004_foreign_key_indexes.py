@@ -0,0 +1,43 @@
+"""foreign key indexes
+
+Revision ID: 0004_foreign_key_indexes
+Revises: 0003_auth_verification_reset_approval
+Create Date: 2026-10-15 00:00:00.000000
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0004_foreign_key_indexes"
+down_revision = "0003_auth_verification_reset_approval"
+branch_labels = None
+depends_on = None
+
+
+# (index name, table, column list) in the order they are created.
+_INDEXES = (
+    ("ix_model_versions_tenant_id", "model_versions", "tenant_id"),
+    ("ix_metrics_tenant_id_model_version_id", "metrics", "tenant_id, model_version_id"),
+    ("ix_coefficients_tenant_id_model_version_id", "coefficients", "tenant_id, model_version_id"),
+    ("ix_rules_model_version_id", "rules", "model_version_id"),
+    ("ix_rule_conditions_rule_id", "rule_conditions", "rule_id"),
+    ("ix_rule_impacts_rule_id", "rule_impacts", "rule_id"),
+    ("ix_state_thresholds_state_definition_id", "state_thresholds", "state_definition_id"),
+    ("ix_restructuring_rules_template_id", "restructuring_rules", "template_id"),
+    ("ix_transformation_sessions_model_version_id", "transformation_sessions", "model_version_id"),
+    ("ix_transformation_scenarios_session_id", "transformation_scenarios", "session_id"),
+    ("ix_audit_logs_tenant_id_created_at", "audit_logs", "tenant_id, created_at DESC"),
+)
+
+
+def upgrade():
+    # CONCURRENTLY keeps writes flowing on populated tables; it can't run inside a
+    # transaction or share a multi-statement string, hence one execute per index.
+    with op.get_context().autocommit_block():
+        for name, table, columns in _INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({columns})")
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS " + ", ".join(name for name, _, _ in reversed(_INDEXES)))
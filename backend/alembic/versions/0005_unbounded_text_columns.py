@@ -0,0 +1,35 @@
+"""unbounded text columns
+
+Revision ID: 0005_unbounded_text_columns
+Revises: 0004_foreign_key_indexes
+Create Date: 2026-10-15 00:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0005_unbounded_text_columns"
+down_revision = "0004_foreign_key_indexes"
+branch_labels = None
+depends_on = None
+
+
+# varchar -> text is binary compatible in Postgres, so these ALTERs do not rewrite the tables.
+_COLUMNS = (
+    ("audit_logs", "actor", True),
+    ("audit_logs", "action", False),
+    ("coefficients", "value", False),
+    ("state_thresholds", "threshold", False),
+)
+
+
+def upgrade():
+    for table, column, nullable in _COLUMNS:
+        op.alter_column(table, column, type_=sa.Text(), existing_type=sa.String(length=255), existing_nullable=nullable)
+
+
+def downgrade():
+    for table, column, nullable in reversed(_COLUMNS):
+        op.alter_column(table, column, type_=sa.String(length=255), existing_type=sa.Text(), existing_nullable=nullable)
@@ -0,0 +1,72 @@
+"""timestamptz created_at
+
+Revision ID: 0006_timestamptz_created_at
+Revises: 0005_unbounded_text_columns
+Create Date: 2026-10-15 00:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0006_timestamptz_created_at"
+down_revision = "0005_unbounded_text_columns"
+branch_labels = None
+depends_on = None
+
+
+_TABLES = (
+    "tenants",
+    "model_versions",
+    "metrics",
+    "coefficients",
+    "rules",
+    "rule_conditions",
+    "rule_impacts",
+    "state_definitions",
+    "state_thresholds",
+    "restructuring_templates",
+    "restructuring_rules",
+    "transformation_sessions",
+    "transformation_scenarios",
+    "audit_logs",
+)
+_UPDATED_AT_TABLES = ("model_versions", "metrics", "coefficients", "rules")
+
+
+def _columns():
+    for table in _TABLES:
+        yield table, "created_at", False
+        if table in _UPDATED_AT_TABLES:
+            yield table, "updated_at", True
+
+
+def upgrade():
+    # Existing values were written as naive UTC.
+    for table, column, nullable in _columns():
+        op.alter_column(
+            table,
+            column,
+            type_=sa.DateTime(timezone=True),
+            existing_type=sa.DateTime(),
+            existing_nullable=nullable,
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
+    # clock_timestamp() keeps rows written in one transaction distinct and ordered.
+    op.alter_column("audit_logs", "created_at", server_default=sa.text("clock_timestamp()"), existing_type=sa.DateTime(timezone=True))
+    op.execute("CREATE INDEX IF NOT EXISTS ix_audit_logs_created_at_brin ON audit_logs USING BRIN (created_at) WITH (pages_per_range = 32)")
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_audit_logs_created_at_brin")
+    op.alter_column("audit_logs", "created_at", server_default=sa.text("now()"), existing_type=sa.DateTime(timezone=True))
+    for table, column, nullable in reversed(list(_columns())):
+        op.alter_column(
+            table,
+            column,
+            type_=sa.DateTime(),
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=nullable,
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
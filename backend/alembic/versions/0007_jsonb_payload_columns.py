@@ -0,0 +1,68 @@
+"""jsonb payload columns
+
+Revision ID: 0007_jsonb_payload_columns
+Revises: 0006_timestamptz_created_at
+Create Date: 2026-10-15 00:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "0007_jsonb_payload_columns"
+down_revision = "0006_timestamptz_created_at"
+branch_labels = None
+depends_on = None
+
+
+_COLUMNS = (
+    ("restructuring_templates", "payload"),
+    ("transformation_sessions", "snapshot"),
+    ("audit_logs", "payload"),
+)
+
+
+def upgrade():
+    # Legacy rows that are not valid JSON are kept as JSON strings instead of failing the cast.
+    op.execute(
+        """
+        CREATE FUNCTION pg_temp.strategos_text_to_jsonb(value text) RETURNS jsonb AS $$
+        BEGIN
+            RETURN value::jsonb;
+        EXCEPTION WHEN others THEN
+            RETURN to_jsonb(value);
+        END
+        $$ LANGUAGE plpgsql IMMUTABLE
+        """
+    )
+    for table, column in _COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.JSONB(),
+            existing_type=sa.Text(),
+            existing_nullable=True,
+            postgresql_using=f"pg_temp.strategos_text_to_jsonb({column})",
+        )
+    op.create_index(
+        "ix_audit_logs_payload_gin",
+        "audit_logs",
+        ["payload"],
+        postgresql_using="gin",
+        postgresql_ops={"payload": "jsonb_path_ops"},
+    )
+
+
+def downgrade():
+    op.drop_index("ix_audit_logs_payload_gin", table_name="audit_logs")
+    for table, column in reversed(_COLUMNS):
+        op.alter_column(
+            table,
+            column,
+            type_=sa.Text(),
+            existing_type=postgresql.JSONB(),
+            existing_nullable=True,
+            postgresql_using=f"{column}::text",
+        )
@@ -0,0 +1,41 @@
+"""tenant scoped indexes
+
+Revision ID: 0008_tenant_scoped_indexes
+Revises: 0007_jsonb_payload_columns
+Create Date: 2026-10-15 00:00:00.000000
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0008_tenant_scoped_indexes"
+down_revision = "0007_jsonb_payload_columns"
+branch_labels = None
+depends_on = None
+
+
+_INDEXES = (
+    ("ix_metrics_tenant_id_created_at", "metrics", "tenant_id, created_at DESC"),
+    ("ix_coefficients_tenant_id_created_at", "coefficients", "tenant_id, created_at DESC"),
+    ("ix_rules_tenant_id_model_version_id", "rules", "tenant_id, model_version_id"),
+    ("ix_rule_conditions_tenant_id_rule_id", "rule_conditions", "tenant_id, rule_id"),
+)
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        for name, table, columns in _INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({columns})")
+        # Tenant-less audit rows (system events) never match a tenant filter; keep them out of the B-tree.
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_audit_logs_tenant_id_created_at")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY ix_audit_logs_tenant_id_created_at ON audit_logs (tenant_id, created_at DESC) "
+            "WHERE tenant_id IS NOT NULL"
+        )
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_audit_logs_tenant_id_created_at")
+    op.execute("CREATE INDEX ix_audit_logs_tenant_id_created_at ON audit_logs (tenant_id, created_at DESC)")
+    op.execute("DROP INDEX IF EXISTS " + ", ".join(name for name, _, _ in reversed(_INDEXES)))
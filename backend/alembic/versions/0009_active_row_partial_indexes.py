@@ -0,0 +1,37 @@
+"""active row partial indexes
+
+Revision ID: 0009_active_row_partial_indexes
+Revises: 0008_tenant_scoped_indexes
+Create Date: 2026-10-15 00:00:00.000000
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0009_active_row_partial_indexes"
+down_revision = "0008_tenant_scoped_indexes"
+branch_labels = None
+depends_on = None
+
+
+# Keyed on the column each read path filters by alongside `is_active = true`;
+# deactivated rows are left out of the index entirely.
+_INDEXES = (
+    ("ix_model_versions_active_tenant_id", "model_versions", "tenant_id"),
+    ("ix_metrics_active_model_version_id", "metrics", "model_version_id"),
+    ("ix_coefficients_active_model_version_id", "coefficients", "model_version_id"),
+    ("ix_rules_active_model_version_id", "rules", "model_version_id"),
+    ("ix_rule_conditions_active_rule_id", "rule_conditions", "rule_id"),
+    ("ix_rule_impacts_active_rule_id", "rule_impacts", "rule_id"),
+)
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        for name, table, column in _INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({column}) WHERE is_active")
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS " + ", ".join(name for name, _, _ in reversed(_INDEXES)))
@@ -0,0 +1,93 @@
+"""partition audit logs
+
+Revision ID: 0010_partition_audit_logs
+Revises: 0009_active_row_partial_indexes
+Create Date: 2026-10-15 00:00:00.000000
+"""
+
+from datetime import date
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0010_partition_audit_logs"
+down_revision = "0009_active_row_partial_indexes"
+branch_labels = None
+depends_on = None
+
+
+# Monthly partitions are pre-created for this window; anything outside it lands in
+# audit_logs_default until a partition for that month is added.
+_FIRST_MONTH = date(2026, 1, 1)
+_MONTHS = 24
+
+_INDEXES = (
+    "CREATE INDEX ix_audit_logs_tenant_id_created_at ON audit_logs (tenant_id, created_at DESC) WHERE tenant_id IS NOT NULL",
+    "CREATE INDEX ix_audit_logs_created_at_brin ON audit_logs USING BRIN (created_at) WITH (pages_per_range = 32)",
+    "CREATE INDEX ix_audit_logs_payload_gin ON audit_logs USING gin (payload jsonb_path_ops)",
+)
+_INDEX_NAMES = ("ix_audit_logs_tenant_id_created_at", "ix_audit_logs_created_at_brin", "ix_audit_logs_payload_gin")
+
+
+def _month_bounds():
+    year, month = _FIRST_MONTH.year, _FIRST_MONTH.month
+    for _ in range(_MONTHS):
+        start = date(year, month, 1)
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        yield start, date(year, month, 1)
+
+
+def _swap_out_existing_table():
+    op.execute("DROP INDEX IF EXISTS " + ", ".join(_INDEX_NAMES))
+    op.execute("ALTER TABLE audit_logs RENAME TO audit_logs_legacy")
+    op.execute("ALTER TABLE audit_logs_legacy RENAME CONSTRAINT audit_logs_pkey TO audit_logs_legacy_pkey")
+
+
+def _copy_and_drop_legacy():
+    op.execute(
+        "INSERT INTO audit_logs (id, tenant_id, actor, action, payload, created_at) "
+        "SELECT id, tenant_id, actor, action, payload, created_at FROM audit_logs_legacy"
+    )
+    op.execute("DROP TABLE audit_logs_legacy")
+    for statement in _INDEXES:
+        op.execute(statement)
+
+
+def upgrade():
+    _swap_out_existing_table()
+    # The partition key has to be part of the primary key.
+    op.execute(
+        "CREATE TABLE audit_logs ("
+        "id UUID NOT NULL, "
+        "tenant_id UUID, "
+        "actor TEXT, "
+        "action TEXT NOT NULL, "
+        "payload JSONB, "
+        "created_at TIMESTAMP WITH TIME ZONE DEFAULT clock_timestamp() NOT NULL, "
+        "PRIMARY KEY (id, created_at)"
+        ") PARTITION BY RANGE (created_at)"
+    )
+    for start, end in _month_bounds():
+        op.execute(
+            f"CREATE TABLE audit_logs_y{start.year}m{start.month:02d} PARTITION OF audit_logs "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+    op.execute("CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT")
+    _copy_and_drop_legacy()
+
+
+def downgrade():
+    _swap_out_existing_table()
+    op.execute(
+        "CREATE TABLE audit_logs ("
+        "id UUID NOT NULL, "
+        "tenant_id UUID, "
+        "actor TEXT, "
+        "action TEXT NOT NULL, "
+        "payload JSONB, "
+        "created_at TIMESTAMP WITH TIME ZONE DEFAULT clock_timestamp() NOT NULL, "
+        "PRIMARY KEY (id)"
+        ")"
+    )
+    _copy_and_drop_legacy()
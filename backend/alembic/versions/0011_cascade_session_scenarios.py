@@ -0,0 +1,37 @@
+"""cascade session scenarios
+
+Revision ID: 0011_cascade_session_scenarios
+Revises: 0010_partition_audit_logs
+Create Date: 2026-10-15 00:00:00.000000
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0011_cascade_session_scenarios"
+down_revision = "0010_partition_audit_logs"
+branch_labels = None
+depends_on = None
+
+
+_CONSTRAINT = "transformation_scenarios_session_id_fkey"
+
+
+def _swap_fk(on_delete):
+    # Swap the constraint in one ALTER and add it NOT VALID so only a brief lock is
+    # taken; the separate VALIDATE scans existing rows without blocking writes.
+    op.execute(
+        f"ALTER TABLE transformation_scenarios DROP CONSTRAINT IF EXISTS {_CONSTRAINT}, "
+        f"ADD CONSTRAINT {_CONSTRAINT} FOREIGN KEY (session_id) "
+        f"REFERENCES transformation_sessions (id){on_delete} NOT VALID"
+    )
+    op.execute(f"ALTER TABLE transformation_scenarios VALIDATE CONSTRAINT {_CONSTRAINT}")
+
+
+def upgrade():
+    _swap_fk(" ON DELETE CASCADE")
+
+
+def downgrade():
+    _swap_fk("")
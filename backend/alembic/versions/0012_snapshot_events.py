@@ -0,0 +1,77 @@
+"""snapshot events
+
+Revision ID: 0012_snapshot_events
+Revises: 0011_cascade_session_scenarios
+Create Date: 2026-10-15 00:00:00.000000
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0012_snapshot_events"
+down_revision = "0011_cascade_session_scenarios"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        """
+        CREATE TABLE snapshot_events (
+            id uuid PRIMARY KEY,
+            session_id uuid NOT NULL REFERENCES transformation_sessions (id) ON DELETE CASCADE,
+            version integer NOT NULL,
+            snapshot jsonb,
+            created_at timestamptz NOT NULL DEFAULT now()
+        )
+        """
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX ix_snapshot_events_session_id_version ON snapshot_events (session_id, version)"
+    )
+    # Move the embedded history arrays into rows. Versions are renumbered by array
+    # position and unparseable created_at values (early intake runs) fall back to
+    # the session's own timestamp.
+    op.execute(
+        """
+        INSERT INTO snapshot_events (id, session_id, version, snapshot, created_at)
+        SELECT gen_random_uuid(), s.id, h.ord::integer, h.event -> 'snapshot',
+               CASE WHEN h.event ->> 'created_at' ~ '^\\d{4}-\\d{2}-\\d{2}T'
+                    THEN (h.event ->> 'created_at')::timestamptz
+                    ELSE s.created_at END
+        FROM transformation_sessions s,
+             jsonb_array_elements(s.snapshot -> 'history') WITH ORDINALITY AS h(event, ord)
+        WHERE jsonb_typeof(s.snapshot) = 'object'
+          AND jsonb_typeof(s.snapshot -> 'history') = 'array'
+        """
+    )
+    op.execute(
+        """
+        UPDATE transformation_sessions
+        SET snapshot = (snapshot - 'history') || jsonb_build_object('version', jsonb_array_length(snapshot -> 'history'))
+        WHERE jsonb_typeof(snapshot) = 'object'
+          AND jsonb_typeof(snapshot -> 'history') = 'array'
+        """
+    )
+
+
+def downgrade():
+    op.execute(
+        """
+        UPDATE transformation_sessions s
+        SET snapshot = s.snapshot || jsonb_build_object('history', e.history)
+        FROM (
+            SELECT session_id,
+                   jsonb_agg(
+                       jsonb_build_object('version', version, 'created_at', created_at, 'snapshot', snapshot)
+                       ORDER BY version
+                   ) AS history
+            FROM snapshot_events
+            GROUP BY session_id
+        ) e
+        WHERE e.session_id = s.id
+          AND jsonb_typeof(s.snapshot) = 'object'
+        """
+    )
+    op.execute("DROP TABLE snapshot_events")
@@ -0,0 +1,35 @@
+"""overview count indexes
+
+Revision ID: 0013_overview_count_indexes
+Revises: 0012_snapshot_events
+Create Date: 2026-10-15 00:00:00.000000
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0013_overview_count_indexes"
+down_revision = "0012_snapshot_events"
+branch_labels = None
+depends_on = None
+
+
+# Tenant-scoped COUNTs and the latest-session lookup in the admin platform overview;
+# the audit (tenant_id, created_at DESC) index it also relies on already exists.
+_INDEXES = (
+    ("ix_rules_active_tenant_id", "rules", "tenant_id", "is_active"),
+    ("ix_state_definitions_tenant_id", "state_definitions", "tenant_id", None),
+    ("ix_transformation_sessions_tenant_id_created_at", "transformation_sessions", "tenant_id, created_at DESC", None),
+)
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in _INDEXES:
+            predicate = f" WHERE {where}" if where else ""
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({columns}){predicate}")
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS " + ", ".join(name for name, _, _, _ in reversed(_INDEXES)))
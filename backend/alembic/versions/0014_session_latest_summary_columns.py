@@ -0,0 +1,49 @@
+"""session latest summary columns
+
+Revision ID: 0014_session_latest_summary_columns
+Revises: 0013_overview_count_indexes
+Create Date: 2026-10-15 00:00:00.000000
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0014_session_latest_summary_columns"
+down_revision = "0013_overview_count_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        "ALTER TABLE transformation_sessions "
+        "ADD COLUMN latest_state text, ADD COLUMN latest_total_score double precision"
+    )
+    # Same extraction record_snapshot does on write: the {"version", "latest"} envelope's
+    # "latest", or the document itself for pre-envelope rows; non-numeric scores stay NULL.
+    op.execute(
+        """
+        UPDATE transformation_sessions s
+        SET latest_state = l.doc ->> 'state',
+            latest_total_score = CASE WHEN jsonb_typeof(l.doc -> 'score_breakdown' -> 'total_score') = 'number'
+                                      THEN (l.doc -> 'score_breakdown' ->> 'total_score')::double precision END
+        FROM (
+            SELECT id, COALESCE(snapshot -> 'latest', snapshot) AS doc
+            FROM transformation_sessions
+            WHERE jsonb_typeof(snapshot) = 'object'
+        ) l
+        WHERE s.id = l.id
+          AND jsonb_typeof(l.doc) = 'object'
+        """
+    )
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_transformation_sessions_tenant_id_latest_state "
+            "ON transformation_sessions (tenant_id, latest_state)"
+        )
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_transformation_sessions_tenant_id_latest_state")
+    op.execute("ALTER TABLE transformation_sessions DROP COLUMN latest_total_score, DROP COLUMN latest_state")
@@ -5,20 +5,27 @@ appropriate backend operations (create model versions, manage rules,
 view audit logs, etc.)  Zero JSON knowledge required from the user.
 """
 
+import asyncio
 import re
-import json
+import time
 import uuid
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from types import SimpleNamespace
+from typing import Dict, Any, FrozenSet, Optional, List, Tuple
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
-from sqlalchemy import insert, select, update, delete, func
+from sqlalchemy import case, insert, or_, select, update, delete, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config_files import load_json_config, write_json_config
 from app.core.response import format_response
+from app.core.ttl_cache import TTLCache
 from app.db import models
 from app.db.session import get_session
+from app.services.active_model import invalidate_active_model_versions
 
 router = APIRouter()
 
@@ -28,20 +35,55 @@ SKILLS_PATH = Path(__file__).resolve().parents[3] / "openclaw" / "skills" / "str
 
 # ── Intent patterns ──────────────────────────────────────────────────────
 
-def _match(text: str, patterns: List[str]) -> bool:
-    t = text.lower()
-    return any(re.search(p, t) for p in patterns)
+# Checked in priority order: the first intent whose trigger appears anywhere in
+# the text wins, exactly as the old if-chain behaved.
+_INTENT_PATTERNS = (
+    ("overview", (r'overview|status|stats|statistics|platform\s+(?:info|health|summary)|dashboard|show\s+me\s+(?:everything|the\s+platform)',)),
+    ("create_model", (r'create\s+(?:a\s+)?(?:new\s+)?model', r'add\s+(?:a\s+)?(?:new\s+)?model', r'new\s+model\s+version',)),
+    ("activate_model", (r'activate\s+model', r'switch\s+(?:to\s+)?model', r'enable\s+model', r'set\s+(?:active\s+)?model',)),
+    ("list_models", (r'(?:list|show|get|view)\s+(?:all\s+)?model', r'what\s+model', r'which\s+model',)),
+    ("create_rule", (r'create\s+(?:a\s+)?(?:new\s+)?rule', r'add\s+(?:a\s+)?(?:new\s+)?rule', r'new\s+rule',)),
+    ("deactivate_rule", (r'(?:deactivate|disable|remove|delete)\s+rule',)),
+    ("list_rules", (r'(?:list|show|get|view)\s+(?:all\s+)?rule', r'what\s+rules?', r'which\s+rules?',)),
+    ("list_states", (r'(?:list|show|get|view)\s+(?:all\s+)?state', r'what\s+states?', r'which\s+states?', r'state\s+definitions?',)),
+    ("audit_logs", (r'audit', r'(?:activity|event)\s+(?:log|history|trail)', r'what\s+happened', r'recent\s+(?:activity|actions|events)', r'show\s+(?:me\s+)?(?:the\s+)?logs?',)),
+    ("list_sessions", (r'(?:list|show|get|view)\s+(?:all\s+)?session', r'what\s+sessions?', r'recent\s+sessions?',)),
+    ("delete_session", (r'(?:delete|remove)\s+session',)),
+    ("help", (r'help', r'what\s+can\s+(?:you|i)', r'commands?', r'how\s+(?:do|to)',)),
+)
+
+# One compiled regex for the whole chain: each intent is a lookahead anchored at
+# position 0 holding a named group, so `match()` tries the intents in order and
+# `lastgroup` names the winner.
+_INTENT_RE = re.compile(
+    "(?s)^(?:"
+    + "|".join(f"(?=.*?(?P<{name}>{'|'.join(patterns)}))" for name, patterns in _INTENT_PATTERNS)
+    + ")"
+)
+
+
+# A quoted string anywhere wins over "called/named/titled X", hence the two
+# anchored lookaheads rather than a plain alternation (which is leftmost-first).
+_QUOTED_RE = re.compile(
+    r'^(?:(?=[\s\S]*?["\u201c](?P<quoted>.+?)["\u201d])'
+    r'|(?=[\s\S]*?(?:called|named|titled)\s+(?P<named>.+?)(?:\s+(?:with|that|for|$))))',
+    re.IGNORECASE,
+)
+_QUOTED_KEYWORDS = ("called", "named", "titled")
 
 
 def _extract_quoted(text: str) -> Optional[str]:
     """Extract first quoted string or string after 'called/named'."""
-    m = re.search(r'["\u201c](.+?)["\u201d]', text)
-    if m:
-        return m.group(1).strip()
-    m = re.search(r'(?:called|named|titled)\s+(.+?)(?:\s+(?:with|that|for|$))', text, re.IGNORECASE)
-    if m:
-        return m.group(1).strip().rstrip(".")
-    return None
+    if '"' not in text and "\u201c" not in text:
+        lowered = text.lower()
+        if not any(k in lowered for k in _QUOTED_KEYWORDS):
+            return None
+    m = _QUOTED_RE.match(text)
+    if not m:
+        return None
+    if m.lastgroup == "quoted":
+        return m.group("quoted").strip()
+    return m.group("named").strip().rstrip(".")
 
 
 def _extract_description(text: str) -> Optional[str]:
@@ -69,60 +111,73 @@ class AdminAgentSkillsUpdate(BaseModel):
     skills: List[str] = Field(default_factory=list)
 
 
-def _load_json_config(path: Path, default: Dict[str, Any]) -> Dict[str, Any]:
-    if not path.exists():
-        return default
-    try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
-        if isinstance(payload, dict):
-            return payload
-    except Exception:
-        pass
-    return default
+def _load_board_payload() -> Dict[str, Any]:
+    return load_json_config(BOARD_PATH, {"agents": []})
 
 
-def _write_json_config(path: Path, payload: Dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+# (raw agents list, dict agents, agents by stripped id). Keyed on the raw list
+# object, so handlers must assign a new list to board["agents"] rather than
+# appending to the cached one.
+_BOARD_INDEX_CACHE: Optional[Tuple[Any, List[Dict[str, Any]], Dict[str, Dict[str, Any]]]] = None
 
 
-def _load_board_payload() -> Dict[str, Any]:
-    return _load_json_config(BOARD_PATH, {"agents": []})
+def _load_board() -> Tuple[Dict[str, Any], List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    global _BOARD_INDEX_CACHE
+    board = _load_board_payload()
+    agents_raw = board.get("agents")
+    cached = _BOARD_INDEX_CACHE
+    if cached is not None and cached[0] is agents_raw:
+        return board, cached[1], cached[2]
 
+    agents = [a for a in agents_raw if isinstance(a, dict)] if isinstance(agents_raw, list) else []
+    by_id: Dict[str, Dict[str, Any]] = {}
+    for a in agents:
+        by_id.setdefault(str(a.get("id") or "").strip(), a)
+    _BOARD_INDEX_CACHE = (agents_raw, agents, by_id)
+    return board, agents, by_id
+
+
+# (skills payload, ordered ids, id set). Keyed on the payload object itself, which
+# _load_json_config only replaces when the file's mtime changes.
+_SKILL_CATALOG_CACHE: Optional[Tuple[Dict[str, Any], Tuple[str, ...], FrozenSet[str]]] = None
+
+
+def _skill_catalog() -> Tuple[Tuple[str, ...], FrozenSet[str]]:
+    global _SKILL_CATALOG_CACHE
+    payload = load_json_config(SKILLS_PATH, {"skills": []})
+    cached = _SKILL_CATALOG_CACHE
+    if cached is not None and cached[0] is payload:
+        return cached[1], cached[2]
 
-def _extract_skill_catalog() -> List[str]:
-    payload = _load_json_config(SKILLS_PATH, {"skills": []})
     items = payload.get("skills")
-    if not isinstance(items, list):
-        return []
     skill_ids: List[str] = []
-    for item in items:
-        if isinstance(item, dict):
-            sid = item.get("id")
-            if isinstance(sid, str) and sid.strip():
-                skill_ids.append(sid.strip())
-    return skill_ids
+    if isinstance(items, list):
+        for item in items:
+            if isinstance(item, dict):
+                sid = item.get("id")
+                if isinstance(sid, str) and sid.strip():
+                    skill_ids.append(sid.strip())
+    ids = tuple(skill_ids)
+    _SKILL_CATALOG_CACHE = (payload, ids, frozenset(ids))
+    return ids, _SKILL_CATALOG_CACHE[2]
+
+
+def _extract_skill_catalog() -> List[str]:
+    return list(_skill_catalog()[0])
+
+
+def _skill_catalog_set() -> FrozenSet[str]:
+    return _skill_catalog()[1]
 
 
 def _normalize_skills(skills: List[str]) -> List[str]:
-    deduped: List[str] = []
-    seen = set()
-    for raw in skills:
-        if not isinstance(raw, str):
-            continue
-        val = raw.strip()
-        if not val or val in seen:
-            continue
-        deduped.append(val)
-        seen.add(val)
-    return deduped
+    # dict.fromkeys is an order-preserving dedup that runs in C.
+    return list(dict.fromkeys(val for val in (raw.strip() for raw in skills if isinstance(raw, str)) if val))
 
 
 @router.get("/admin/agents")
 async def list_admin_agents():
-    board = _load_board_payload()
-    agents_raw = board.get("agents")
-    agents = [a for a in agents_raw if isinstance(a, dict)] if isinstance(agents_raw, list) else []
+    _, agents, _ = _load_board()
     available_skills = _extract_skill_catalog()
 
     return format_response({
@@ -135,12 +190,10 @@ async def list_admin_agents():
 
 @router.post("/admin/agents")
 async def create_admin_agent(payload: AdminAgentCreate):
-    board = _load_board_payload()
-    agents_raw = board.get("agents")
-    agents = [a for a in agents_raw if isinstance(a, dict)] if isinstance(agents_raw, list) else []
+    board, agents, by_id = _load_board()
     agent_id = payload.id.strip()
 
-    if any(str(a.get("id") or "").strip() == agent_id for a in agents):
+    if agent_id in by_id:
         raise HTTPException(status_code=409, detail="agent_id_already_exists")
 
     next_agent = {
@@ -148,9 +201,9 @@ async def create_admin_agent(payload: AdminAgentCreate):
         "role": payload.role.strip(),
         "skills": _normalize_skills(payload.skills),
     }
-    agents.append(next_agent)
-    board["agents"] = agents
-    _write_json_config(BOARD_PATH, board)
+    board["agents"] = [*agents, next_agent]
+    # Disk I/O (including fsync) stays off the event loop.
+    await asyncio.to_thread(write_json_config, BOARD_PATH, board)
 
     return format_response({
         "action": "agent_created",
@@ -161,24 +214,18 @@ async def create_admin_agent(payload: AdminAgentCreate):
 
 @router.put("/admin/agents/{agent_id}/skills")
 async def update_admin_agent_skills(agent_id: str, payload: AdminAgentSkillsUpdate):
-    board = _load_board_payload()
-    agents_raw = board.get("agents")
-    agents = [a for a in agents_raw if isinstance(a, dict)] if isinstance(agents_raw, list) else []
+    board, agents, by_id = _load_board()
 
-    target = None
-    for a in agents:
-        if str(a.get("id") or "").strip() == agent_id.strip():
-            target = a
-            break
+    target = by_id.get(agent_id.strip())
     if target is None:
         raise HTTPException(status_code=404, detail="agent_not_found")
 
     normalized_skills = _normalize_skills(payload.skills)
     target["skills"] = normalized_skills
     board["agents"] = agents
-    _write_json_config(BOARD_PATH, board)
+    await asyncio.to_thread(write_json_config, BOARD_PATH, board)
 
-    available_skills = set(_extract_skill_catalog())
+    available_skills = _skill_catalog_set()
     unknown_skills = [s for s in normalized_skills if s not in available_skills]
 
     return format_response({
@@ -191,17 +238,14 @@ async def update_admin_agent_skills(agent_id: str, payload: AdminAgentSkillsUpda
 
 @router.delete("/admin/agents/{agent_id}")
 async def remove_admin_agent(agent_id: str):
-    board = _load_board_payload()
-    agents_raw = board.get("agents")
-    agents = [a for a in agents_raw if isinstance(a, dict)] if isinstance(agents_raw, list) else []
+    board, _, by_id = _load_board()
 
-    before = len(agents)
-    filtered = [a for a in agents if str(a.get("id") or "").strip() != agent_id.strip()]
-    if len(filtered) == before:
+    remaining = dict(by_id)
+    if remaining.pop(agent_id.strip(), None) is None:
         raise HTTPException(status_code=404, detail="agent_not_found")
 
-    board["agents"] = filtered
-    _write_json_config(BOARD_PATH, board)
+    board["agents"] = list(remaining.values())
+    await asyncio.to_thread(write_json_config, BOARD_PATH, board)
 
     return format_response({
         "action": "agent_removed",
@@ -210,6 +254,24 @@ async def remove_admin_agent(agent_id: str):
     })
 
 
+# (monotonic timestamp, tenant id) for commands sent without a tenant. Only a found
+# tenant is cached, so the first tenant created after an empty lookup is seen at once.
+_DEFAULT_TENANT_TTL_SECONDS = 60.0
+_DEFAULT_TENANT_CACHE: Tuple[float, Optional[uuid.UUID]] = (0.0, None)
+
+
+async def _default_tenant_id(db: AsyncSession) -> Optional[uuid.UUID]:
+    global _DEFAULT_TENANT_CACHE
+    cached_at, tenant_id = _DEFAULT_TENANT_CACHE
+    if tenant_id is not None and time.monotonic() - cached_at < _DEFAULT_TENANT_TTL_SECONDS:
+        return tenant_id
+    res = await db.execute(select(models.Tenant.id).limit(1))
+    tenant_id = res.scalars().first()
+    if tenant_id is not None:
+        _DEFAULT_TENANT_CACHE = (time.monotonic(), tenant_id)
+    return tenant_id
+
+
 @router.post("/admin/command")
 async def admin_command(payload: AdminCommand, db: AsyncSession = Depends(get_session)):
     """Interpret a natural language admin command and execute it."""
@@ -226,435 +288,521 @@ async def admin_command(payload: AdminCommand, db: AsyncSession = Depends(get_se
 
     if not tenant_uuid:
         # Try to find any tenant
-        res = await db.execute(select(models.Tenant).limit(1))
-        t = res.scalars().first()
-        if t:
-            tenant_uuid = t.id
-        else:
+        tenant_uuid = await _default_tenant_id(db)
+        if not tenant_uuid:
             raise HTTPException(status_code=400, detail="no_tenant_found")
 
-    # ────────────── PLATFORM OVERVIEW ──────────────
-    if _match(text, [r'overview|status|stats|statistics|platform\s+(?:info|health|summary)|dashboard|show\s+me\s+(?:everything|the\s+platform)']):
-        return await _platform_overview(db, tenant_uuid)
+    m = _INTENT_RE.match(text_lower)
+    if m:
+        return await _INTENT_HANDLERS[m.lastgroup](db, tenant_uuid, text, text_lower)
+
+    # ────────────── FALLBACK ──────────────
+    return format_response({
+        "action": "unrecognized",
+        "message": f'I didn\'t understand that command. Try things like:\n• "Show platform overview"\n• "Create a new model version called Q1 Strategy"\n• "Show all rules"\n• "Show audit logs"\n• Type "help" for full command list.',
+    })
+
+
+# ── Intent handlers ──────────────────────────────────────────────────────
+
+# ────────────── PLATFORM OVERVIEW ──────────────
 
-    # ────────────── MODEL VERSION CREATION ──────────────
-    if _match(text, [r'create\s+(?:a\s+)?(?:new\s+)?model', r'add\s+(?:a\s+)?(?:new\s+)?model', r'new\s+model\s+version']):
-        name = _extract_quoted(text)
+async def _handle_overview(db: AsyncSession, tenant_uuid: uuid.UUID, text: str, text_lower: str) -> dict:
+    return await _platform_overview(db, tenant_uuid)
+
+
+# ────────────── MODEL VERSION CREATION ──────────────
+
+async def _handle_create_model(db: AsyncSession, tenant_uuid: uuid.UUID, text: str, text_lower: str) -> dict:
+    name = _extract_quoted(text)
+    if not name:
+        # Try to grab everything after "called/named" or after "model version"
+        m = re.search(r'model\s*(?:version)?\s+(.+)', text_lower)
+        if m:
+            name = m.group(1).strip().rstrip(".")
+            # Remove filler words
+            name = re.sub(r'^(?:called|named|titled)\s+', '', name, flags=re.IGNORECASE)
         if not name:
-            # Try to grab everything after "called/named" or after "model version"
-            m = re.search(r'model\s*(?:version)?\s+(.+)', text_lower)
-            if m:
-                name = m.group(1).strip().rstrip(".")
-                # Remove filler words
-                name = re.sub(r'^(?:called|named|titled)\s+', '', name, flags=re.IGNORECASE)
-            if not name:
-                name = "New Model Version"
-        description = _extract_description(text)
-
-        stmt = (
-            insert(models.ModelVersion)
-            .values(
-                tenant_id=tenant_uuid,
-                name=name,
-                description=description or f"Created via admin command: {text[:100]}",
-                is_active=False,
-            )
-            .returning(models.ModelVersion.id)
+            name = "New Model Version"
+    description = _extract_description(text)
+
+    stmt = (
+        insert(models.ModelVersion)
+        .values(
+            tenant_id=tenant_uuid,
+            name=name,
+            description=description or f"Created via admin command: {text[:100]}",
+            is_active=False,
         )
-        res = await db.execute(stmt)
-        mv_id = res.scalar()
-        await db.commit()
+        .returning(models.ModelVersion.id)
+    )
+    res = await db.execute(stmt)
+    mv_id = res.scalar()
+    await db.commit()
+    _invalidate_overview(tenant_uuid)
 
-        return format_response({
-            "action": "model_version_created",
-            "message": f'Model version "{name}" has been created successfully. Use "activate model {name}" to make it the active version.',
-            "model_version_id": str(mv_id),
-            "name": name,
-        })
+    return format_response({
+        "action": "model_version_created",
+        "message": f'Model version "{name}" has been created successfully. Use "activate model {name}" to make it the active version.',
+        "model_version_id": str(mv_id),
+        "name": name,
+    })
 
-    # ────────────── ACTIVATE MODEL VERSION ──────────────
-    if _match(text, [r'activate\s+model', r'switch\s+(?:to\s+)?model', r'enable\s+model', r'set\s+(?:active\s+)?model']):
-        target_name = _extract_quoted(text)
-        if not target_name:
-            m = re.search(r'(?:activate|switch\s+to|enable|set\s+active)\s+(?:model\s*(?:version)?\s*)?(.+)', text_lower)
-            if m:
-                target_name = m.group(1).strip().rstrip(".")
-        if not target_name:
-            return format_response({"action": "error", "message": "Please specify which model version to activate. Example: 'Activate model version Q1 Strategy'"})
-
-        # Find by name (fuzzy)
-        q = select(models.ModelVersion).where(models.ModelVersion.tenant_id == tenant_uuid)
-        res = await db.execute(q)
-        versions = res.scalars().all()
-        match = None
-        for v in versions:
-            if target_name.lower() in (v.name or "").lower():
-                match = v
-                break
-        if not match:
-            names = [v.name for v in versions]
-            return format_response({"action": "error", "message": f'Could not find model version matching "{target_name}". Available: {", ".join(names) or "none"}'})
-
-        # Deactivate all, activate match
-        await db.execute(update(models.ModelVersion).where(models.ModelVersion.tenant_id == tenant_uuid).values(is_active=False))
-        await db.execute(update(models.ModelVersion).where(models.ModelVersion.id == match.id).values(is_active=True))
-        await db.commit()
 
-        return format_response({
-            "action": "model_version_activated",
-            "message": f'Model version "{match.name}" is now the active version.',
-            "model_version_id": str(match.id),
-        })
+# ────────────── ACTIVATE MODEL VERSION ──────────────
 
-    # ────────────── LIST MODEL VERSIONS ──────────────
-    if _match(text, [r'(?:list|show|get|view)\s+(?:all\s+)?model', r'what\s+model', r'which\s+model']):
-        q = select(models.ModelVersion).where(models.ModelVersion.tenant_id == tenant_uuid)
-        res = await db.execute(q)
-        versions = res.scalars().all()
-
-        # Fallback: when sessions exist but model versions belong to another seeded tenant,
-        # surface those linked model versions so admin users can still inspect the effective config.
-        if not versions:
-            sess_q = (
-                select(models.TransformationSession.model_version_id)
-                .where(models.TransformationSession.tenant_id == tenant_uuid)
-                .order_by(models.TransformationSession.created_at.desc())
-                .limit(20)
-            )
-            sess_res = await db.execute(sess_q)
-            mv_ids = [row[0] for row in sess_res.all() if row and row[0]]
-            if mv_ids:
-                fallback_q = select(models.ModelVersion).where(models.ModelVersion.id.in_(mv_ids))
-                fallback_res = await db.execute(fallback_q)
-                versions = fallback_res.scalars().all()
-
-        items = [{
-            "id": str(v.id),
-            "name": v.name,
-            "description": v.description,
-            "is_active": bool(v.is_active),
-            "created_at": v.created_at.isoformat() if v.created_at else None,
-        } for v in versions]
-        return format_response({
-            "action": "list_model_versions",
-            "message": f"Found {len(items)} model version(s).",
-            "model_versions": items,
-        })
+async def _handle_activate_model(db: AsyncSession, tenant_uuid: uuid.UUID, text: str, text_lower: str) -> dict:
+    target_name = _extract_quoted(text)
+    if not target_name:
+        m = re.search(r'(?:activate|switch\s+to|enable|set\s+active)\s+(?:model\s*(?:version)?\s*)?(.+)', text_lower)
+        if m:
+            target_name = m.group(1).strip().rstrip(".")
+    if not target_name:
+        return format_response({"action": "error", "message": "Please specify which model version to activate. Example: 'Activate model version Q1 Strategy'"})
+
+    # Find by name (fuzzy): case-insensitive substring match done in SQL
+    q = (
+        select(models.ModelVersion.id, models.ModelVersion.name)
+        .where(
+            models.ModelVersion.tenant_id == tenant_uuid,
+            models.ModelVersion.name.icontains(target_name, autoescape=True),
+        )
+        .limit(1)
+    )
+    match = (await db.execute(q)).first()
+    if not match:
+        res = await db.execute(select(models.ModelVersion.name).where(models.ModelVersion.tenant_id == tenant_uuid))
+        names = list(res.scalars().all())
+        return format_response({"action": "error", "message": f'Could not find model version matching "{target_name}". Available: {", ".join(names) or "none"}'})
+
+    # Activate match and deactivate the rest in one statement, touching only rows that change
+    await db.execute(
+        update(models.ModelVersion)
+        .where(
+            models.ModelVersion.tenant_id == tenant_uuid,
+            or_(models.ModelVersion.id == match.id, models.ModelVersion.is_active.is_(True)),
+        )
+        .values(is_active=case((models.ModelVersion.id == match.id, True), else_=False))
+    )
+    await db.commit()
+    _invalidate_overview(tenant_uuid)
+    invalidate_active_model_versions()
 
-    # ────────────── CREATE RULE ──────────────
-    if _match(text, [r'create\s+(?:a\s+)?(?:new\s+)?rule', r'add\s+(?:a\s+)?(?:new\s+)?rule', r'new\s+rule']):
-        name = _extract_quoted(text)
-        description = _extract_description(text)
+    return format_response({
+        "action": "model_version_activated",
+        "message": f'Model version "{match.name}" is now the active version.',
+        "model_version_id": str(match.id),
+    })
 
+
+# ────────────── LIST MODEL VERSIONS ──────────────
+
+async def _handle_list_models(db: AsyncSession, tenant_uuid: uuid.UUID, text: str, text_lower: str) -> dict:
+    q = select(models.ModelVersion).where(models.ModelVersion.tenant_id == tenant_uuid)
+    res = await db.execute(q)
+    versions = res.scalars().all()
+
+    # Fallback: when sessions exist but model versions belong to another seeded tenant,
+    # surface those linked model versions so admin users can still inspect the effective config.
+    if not versions:
+        sess_q = (
+            select(models.TransformationSession.model_version_id)
+            .where(models.TransformationSession.tenant_id == tenant_uuid)
+            .order_by(models.TransformationSession.created_at.desc())
+            .limit(20)
+        )
+        sess_res = await db.execute(sess_q)
+        mv_ids = [row[0] for row in sess_res.all() if row and row[0]]
+        if mv_ids:
+            fallback_q = select(models.ModelVersion).where(models.ModelVersion.id.in_(mv_ids))
+            fallback_res = await db.execute(fallback_q)
+            versions = fallback_res.scalars().all()
+
+    items = [{
+        "id": str(v.id),
+        "name": v.name,
+        "description": v.description,
+        "is_active": bool(v.is_active),
+        "created_at": v.created_at.isoformat() if v.created_at else None,
+    } for v in versions]
+    return format_response({
+        "action": "list_model_versions",
+        "message": f"Found {len(items)} model version(s).",
+        "model_versions": items,
+    })
+
+
+# ────────────── CREATE RULE ──────────────
+
+# Name up to the first clause keyword, or to the end when there is none.
+_RULE_NAME_RE = re.compile(r'rule\s*(?:called|named|titled|:)?\s+(.+?)(?:\s+(?:that|which|with|for|when)|$)', re.IGNORECASE)
+_RULE_CONDITION_RE = re.compile(r'(?:when|if|where|condition[:\s]+)\s+(.+?)(?:\s+then|\s+set|\s+apply|$)', re.IGNORECASE)
+_RULE_IMPACT_RE = re.compile(r'(?:then|set|apply|impact[:\s]+)\s+(.+?)$', re.IGNORECASE)
+
+
+async def _handle_create_rule(db: AsyncSession, tenant_uuid: uuid.UUID, text: str, text_lower: str) -> dict:
+    name = _extract_quoted(text)
+    description = _extract_description(text)
+
+    if not name:
+        # Attempt to extract from "rule called X" or "rule: X"
+        m = _RULE_NAME_RE.search(text)
+        if m:
+            name = m.group(1).strip().strip('"').rstrip(".")
         if not name:
-            # Attempt to extract from "rule called X" or "rule: X"
-            m = re.search(r'rule\s*(?:called|named|titled|:)?\s+(.+?)(?:\s+(?:that|which|with|for|when))', text, re.IGNORECASE)
-            if m:
-                name = m.group(1).strip().strip('"').rstrip(".")
-            else:
-                m = re.search(r'rule\s*(?:called|named|titled|:)?\s+(.+)', text, re.IGNORECASE)
-                if m:
-                    name = m.group(1).strip().strip('"').rstrip(".")
-            if not name:
-                name = "New Rule"
-
-        # Find active model version
-        q = select(models.ModelVersion).where(
-            models.ModelVersion.tenant_id == tenant_uuid,
-            models.ModelVersion.is_active == True
-        ).limit(1)
-        res = await db.execute(q)
-        mv = res.scalars().first()
-        if not mv:
-            return format_response({"action": "error", "message": "No active model version found. Create and activate one first."})
-
-        stmt = (
-            insert(models.Rule)
-            .values(
+            name = "New Rule"
+
+    # Find active model version
+    q = select(models.ModelVersion).where(
+        models.ModelVersion.tenant_id == tenant_uuid,
+        models.ModelVersion.is_active
+    ).limit(1)
+    res = await db.execute(q)
+    mv = res.scalars().first()
+    if not mv:
+        return format_response({"action": "error", "message": "No active model version found. Create and activate one first."})
+
+    stmt = (
+        insert(models.Rule)
+        .values(
+            tenant_id=tenant_uuid,
+            model_version_id=mv.id,
+            name=name,
+            description=description or text[:200],
+            is_active=True,
+        )
+        .returning(models.Rule.id)
+    )
+    res = await db.execute(stmt)
+    rule_id = res.scalar()
+
+    # Try to extract condition from "when X" or "if X" or "where X"
+    cond_match = _RULE_CONDITION_RE.search(text)
+    condition_text = None
+    if cond_match:
+        condition_text = cond_match.group(1).strip().rstrip(".")
+        # Convert NL condition to expression
+        expression = _nl_to_condition(condition_text)
+        await db.execute(
+            insert(models.RuleCondition).values(
                 tenant_id=tenant_uuid,
-                model_version_id=mv.id,
-                name=name,
-                description=description or text[:200],
+                rule_id=rule_id,
+                expression=expression,
                 is_active=True,
             )
-            .returning(models.Rule.id)
         )
-        res = await db.execute(stmt)
-        rule_id = res.scalar()
-
-        # Try to extract condition from "when X" or "if X" or "where X"
-        cond_match = re.search(r'(?:when|if|where|condition[:\s]+)\s+(.+?)(?:\s+then|\s+set|\s+apply|$)', text, re.IGNORECASE)
-        condition_text = None
-        if cond_match:
-            condition_text = cond_match.group(1).strip().rstrip(".")
-            # Convert NL condition to expression
-            expression = _nl_to_condition(condition_text)
-            await db.execute(
-                insert(models.RuleCondition).values(
-                    tenant_id=tenant_uuid,
-                    rule_id=rule_id,
-                    expression=expression,
-                    is_active=True,
-                )
-            )
 
-        # Try to extract impact from "then X" or "set X" or "apply X"
-        impact_match = re.search(r'(?:then|set|apply|impact[:\s]+)\s+(.+?)$', text, re.IGNORECASE)
-        impact_text = None
-        if impact_match:
-            impact_text = impact_match.group(1).strip().rstrip(".")
-            impact_expr = _nl_to_impact(impact_text)
-            await db.execute(
-                insert(models.RuleImpact).values(
-                    tenant_id=tenant_uuid,
-                    rule_id=rule_id,
-                    impact=impact_expr,
-                    is_active=True,
-                )
+    # Try to extract impact from "then X" or "set X" or "apply X"
+    impact_match = _RULE_IMPACT_RE.search(text)
+    impact_text = None
+    if impact_match:
+        impact_text = impact_match.group(1).strip().rstrip(".")
+        impact_expr = _nl_to_impact(impact_text)
+        await db.execute(
+            insert(models.RuleImpact).values(
+                tenant_id=tenant_uuid,
+                rule_id=rule_id,
+                impact=impact_expr,
+                is_active=True,
             )
+        )
 
-        await db.commit()
+    await db.commit()
+    _invalidate_overview(tenant_uuid)
 
-        result_msg = f'Rule "{name}" created successfully'
-        if condition_text:
-            result_msg += f' with condition: {condition_text}'
-        if impact_text:
-            result_msg += f' and impact: {impact_text}'
+    result_msg = f'Rule "{name}" created successfully'
+    if condition_text:
+        result_msg += f' with condition: {condition_text}'
+    if impact_text:
+        result_msg += f' and impact: {impact_text}'
 
-        return format_response({
-            "action": "rule_created",
-            "message": result_msg + ".",
-            "rule_id": str(rule_id),
-            "name": name,
-            "condition": condition_text,
-            "impact": impact_text,
-        })
+    return format_response({
+        "action": "rule_created",
+        "message": result_msg + ".",
+        "rule_id": str(rule_id),
+        "name": name,
+        "condition": condition_text,
+        "impact": impact_text,
+    })
 
-    # ────────────── DEACTIVATE / DELETE RULE ──────────────
-    if _match(text, [r'(?:deactivate|disable|remove|delete)\s+rule']):
-        target_name = _extract_quoted(text)
-        if not target_name:
-            m = re.search(r'(?:deactivate|disable|remove|delete)\s+rule\s+(.+)', text, re.IGNORECASE)
-            if m:
-                target_name = m.group(1).strip().rstrip(".")
-
-        if not target_name:
-            return format_response({"action": "error", "message": 'Please specify which rule to deactivate. Example: \'Deactivate rule "High Debt Alert"\''})
-
-        q = select(models.Rule).where(models.Rule.tenant_id == tenant_uuid, models.Rule.is_active == True)
-        res = await db.execute(q)
-        rules = res.scalars().all()
-        match = None
-        for r in rules:
-            if target_name.lower() in (r.name or "").lower():
-                match = r
-                break
-        if not match:
-            names = [r.name for r in rules]
-            return format_response({"action": "error", "message": f'Could not find active rule matching "{target_name}". Active rules: {", ".join(names) or "none"}'})
-
-        await db.execute(update(models.Rule).where(models.Rule.id == match.id).values(is_active=False))
-        await db.commit()
-        return format_response({
-            "action": "rule_deactivated",
-            "message": f'Rule "{match.name}" has been deactivated.',
-            "rule_id": str(match.id),
-        })
 
-    # ────────────── LIST RULES ──────────────
-    if _match(text, [r'(?:list|show|get|view)\s+(?:all\s+)?rule', r'what\s+rules?', r'which\s+rules?']):
-        q = (
-            select(models.Rule)
-            .where(models.Rule.tenant_id == tenant_uuid)
-            .order_by(models.Rule.created_at.desc())
-        )
-        res = await db.execute(q)
-        rules = res.scalars().all()
-        items = []
-        for r in rules:
-            # Get conditions
-            cq = select(models.RuleCondition).where(models.RuleCondition.rule_id == r.id)
-            cres = await db.execute(cq)
-            conditions = [{"id": str(c.id), "expression": c.expression, "is_active": bool(c.is_active)} for c in cres.scalars().all()]
-
-            # Get impacts
-            iq = select(models.RuleImpact).where(models.RuleImpact.rule_id == r.id)
-            ires = await db.execute(iq)
-            impacts = [{"id": str(im.id), "impact": im.impact, "is_active": bool(im.is_active)} for im in ires.scalars().all()]
-
-            items.append({
-                "id": str(r.id),
-                "name": r.name,
-                "description": r.description,
-                "is_active": bool(r.is_active),
-                "conditions": conditions,
-                "impacts": impacts,
-            })
+# ────────────── DEACTIVATE / DELETE RULE ──────────────
 
-        return format_response({
-            "action": "list_rules",
-            "message": f"Found {len(items)} rule(s).",
-            "rules": items,
-        })
+async def _handle_deactivate_rule(db: AsyncSession, tenant_uuid: uuid.UUID, text: str, text_lower: str) -> dict:
+    target_name = _extract_quoted(text)
+    if not target_name:
+        m = re.search(r'(?:deactivate|disable|remove|delete)\s+rule\s+(.+)', text, re.IGNORECASE)
+        if m:
+            target_name = m.group(1).strip().rstrip(".")
 
-    # ────────────── LIST / SHOW STATES ──────────────
-    if _match(text, [r'(?:list|show|get|view)\s+(?:all\s+)?state', r'what\s+states?', r'which\s+states?', r'state\s+definitions?']):
-        q = select(models.StateDefinition).where(models.StateDefinition.tenant_id == tenant_uuid)
-        res = await db.execute(q)
-        states = res.scalars().all()
-        items = []
-        for s in states:
-            tq = select(models.StateThreshold).where(models.StateThreshold.state_definition_id == s.id)
-            tres = await db.execute(tq)
-            thresholds = [{"id": str(t.id), "threshold": t.threshold} for t in tres.scalars().all()]
-            items.append({
-                "id": str(s.id),
-                "name": s.name,
-                "description": s.description,
-                "thresholds": thresholds,
-            })
+    if not target_name:
+        return format_response({"action": "error", "message": 'Please specify which rule to deactivate. Example: \'Deactivate rule "High Debt Alert"\''})
 
-        return format_response({
-            "action": "list_states",
-            "message": f"Found {len(items)} state definition(s).",
-            "states": items,
-        })
+    active_rules = (models.Rule.tenant_id == tenant_uuid, models.Rule.is_active)
+    q = (
+        select(models.Rule.id, models.Rule.name)
+        .where(*active_rules, models.Rule.name.icontains(target_name, autoescape=True))
+        .limit(1)
+    )
+    match = (await db.execute(q)).first()
+    if not match:
+        # Only a hint for the error message, so cap it.
+        res = await db.execute(select(models.Rule.name).where(*active_rules).limit(20))
+        names = list(res.scalars().all())
+        return format_response({"action": "error", "message": f'Could not find active rule matching "{target_name}". Active rules: {", ".join(names) or "none"}'})
+
+    await db.execute(update(models.Rule).where(models.Rule.id == match.id).values(is_active=False))
+    await db.commit()
+    _invalidate_overview(tenant_uuid)
+    return format_response({
+        "action": "rule_deactivated",
+        "message": f'Rule "{match.name}" has been deactivated.',
+        "rule_id": str(match.id),
+    })
 
-    # ────────────── AUDIT LOGS ──────────────
-    if _match(text, [r'audit', r'(?:activity|event)\s+(?:log|history|trail)', r'what\s+happened', r'recent\s+(?:activity|actions|events)', r'show\s+(?:me\s+)?(?:the\s+)?logs?']):
-        q = (
-            select(models.AuditLog)
-            .where(models.AuditLog.tenant_id == tenant_uuid)
-            .order_by(models.AuditLog.created_at.desc())
-            .limit(30)
-        )
-        res = await db.execute(q)
-        logs = res.scalars().all()
-        items = []
-        for log in logs:
-            parsed = None
-            if log.payload:
-                try:
-                    parsed = json.loads(log.payload)
-                except Exception:
-                    parsed = {"raw": log.payload}
-            items.append({
-                "id": str(log.id),
-                "actor": log.actor,
-                "action": log.action,
-                "payload": parsed,
-                "created_at": log.created_at.isoformat() if log.created_at else None,
-            })
 
-        return format_response({
-            "action": "list_audit_logs",
-            "message": f"Showing {len(items)} recent audit events.",
-            "audit_logs": items,
+# ────────────── LIST RULES ──────────────
+
+async def _handle_list_rules(db: AsyncSession, tenant_uuid: uuid.UUID, text: str, text_lower: str) -> dict:
+    q = (
+        select(models.Rule)
+        .where(models.Rule.tenant_id == tenant_uuid)
+        .order_by(models.Rule.created_at.desc())
+    )
+    res = await db.execute(q)
+    rules = res.scalars().all()
+
+    # Two bulk queries for every rule's conditions and impacts instead of two per rule.
+    conditions_by_rule: Dict[uuid.UUID, List[dict]] = defaultdict(list)
+    impacts_by_rule: Dict[uuid.UUID, List[dict]] = defaultdict(list)
+    rule_ids = [r.id for r in rules]
+    if rule_ids:
+        cres = await db.execute(select(models.RuleCondition).where(models.RuleCondition.rule_id.in_(rule_ids)))
+        for c in cres.scalars().all():
+            conditions_by_rule[c.rule_id].append({"id": str(c.id), "expression": c.expression, "is_active": bool(c.is_active)})
+
+        ires = await db.execute(select(models.RuleImpact).where(models.RuleImpact.rule_id.in_(rule_ids)))
+        for im in ires.scalars().all():
+            impacts_by_rule[im.rule_id].append({"id": str(im.id), "impact": im.impact, "is_active": bool(im.is_active)})
+
+    items = []
+    for r in rules:
+        items.append({
+            "id": str(r.id),
+            "name": r.name,
+            "description": r.description,
+            "is_active": bool(r.is_active),
+            "conditions": conditions_by_rule.get(r.id, []),
+            "impacts": impacts_by_rule.get(r.id, []),
         })
 
-    # ────────────── SESSIONS LIST ──────────────
-    if _match(text, [r'(?:list|show|get|view)\s+(?:all\s+)?session', r'what\s+sessions?', r'recent\s+sessions?']):
-        q = (
-            select(models.TransformationSession)
-            .where(models.TransformationSession.tenant_id == tenant_uuid)
-            .order_by(models.TransformationSession.created_at.desc())
-            .limit(20)
+    return format_response({
+        "action": "list_rules",
+        "message": f"Found {len(items)} rule(s).",
+        "rules": items,
+    })
+
+
+# ────────────── LIST / SHOW STATES ──────────────
+
+async def _handle_list_states(db: AsyncSession, tenant_uuid: uuid.UUID, text: str, text_lower: str) -> dict:
+    q = select(models.StateDefinition).where(models.StateDefinition.tenant_id == tenant_uuid)
+    res = await db.execute(q)
+    states = res.scalars().all()
+
+    thresholds_by_state: Dict[uuid.UUID, List[dict]] = defaultdict(list)
+    state_ids = [s.id for s in states]
+    if state_ids:
+        tres = await db.execute(
+            select(models.StateThreshold).where(models.StateThreshold.state_definition_id.in_(state_ids))
         )
-        res = await db.execute(q)
-        sessions = res.scalars().all()
-        items = [{
+        for t in tres.scalars().all():
+            thresholds_by_state[t.state_definition_id].append({"id": str(t.id), "threshold": t.threshold})
+
+    items = []
+    for s in states:
+        items.append({
             "id": str(s.id),
             "name": s.name,
-            "created_at": s.created_at.isoformat() if s.created_at else None,
-            "has_snapshot": bool(s.snapshot),
-        } for s in sessions]
-
-        return format_response({
-            "action": "list_sessions",
-            "message": f"Found {len(items)} session(s).",
-            "sessions": items,
+            "description": s.description,
+            "thresholds": thresholds_by_state.get(s.id, []),
         })
 
-    # ────────────── DELETE SESSION ──────────────
-    if _match(text, [r'(?:delete|remove)\s+session']):
-        sid_match = re.search(r'([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})', text_lower)
-        if not sid_match:
-            return format_response({
-                "action": "error",
-                "message": 'Please specify a session UUID. Example: delete session 123e4567-e89b-12d3-a456-426614174000',
-            })
-        try:
-            sid = uuid.UUID(sid_match.group(1))
-        except Exception:
-            return format_response({"action": "error", "message": "Invalid session UUID format."})
+    return format_response({
+        "action": "list_states",
+        "message": f"Found {len(items)} state definition(s).",
+        "states": items,
+    })
 
-        session_obj = await db.get(models.TransformationSession, sid)
-        if session_obj is None:
-            return format_response({"action": "error", "message": "Session not found."})
-        if session_obj.tenant_id != tenant_uuid:
-            return format_response({"action": "error", "message": "Session does not belong to this tenant."})
 
-        await db.execute(delete(models.TransformationScenario).where(models.TransformationScenario.session_id == sid))
-        await db.execute(delete(models.TransformationSession).where(models.TransformationSession.id == sid))
-        await db.commit()
+# ────────────── AUDIT LOGS ──────────────
+
+def _safe_parse_payload(payload: Any) -> Any:
+    """Decode a stored audit payload; text that is not a JSON document comes back as {"raw": ...}."""
+    if not payload:
+        return None
+    if not isinstance(payload, (str, bytes)):
+        return payload  # JSONB column already decoded it
+    # Audit payloads are JSON objects, so anything not opening like one skips the decoder.
+    if payload.lstrip()[:1] not in ("{", "[", '"', b"{", b"[", b'"'):
+        return {"raw": payload}
+    try:
+        return orjson.loads(payload)
+    except orjson.JSONDecodeError:
+        return {"raw": payload}
 
-        return format_response({
-            "action": "session_deleted",
-            "message": f"Session {sid} has been deleted.",
-            "session_id": str(sid),
-        })
 
-    # ────────────── HELP ──────────────
-    if _match(text, [r'help', r'what\s+can\s+(?:you|i)', r'commands?', r'how\s+(?:do|to)']):
+async def _handle_audit_logs(db: AsyncSession, tenant_uuid: uuid.UUID, text: str, text_lower: str) -> dict:
+    q = (
+        select(models.AuditLog)
+        .where(models.AuditLog.tenant_id == tenant_uuid)
+        .order_by(models.AuditLog.created_at.desc())
+        .limit(30)
+    )
+    res = await db.execute(q)
+    logs = res.scalars().all()
+    items = [
+        {
+            "id": str(log.id),
+            "actor": log.actor,
+            "action": log.action,
+            "payload": _safe_parse_payload(log.payload),
+            "created_at": log.created_at.isoformat() if log.created_at else None,
+        }
+        for log in logs
+    ]
+
+    return format_response({
+        "action": "list_audit_logs",
+        "message": f"Showing {len(items)} recent audit events.",
+        "audit_logs": items,
+    })
+
+
+# ────────────── SESSIONS LIST ──────────────
+
+async def _handle_list_sessions(db: AsyncSession, tenant_uuid: uuid.UUID, text: str, text_lower: str) -> dict:
+    q = (
+        select(
+            models.TransformationSession.id,
+            models.TransformationSession.name,
+            models.TransformationSession.created_at,
+            models.TransformationSession.snapshot.isnot(None).label("has_snapshot"),
+        )
+        .where(models.TransformationSession.tenant_id == tenant_uuid)
+        .order_by(models.TransformationSession.created_at.desc())
+        .limit(20)
+    )
+    res = await db.execute(q)
+    items = [{
+        "id": str(s.id),
+        "name": s.name,
+        "created_at": s.created_at.isoformat() if s.created_at else None,
+        "has_snapshot": bool(s.has_snapshot),
+    } for s in res.all()]
+
+    return format_response({
+        "action": "list_sessions",
+        "message": f"Found {len(items)} session(s).",
+        "sessions": items,
+    })
+
+
+# ────────────── DELETE SESSION ──────────────
+
+async def _handle_delete_session(db: AsyncSession, tenant_uuid: uuid.UUID, text: str, text_lower: str) -> dict:
+    sid_match = re.search(r'([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})', text_lower)
+    if not sid_match:
         return format_response({
-            "action": "help",
-            "message": "Here's what you can do from the Admin Command Center:",
-            "commands": [
-                {"category": "Model Versions", "examples": [
-                    'Create a new model version called "Q1 2026 Strategy"',
-                    "Show all model versions",
-                    'Activate model version "Q1 2026 Strategy"',
-                ]},
-                {"category": "Rules", "examples": [
-                    'Create a rule called "High Debt Warning" when technical_debt > 80 then set state_impact +15',
-                    "Show all rules",
-                    'Deactivate rule "High Debt Warning"',
-                ]},
-                {"category": "States & Thresholds", "examples": [
-                    "Show state definitions",
-                ]},
-                {"category": "Monitoring", "examples": [
-                    "Show platform overview",
-                    "Show recent activity",
-                    "Show audit logs",
-                    "Show all sessions",
-                    "Delete session <session-uuid>",
-                ]},
-            ],
+            "action": "error",
+            "message": 'Please specify a session UUID. Example: delete session 123e4567-e89b-12d3-a456-426614174000',
         })
+    try:
+        sid = uuid.UUID(sid_match.group(1))
+    except Exception:
+        return format_response({"action": "error", "message": "Invalid session UUID format."})
+
+    session_obj = await db.get(models.TransformationSession, sid)
+    if session_obj is None:
+        return format_response({"action": "error", "message": "Session not found."})
+    if session_obj.tenant_id != tenant_uuid:
+        return format_response({"action": "error", "message": "Session does not belong to this tenant."})
+
+    # Scenarios go with the session via ON DELETE CASCADE.
+    await db.execute(delete(models.TransformationSession).where(models.TransformationSession.id == sid))
+    await db.commit()
+    _invalidate_overview(tenant_uuid)
 
-    # ────────────── FALLBACK ──────────────
     return format_response({
-        "action": "unrecognized",
-        "message": f'I didn\'t understand that command. Try things like:\n• "Show platform overview"\n• "Create a new model version called Q1 Strategy"\n• "Show all rules"\n• "Show audit logs"\n• Type "help" for full command list.',
+        "action": "session_deleted",
+        "message": f"Session {sid} has been deleted.",
+        "session_id": str(sid),
+    })
+
+
+# ────────────── HELP ──────────────
+
+async def _handle_help(db: AsyncSession, tenant_uuid: uuid.UUID, text: str, text_lower: str) -> dict:
+    return format_response({
+        "action": "help",
+        "message": "Here's what you can do from the Admin Command Center:",
+        "commands": [
+            {"category": "Model Versions", "examples": [
+                'Create a new model version called "Q1 2026 Strategy"',
+                "Show all model versions",
+                'Activate model version "Q1 2026 Strategy"',
+            ]},
+            {"category": "Rules", "examples": [
+                'Create a rule called "High Debt Warning" when technical_debt > 80 then set state_impact +15',
+                "Show all rules",
+                'Deactivate rule "High Debt Warning"',
+            ]},
+            {"category": "States & Thresholds", "examples": [
+                "Show state definitions",
+            ]},
+            {"category": "Monitoring", "examples": [
+                "Show platform overview",
+                "Show recent activity",
+                "Show audit logs",
+                "Show all sessions",
+                "Delete session <session-uuid>",
+            ]},
+        ],
     })
 
 
+_INTENT_HANDLERS = {
+    "overview": _handle_overview,
+    "create_model": _handle_create_model,
+    "activate_model": _handle_activate_model,
+    "list_models": _handle_list_models,
+    "create_rule": _handle_create_rule,
+    "deactivate_rule": _handle_deactivate_rule,
+    "list_rules": _handle_list_rules,
+    "list_states": _handle_list_states,
+    "audit_logs": _handle_audit_logs,
+    "list_sessions": _handle_list_sessions,
+    "delete_session": _handle_delete_session,
+    "help": _handle_help,
+}
+
+
 # ── Helper: NL condition to expression ───────────────────────────────────
 
+# One pass over the text; the named group that matched is the canonical metric.
+_METRIC_ALIAS_RE = re.compile(
+    r"\b(?:"
+    r"(?P<cost>operating\s+costs?|costs?)"
+    r"|(?P<revenue>revenues?)"
+    r"|(?P<technical_debt>tech(?:nical)?\s+debt|debt)"
+    r"|(?P<margin>profit\s*margin)"
+    r")\b",
+    re.IGNORECASE,
+)
+
+
 def _normalize_metric_aliases(text: str) -> str:
-    aliases = {
-        r"\boperating\s+costs?\b": "cost",
-        r"\bcosts?\b": "cost",
-        r"\brevenues?\b": "revenue",
-        r"\btech(?:nical)?\s+debt\b": "technical_debt",
-        r"\bdebt\b": "technical_debt",
-        r"\bprofit\s*margin\b": "margin",
-    }
-    out = text.lower()
-    for pattern, replacement in aliases.items():
-        out = re.sub(pattern, replacement, out, flags=re.IGNORECASE)
-    return out
+    return _METRIC_ALIAS_RE.sub(lambda m: m.lastgroup, text.lower())
 
 
 def _num_str(value: float) -> str:
@@ -675,22 +823,43 @@ def _coerce_threshold(metric: str, raw_value: str, percent_word: bool = False) -
     return _num_str(value)
 
 
+_COMP_OPS = (
+    (">=", r"(?:>=|at\s+least|no\s+less\s+than|not\s+less\s+than)"),
+    ("<=", r"(?:<=|at\s+most|no\s+more\s+than|not\s+more\s+than)"),
+    (">", r"(?:>|greater\s+than|above|over|more\s+than|exceeds?|surpasses?)"),
+    ("<", r"(?:<|less\s+than|below|under|falls?\s+below|drops?\s+below)"),
+)
+
+_PCT_HIGHER_RE = re.compile(
+    r"\b([a-z_][a-z0-9_]*)\b\s+(?:is|are)?\s*([\d.,]+)\s*(%|percent)\s+(higher|more)\s+than\s+\b([a-z_][a-z0-9_]*)\b",
+    re.IGNORECASE,
+)
+_PCT_LOWER_RE = re.compile(
+    r"\b([a-z_][a-z0-9_]*)\b\s+(?:is|are)?\s*([\d.,]+)\s*(%|percent)\s+(lower|less)\s+than\s+\b([a-z_][a-z0-9_]*)\b",
+    re.IGNORECASE,
+)
+_PCT_OF_PATTERNS = tuple(
+    (op, re.compile(
+        rf"\b([a-z_][a-z0-9_]*)\b\s*(?:(?:is|are)\s+)?{op_pat}\s*([\d.,]+)\s*(%|percent)?\s+of\s+\b([a-z_][a-z0-9_]*)\b",
+        re.IGNORECASE,
+    ))
+    for op, op_pat in _COMP_OPS
+)
+_BETWEEN_RE = re.compile(
+    r"\b([a-z_][a-z0-9_]*)\b\s+between\s+([\d.,]+)\s*(%|percent)?\s+and\s+([\d.,]+)\s*(%|percent)?",
+    re.IGNORECASE,
+)
+_THRESH_PATTERNS = tuple(
+    (op, re.compile(rf"\b([a-z_][a-z0-9_]*)\b\s*(?:(?:is|are)\s+)?{op_pat}\s*([\d.,]+)\s*(%|percent)?", re.IGNORECASE))
+    for op, op_pat in _COMP_OPS
+)
+
+
 def _clause_to_expression(clause: str) -> str:
     c = _normalize_metric_aliases(clause.strip())
 
-    comp_ops = [
-        (">=", r"(?:>=|at\s+least|no\s+less\s+than|not\s+less\s+than)"),
-        ("<=", r"(?:<=|at\s+most|no\s+more\s+than|not\s+more\s+than)"),
-        (">", r"(?:>|greater\s+than|above|over|more\s+than|exceeds?|surpasses?)"),
-        ("<", r"(?:<|less\s+than|below|under|falls?\s+below|drops?\s+below)"),
-    ]
-
     # Example: cost is 20% higher than revenue -> cost > (revenue * 1.2)
-    m = re.search(
-        r"\b([a-z_][a-z0-9_]*)\b\s+(?:is|are)?\s*([\d.,]+)\s*(%|percent)\s+(higher|more)\s+than\s+\b([a-z_][a-z0-9_]*)\b",
-        c,
-        flags=re.IGNORECASE,
-    )
+    m = _PCT_HIGHER_RE.search(c)
     if m:
         left = m.group(1)
         pct = _parse_number(m.group(2))
@@ -699,11 +868,7 @@ def _clause_to_expression(clause: str) -> str:
         return f"{left} > ({right} * {_num_str(factor)})"
 
     # Example: margin is 10% lower than target_margin -> margin < (target_margin * 0.9)
-    m = re.search(
-        r"\b([a-z_][a-z0-9_]*)\b\s+(?:is|are)?\s*([\d.,]+)\s*(%|percent)\s+(lower|less)\s+than\s+\b([a-z_][a-z0-9_]*)\b",
-        c,
-        flags=re.IGNORECASE,
-    )
+    m = _PCT_LOWER_RE.search(c)
     if m:
         left = m.group(1)
         pct = _parse_number(m.group(2))
@@ -712,12 +877,8 @@ def _clause_to_expression(clause: str) -> str:
         return f"{left} < ({right} * {_num_str(factor)})"
 
     # Example: cost greater than 75 percent of revenue -> cost > (revenue * 0.75)
-    for op, op_pat in comp_ops:
-        m = re.search(
-            rf"\b([a-z_][a-z0-9_]*)\b\s*(?:(?:is|are)\s+)?{op_pat}\s*([\d.,]+)\s*(%|percent)?\s+of\s+\b([a-z_][a-z0-9_]*)\b",
-            c,
-            flags=re.IGNORECASE,
-        )
+    for op, pattern in _PCT_OF_PATTERNS:
+        m = pattern.search(c)
         if m:
             left = m.group(1)
             pct = _parse_number(m.group(2))
@@ -726,11 +887,7 @@ def _clause_to_expression(clause: str) -> str:
             return f"{left} {op} ({right} * {_num_str(ratio)})"
 
     # Example: margin between 10 and 20 percent
-    m = re.search(
-        r"\b([a-z_][a-z0-9_]*)\b\s+between\s+([\d.,]+)\s*(%|percent)?\s+and\s+([\d.,]+)\s*(%|percent)?",
-        c,
-        flags=re.IGNORECASE,
-    )
+    m = _BETWEEN_RE.search(c)
     if m:
         metric = m.group(1)
         lower = _coerce_threshold(metric, m.group(2), percent_word=bool(m.group(3)))
@@ -738,12 +895,8 @@ def _clause_to_expression(clause: str) -> str:
         return f"({metric} >= {lower}) and ({metric} <= {upper})"
 
     # Example: margin below 12 percent / cost > 220
-    for op, op_pat in comp_ops:
-        m = re.search(
-            rf"\b([a-z_][a-z0-9_]*)\b\s*(?:(?:is|are)\s+)?{op_pat}\s*([\d.,]+)\s*(%|percent)?",
-            c,
-            flags=re.IGNORECASE,
-        )
+    for op, pattern in _THRESH_PATTERNS:
+        m = pattern.search(c)
         if m:
             metric = m.group(1)
             threshold = _coerce_threshold(metric, m.group(2), percent_word=bool(m.group(3)))
@@ -809,87 +962,115 @@ def _nl_to_impact(text: str) -> str:
 
 # ── Platform overview helper ─────────────────────────────────────────────
 
-async def _platform_overview(db: AsyncSession, tenant_uuid: uuid.UUID) -> dict:
-    """Gather platform statistics."""
-    # Count model versions
-    mv_res = await db.execute(
-        select(func.count()).select_from(models.ModelVersion).where(models.ModelVersion.tenant_id == tenant_uuid)
-    )
-    mv_count = mv_res.scalar() or 0
+# Dashboards poll the overview; a short per-tenant TTL lets a burst of refreshes
+# share one set of queries. Admin command writes drop the tenant's entry. The
+# tenant id comes from the request, so the cache is bounded.
+_OVERVIEW_CACHE: TTLCache[dict] = TTLCache(maxsize=256, ttl=5.0)
 
-    # Active model version (tenant-owned)
-    amv_res = await db.execute(
-        select(models.ModelVersion).where(
-            models.ModelVersion.tenant_id == tenant_uuid,
-            models.ModelVersion.is_active == True
-        ).limit(1)
-    )
-    active_mv = amv_res.scalars().first()
 
-    # Count rules (tenant-owned)
-    rule_res = await db.execute(
-        select(func.count()).select_from(models.Rule).where(models.Rule.tenant_id == tenant_uuid, models.Rule.is_active == True)
-    )
-    rule_count = rule_res.scalar() or 0
+def _invalidate_overview(tenant_uuid: uuid.UUID) -> None:
+    _OVERVIEW_CACHE.pop(tenant_uuid, None)
 
-    # Count sessions
-    sess_res = await db.execute(
-        select(func.count()).select_from(models.TransformationSession).where(models.TransformationSession.tenant_id == tenant_uuid)
-    )
-    session_count = sess_res.scalar() or 0
 
-    # Count state definitions
-    state_res = await db.execute(
-        select(func.count()).select_from(models.StateDefinition).where(models.StateDefinition.tenant_id == tenant_uuid)
+async def _platform_overview(db: AsyncSession, tenant_uuid: uuid.UUID) -> dict:
+    """Gather platform statistics (cached per tenant for a few seconds)."""
+    cached = _OVERVIEW_CACHE.get(tenant_uuid)
+    if cached is not None:
+        return cached
+    response = await _compute_platform_overview(db, tenant_uuid)
+    _OVERVIEW_CACHE.set(tenant_uuid, response)
+    return response
+
+
+def _active_mv_column(tenant_uuid: uuid.UUID, column):
+    # Same ordering for every column so they all describe the same row.
+    return (
+        select(column)
+        .where(models.ModelVersion.tenant_id == tenant_uuid, models.ModelVersion.is_active)
+        .order_by(models.ModelVersion.created_at.desc(), models.ModelVersion.id)
+        .limit(1)
+        .scalar_subquery()
     )
-    state_count = state_res.scalar() or 0
 
-    # Count audit events
-    audit_res = await db.execute(
-        select(func.count()).select_from(models.AuditLog).where(models.AuditLog.tenant_id == tenant_uuid)
+
+async def _compute_platform_overview(db: AsyncSession, tenant_uuid: uuid.UUID) -> dict:
+    """Gather platform statistics."""
+
+    def _count(model, *criteria):
+        return select(func.count()).select_from(model).where(*criteria).scalar_subquery()
+
+    # All tenant counts plus the active model version in one round trip
+    counts_res = await db.execute(
+        select(
+            _count(models.ModelVersion, models.ModelVersion.tenant_id == tenant_uuid).label("model_versions"),
+            _count(models.Rule, models.Rule.tenant_id == tenant_uuid, models.Rule.is_active).label("rules"),
+            _count(models.TransformationSession, models.TransformationSession.tenant_id == tenant_uuid).label("sessions"),
+            _count(models.StateDefinition, models.StateDefinition.tenant_id == tenant_uuid).label("states"),
+            _count(models.AuditLog, models.AuditLog.tenant_id == tenant_uuid).label("audit_events"),
+            _active_mv_column(tenant_uuid, models.ModelVersion.id).label("active_mv_id"),
+            _active_mv_column(tenant_uuid, models.ModelVersion.name).label("active_mv_name"),
+            _count(
+                models.Rule,
+                models.Rule.model_version_id == _active_mv_column(tenant_uuid, models.ModelVersion.id),
+                models.Rule.is_active,
+            ).label("active_mv_rules"),
+        )
     )
-    audit_count = audit_res.scalar() or 0
+    counts = counts_res.one()
+    mv_count = counts.model_versions or 0
+    rule_count = counts.rules or 0
+    session_count = counts.sessions or 0
+    state_count = counts.states or 0
+    audit_count = counts.audit_events or 0
+
+    # Active model version (tenant-owned); only id and name are reported
+    active_mv = None
+    if counts.active_mv_id is not None:
+        active_mv = SimpleNamespace(id=counts.active_mv_id, name=counts.active_mv_name)
+    effective_rule_count = counts.active_mv_rules or 0
 
     # Most recent activity
     recent_res = await db.execute(
-        select(models.AuditLog)
+        select(models.AuditLog.action, models.AuditLog.actor, models.AuditLog.created_at)
         .where(models.AuditLog.tenant_id == tenant_uuid)
         .order_by(models.AuditLog.created_at.desc())
         .limit(5)
     )
-    recent = recent_res.scalars().all()
     recent_items = [{
-        "action": r.action,
-        "actor": r.actor,
-        "created_at": r.created_at.isoformat() if r.created_at else None,
-    } for r in recent]
+        "action": action,
+        "actor": actor,
+        "created_at": created_at.isoformat() if created_at else None,
+    } for action, actor, created_at in recent_res.all()]
 
     effective_mv = active_mv
 
     # Fallback for local/demo tenant mismatch: derive effective model from tenant sessions.
     if effective_mv is None:
-        latest_session_q = (
-            select(models.TransformationSession)
+        fallback_res = await db.execute(
+            select(
+                models.ModelVersion.id,
+                models.ModelVersion.name,
+                _count(
+                    models.Rule,
+                    models.Rule.model_version_id == models.ModelVersion.id,
+                    models.Rule.is_active,
+                ).label("rules"),
+            )
+            .join(models.TransformationSession, models.TransformationSession.model_version_id == models.ModelVersion.id)
             .where(models.TransformationSession.tenant_id == tenant_uuid)
             .order_by(models.TransformationSession.created_at.desc())
             .limit(1)
         )
-        latest_session_res = await db.execute(latest_session_q)
-        latest_session = latest_session_res.scalars().first()
-        if latest_session:
-            effective_mv = await db.get(models.ModelVersion, latest_session.model_version_id)
+        fallback = fallback_res.first()
+        if fallback:
+            effective_mv = SimpleNamespace(id=fallback.id, name=fallback.name)
+            effective_rule_count = fallback.rules or 0
 
     if mv_count == 0 and effective_mv is not None:
         mv_count = 1
 
     if rule_count == 0 and effective_mv is not None:
-        effective_rule_res = await db.execute(
-            select(func.count()).select_from(models.Rule).where(
-                models.Rule.model_version_id == effective_mv.id,
-                models.Rule.is_active == True,
-            )
-        )
-        rule_count = effective_rule_res.scalar() or 0
+        rule_count = effective_rule_count
 
     return format_response({
         "action": "platform_overview",
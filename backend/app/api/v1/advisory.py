@@ -1,30 +1,37 @@
 from typing import Optional, Dict, Any, List, Tuple
-from datetime import datetime, timezone
 import asyncio
-import json
 import uuid
 import os
 import subprocess
 import re
+import shutil
 import time
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import urlparse, urlunparse
+import orjson
 import websockets
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 import httpx
 from pydantic import BaseModel, Field
-from sqlalchemy import insert, select
+from sqlalchemy import func, insert, select, type_coerce
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config_files import load_json_config
+from app.core.json import dumps as _dumps
 from app.core.response import format_response
 from app.db import models
 from app.db.session import get_session
 from app.services.engine import run_deterministic_engine
+from app.services.snapshots import record_snapshot, session_exists
 
 router = APIRouter()
 
 RUNTIME_AGENTS_PATH = Path(__file__).resolve().parents[3] / "openclaw" / "agents" / "strategos_advisory_agents.runtime.json"
+BOARD_AGENTS_PATH = Path(__file__).resolve().parents[3] / "openclaw" / "agents" / "strategos_advisory_board.json"
 
 BOARD_TO_RUNTIME_AGENT = {
     "schema_extraction_agent": "strategos-schema-extraction",
@@ -97,21 +104,112 @@ def _env_int(name: str, default: int, minimum: int, maximum: int) -> int:
     return max(minimum, min(maximum, value))
 
 
-def _load_board_agents() -> List[Dict[str, Any]]:
+def _env_float(name: str, default: float) -> float:
     try:
-        board_path = Path(__file__).resolve().parents[3] / "openclaw" / "agents" / "strategos_advisory_board.json"
-        payload = json.loads(board_path.read_text(encoding="utf-8"))
-        agents = payload.get("agents")
-        if isinstance(agents, list):
-            return [a for a in agents if isinstance(a, dict)]
+        return float(os.getenv(name, str(default)).strip())
     except Exception:
-        pass
+        return default
+
+
+@dataclass(frozen=True)
+class OpenClawConfig:
+    """OpenClaw settings, read from the environment once at import; restart to change."""
+
+    execution_mode: str
+    allow_fallback: bool
+    agent_timeout_seconds: int
+    remote_retries: int
+    api_url: str
+    api_token: str
+    api_headers: Dict[str, str]
+    api_timeout_seconds: float
+    ws_url: str
+    ws_client_id: str
+    ws_client_mode: str
+    ws_role: str
+    ws_scopes: Tuple[str, ...]
+    ws_agent_method: str
+    ws_origin: str
+    bin: str
+    # PATH lookup done once here; empty when the binary cannot be found.
+    bin_path: str
+
+    @classmethod
+    def from_env(cls) -> "OpenClawConfig":
+        base_url = os.getenv("OPENCLAW_API_BASE_URL", "").strip().rstrip("/")
+        endpoint = os.getenv("OPENCLAW_API_AGENT_PATH", "/agent").strip()
+        if not endpoint.startswith("/"):
+            endpoint = f"/{endpoint}"
+
+        token = os.getenv("OPENCLAW_API_AUTH_TOKEN", "").strip()
+        headers: Dict[str, str] = {"Content-Type": "application/json"}
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+
+        parsed = urlparse(base_url)
+        ws_url = ""
+        if parsed.scheme in {"ws", "wss"}:
+            ws_url = base_url
+        elif _env_flag("OPENCLAW_ENABLE_WS_FALLBACK", default=False) and parsed.scheme in {"http", "https"}:
+            ws_scheme = "wss" if parsed.scheme == "https" else "ws"
+            ws_url = urlunparse((ws_scheme, parsed.netloc, parsed.path or "", "", "", ""))
+
+        openclaw_bin = os.getenv("OPENCLAW_BIN", "/home/ubuntu/.npm-global/bin/openclaw").strip()
+        raw_scopes = os.getenv(
+            "OPENCLAW_WS_SCOPES",
+            "operator.admin,operator.approvals,operator.pairing,operator.read,operator.write",
+        )
+        return cls(
+            execution_mode=os.getenv("OPENCLAW_EXECUTION_MODE", "remote_http").strip().lower(),
+            allow_fallback=_env_flag("OPENCLAW_ALLOW_DETERMINISTIC_FALLBACK", default=True),
+            agent_timeout_seconds=_env_int("OPENCLAW_AGENT_TIMEOUT_SECONDS", default=120, minimum=1, maximum=3600),
+            remote_retries=_env_int("OPENCLAW_REMOTE_RETRIES", default=0, minimum=0, maximum=5),
+            api_url=f"{base_url}{endpoint}" if base_url else "",
+            api_token=token,
+            api_headers=headers,
+            api_timeout_seconds=_env_float("OPENCLAW_API_TIMEOUT_SECONDS", 8.0),
+            ws_url=ws_url,
+            ws_client_id=os.getenv("OPENCLAW_WS_CLIENT_ID", "cli").strip() or "cli",
+            ws_client_mode=os.getenv("OPENCLAW_WS_CLIENT_MODE", "cli").strip() or "cli",
+            ws_role=os.getenv("OPENCLAW_WS_ROLE", "operator").strip() or "operator",
+            ws_scopes=tuple(s.strip() for s in raw_scopes.split(",") if s.strip()),
+            ws_agent_method=os.getenv("OPENCLAW_WS_AGENT_METHOD", "agent").strip() or "agent",
+            ws_origin=os.getenv("OPENCLAW_WS_ORIGIN", "").strip(),
+            bin=openclaw_bin,
+            bin_path=shutil.which(openclaw_bin) or "",
+        )
+
+
+_OPENCLAW_CONFIG = OpenClawConfig.from_env()
+
+
+# Parsed by load_json_config (mtime-cached); the derived views below are rebuilt
+# only when it hands back a new payload object, i.e. when the file changed.
+_DERIVED_CONFIG_CACHE: Dict[str, Tuple[Dict[str, Any], Any]] = {}
+# Shared default so a missing or invalid file also memoizes instead of rebuilding per call.
+_MISSING_CONFIG: Dict[str, Any] = {}
+
+
+def _derive_from_config(path: Path, build: Any) -> Any:
+    payload = load_json_config(path, _MISSING_CONFIG)
+    cached = _DERIVED_CONFIG_CACHE.get(build.__name__)
+    if cached is not None and cached[0] is payload:
+        return cached[1]
+    value = build(payload)
+    _DERIVED_CONFIG_CACHE[build.__name__] = (payload, value)
+    return value
+
+
+def _board_agents_from(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    agents = payload.get("agents")
+    if isinstance(agents, list):
+        return [a for a in agents if isinstance(a, dict)]
     return []
 
 
-def _board_role_lookup() -> Dict[str, str]:
+def _board_roles_from(payload: Dict[str, Any]) -> Dict[str, str]:
     roles: Dict[str, str] = {}
-    for agent in _load_board_agents():
+    for agent in _board_agents_from(payload):
         aid = str(agent.get("id") or "").strip()
         role = str(agent.get("role") or "").strip()
         if aid:
@@ -119,26 +217,50 @@ def _board_role_lookup() -> Dict[str, str]:
     return roles
 
 
+def _runtime_agents_from(payload: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    out: Dict[str, Dict[str, Any]] = {}
+    agents = payload.get("agents")
+    if isinstance(agents, list):
+        for item in agents:
+            if not isinstance(item, dict):
+                continue
+            aid = item.get("id")
+            if isinstance(aid, str) and aid.strip():
+                out[aid.strip()] = item
+    return out
+
+
+def _load_board_agents() -> List[Dict[str, Any]]:
+    return _derive_from_config(BOARD_AGENTS_PATH, _board_agents_from)
+
+
+def _board_role_lookup() -> Dict[str, str]:
+    return _derive_from_config(BOARD_AGENTS_PATH, _board_roles_from)
+
+
 def _load_runtime_agents() -> Dict[str, Dict[str, Any]]:
-    try:
-        payload = json.loads(RUNTIME_AGENTS_PATH.read_text(encoding="utf-8"))
-        agents = payload.get("agents")
-        if isinstance(agents, list):
-            out: Dict[str, Dict[str, Any]] = {}
-            for item in agents:
-                if not isinstance(item, dict):
-                    continue
-                aid = item.get("id")
-                if isinstance(aid, str) and aid.strip():
-                    out[aid.strip()] = item
-            return out
-    except Exception:
-        pass
-    return {}
+    return _derive_from_config(RUNTIME_AGENTS_PATH, _runtime_agents_from)
+
+
+# (runtime agents payload, {(agent_id, role): profile}); the memo is dropped whenever
+# the runtime agents file is reparsed, so edits still take effect.
+_RUNTIME_PROFILE_CACHE: Tuple[Any, Dict[Tuple[str, str], Tuple[str, str, str]]] = (None, {})
 
 
 def _resolve_runtime_profile(agent_id: str, role: str) -> Tuple[str, str, str]:
+    global _RUNTIME_PROFILE_CACHE
     runtime_agents = _load_runtime_agents()
+    if _RUNTIME_PROFILE_CACHE[0] is not runtime_agents:
+        _RUNTIME_PROFILE_CACHE = (runtime_agents, {})
+    memo = _RUNTIME_PROFILE_CACHE[1]
+    key = (agent_id, role)
+    profile = memo.get(key)
+    if profile is None:
+        profile = memo[key] = _build_runtime_profile(runtime_agents, agent_id, role)
+    return profile
+
+
+def _build_runtime_profile(runtime_agents: Dict[str, Dict[str, Any]], agent_id: str, role: str) -> Tuple[str, str, str]:
     runtime_id = BOARD_TO_RUNTIME_AGENT.get(agent_id)
     runtime_cfg = runtime_agents.get(runtime_id or "", {})
 
@@ -156,8 +278,13 @@ def _extract_snapshot_evidence(snapshot: Dict[str, Any]) -> Dict[str, Any]:
     state = snapshot.get("state", "UNKNOWN")
     contributions = snapshot.get("contributions") or []
     restructuring = snapshot.get("restructuring_actions") or []
-    triggered = [c.get("expression") for c in contributions if isinstance(c, dict) and c.get("result")]
-    top_actions = [r.get("template_name") for r in restructuring if isinstance(r, dict)][:3]
+    # Engine snapshots hold homogeneous lists of dicts; check the shape once, not per item.
+    triggered: List[Any] = []
+    if isinstance(contributions, list) and isinstance(contributions[0] if contributions else None, dict):
+        triggered = [c.get("expression") for c in contributions if c.get("result")]
+    top_actions: List[Any] = []
+    if isinstance(restructuring, list) and isinstance(restructuring[0] if restructuring else None, dict):
+        top_actions = [r.get("template_name") for r in restructuring[:3]]
     return {
         "state": state,
         "triggered_conditions": triggered,
@@ -214,12 +341,12 @@ def _top_coefficients(snapshot: Dict[str, Any], limit: int = 8) -> List[Dict[str
 
 
 def _extract_openclaw_text(payload: Any) -> str:
+    if type(payload) is str:
+        return payload.strip()
+
     if payload is None:
         return ""
 
-    if isinstance(payload, str):
-        return payload.strip()
-
     if isinstance(payload, dict):
         # Common OpenClaw CLI / gateway envelopes:
         # {"result":{"payloads":[{"text":"..."}]}} or {"payloads":[...]}
@@ -266,7 +393,7 @@ def _extract_openclaw_text(payload: Any) -> str:
         if has_payloads or has_result:
             return ""
 
-        return json.dumps(payload)
+        return _dumps(payload)
 
     if isinstance(payload, list):
         if not payload:
@@ -280,6 +407,17 @@ def _extract_openclaw_text(payload: Any) -> str:
     return str(payload).strip()
 
 
+def _unwrap_json_text(content: str) -> str:
+    # Agents sometimes return a JSON envelope as their text; only strings that look
+    # like one are reparsed, so plain-text replies skip the decode entirely.
+    if content[:1] not in ("{", "["):
+        return content
+    try:
+        return _extract_openclaw_text(orjson.loads(content)) or content
+    except orjson.JSONDecodeError:
+        return content
+
+
 def _build_deterministic_fallback_insight(role: str, evidence: Dict[str, Any]) -> str:
     state = str(evidence.get("state") or "UNKNOWN")
     triggered = evidence.get("triggered_conditions") or []
@@ -295,19 +433,46 @@ def _build_deterministic_fallback_insight(role: str, evidence: Dict[str, Any]) -
     )
 
 
-async def _invoke_openclaw_remote(runtime_agent_id: str, user_message: str, timeout_sec: int) -> str:
-    base_url = os.getenv("OPENCLAW_API_BASE_URL", "").strip().rstrip("/")
-    if not base_url:
-        raise HTTPException(status_code=503, detail="openclaw_api_base_url_missing")
+# One pooled client so consecutive chain steps reuse keep-alive connections instead
+# of paying DNS/TCP/TLS setup per call. Base URL, headers and timeouts come from
+# _OPENCLAW_CONFIG and are passed on each request rather than baked into the client.
+_OPENCLAW_HTTP_CLIENT: Optional[httpx.AsyncClient] = None
+_OPENCLAW_HTTP_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _openclaw_http_client() -> httpx.AsyncClient:
+    global _OPENCLAW_HTTP_CLIENT, _OPENCLAW_HTTP_LOOP
+    loop = asyncio.get_running_loop()
+    # Pooled connections belong to the loop that opened them.
+    if _OPENCLAW_HTTP_CLIENT is None or _OPENCLAW_HTTP_CLIENT.is_closed or _OPENCLAW_HTTP_LOOP is not loop:
+        _OPENCLAW_HTTP_CLIENT = httpx.AsyncClient(
+            trust_env=False,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+        _OPENCLAW_HTTP_LOOP = loop
+    return _OPENCLAW_HTTP_CLIENT
+
 
-    endpoint = os.getenv("OPENCLAW_API_AGENT_PATH", "/agent").strip()
-    if not endpoint.startswith("/"):
-        endpoint = f"/{endpoint}"
+async def close_openclaw_http_client() -> None:
+    global _OPENCLAW_HTTP_CLIENT, _OPENCLAW_HTTP_LOOP
+    client, _OPENCLAW_HTTP_CLIENT, _OPENCLAW_HTTP_LOOP = _OPENCLAW_HTTP_CLIENT, None, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
 
-    token = os.getenv("OPENCLAW_API_AUTH_TOKEN", "").strip()
-    headers: Dict[str, str] = {"Content-Type": "application/json"}
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
+
+async def _read_body_prefix(res: httpx.Response, limit: int) -> str:
+    buf = bytearray()
+    async for chunk in res.aiter_bytes():
+        buf += chunk
+        if len(buf) >= limit:
+            break
+    return buf.decode(res.encoding or "utf-8", errors="replace")[:limit]
+
+
+async def _invoke_openclaw_remote(runtime_agent_id: str, user_message: str, timeout_sec: int) -> str:
+    cfg = _OPENCLAW_CONFIG
+    if not cfg.api_url:
+        raise HTTPException(status_code=503, detail="openclaw_api_base_url_missing")
 
     payload = {
         "agent": runtime_agent_id,
@@ -316,7 +481,7 @@ async def _invoke_openclaw_remote(runtime_agent_id: str, user_message: str, time
         "timeout": max(10, int(timeout_sec)),
     }
 
-    request_timeout = float(os.getenv("OPENCLAW_API_TIMEOUT_SECONDS", "8"))
+    request_timeout = cfg.api_timeout_seconds
     if request_timeout <= 0:
         request_timeout = min(float(timeout_sec), 8.0)
 
@@ -328,36 +493,31 @@ async def _invoke_openclaw_remote(runtime_agent_id: str, user_message: str, time
         pool=min(request_timeout, 5.0),
     )
 
-    parsed = urlparse(base_url)
-    enable_ws_fallback = _env_flag("OPENCLAW_ENABLE_WS_FALLBACK", default=False)
-    ws_url = ""
-    if parsed.scheme in {"ws", "wss"}:
-        ws_url = base_url
-    elif enable_ws_fallback and parsed.scheme in {"http", "https"}:
-        ws_scheme = "wss" if parsed.scheme == "https" else "ws"
-        ws_url = urlunparse((ws_scheme, parsed.netloc, parsed.path or "", "", "", ""))
-
-    if ws_url:
+    if cfg.ws_url:
         try:
-            return await _invoke_openclaw_ws(ws_url, headers, payload, request_timeout)
+            return await _invoke_openclaw_ws(cfg.ws_url, cfg.api_headers, payload, request_timeout)
         except HTTPException:
             # Continue to HTTP compatibility fallback below.
             pass
 
     try:
-        async with httpx.AsyncClient(timeout=timeout_config, trust_env=False) as client:
-            res = await client.post(f"{base_url}{endpoint}", headers=headers, json=payload)
+        async with _openclaw_http_client().stream(
+            "POST", cfg.api_url, headers=cfg.api_headers, content=orjson.dumps(payload), timeout=timeout_config
+        ) as res:
+            if res.status_code >= 400:
+                # Only the head of an error page ends up in the detail; stop reading there.
+                detail = await _read_body_prefix(res, 1000)
+                raise HTTPException(status_code=502, detail=f"openclaw_remote_error_{runtime_agent_id}: {detail}")
+            await res.aread()
+    except HTTPException:
+        raise
     except httpx.TimeoutException:
         raise HTTPException(status_code=504, detail=f"openclaw_remote_timeout: {runtime_agent_id}")
     except Exception as exc:
         raise HTTPException(status_code=502, detail=f"openclaw_remote_invoke_failed: {exc}")
 
-    if res.status_code >= 400:
-        detail = (res.text or "")[:1000]
-        raise HTTPException(status_code=502, detail=f"openclaw_remote_error_{runtime_agent_id}: {detail}")
-
     try:
-        body = res.json()
+        body = orjson.loads(res.content)
     except Exception:
         body = res.text
 
@@ -365,15 +525,54 @@ async def _invoke_openclaw_remote(runtime_agent_id: str, user_message: str, time
     if not content:
         raise HTTPException(status_code=502, detail=f"openclaw_remote_empty_output: {runtime_agent_id}")
 
-    try:
-        maybe_json = json.loads(content)
-        parsed_content = _extract_openclaw_text(maybe_json)
-        if parsed_content:
-            return parsed_content
-    except Exception:
-        pass
+    return _unwrap_json_text(content)
+
+
+# Handshaken gateway sockets parked between agent calls, so a chain pays the
+# connect.challenge/connect round-trips once per socket instead of once per step.
+# Callers check a socket out for the whole request, so concurrent chains never
+# share one; idle sockets beyond the cap are closed.
+_OPENCLAW_WS_IDLE: List[Any] = []
+_OPENCLAW_WS_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_OPENCLAW_WS_IDLE_MAX = 8
 
-    return content
+
+def _abort_openclaw_ws(ws: Any) -> None:
+    # The close handshake would have to run on the loop that opened the socket, which
+    # may already be gone; dropping the transport closes the TCP connection directly.
+    transport = getattr(ws, "transport", None)
+    if transport is not None:
+        transport.abort()
+
+
+def _checkout_openclaw_ws() -> Optional[Any]:
+    global _OPENCLAW_WS_LOOP
+    loop = asyncio.get_running_loop()
+    # Like the HTTP client, sockets belong to the loop that opened them.
+    if _OPENCLAW_WS_LOOP is not loop:
+        stale = list(_OPENCLAW_WS_IDLE)
+        _OPENCLAW_WS_IDLE.clear()
+        _OPENCLAW_WS_LOOP = loop
+        for ws in stale:
+            _abort_openclaw_ws(ws)
+    return _OPENCLAW_WS_IDLE.pop() if _OPENCLAW_WS_IDLE else None
+
+
+async def _checkin_openclaw_ws(ws: Any) -> None:
+    if _OPENCLAW_WS_LOOP is asyncio.get_running_loop() and len(_OPENCLAW_WS_IDLE) < _OPENCLAW_WS_IDLE_MAX:
+        _OPENCLAW_WS_IDLE.append(ws)
+    else:
+        await ws.close()
+
+
+async def close_openclaw_ws_pool() -> None:
+    idle = list(_OPENCLAW_WS_IDLE)
+    _OPENCLAW_WS_IDLE.clear()
+    for ws in idle:
+        try:
+            await ws.close()
+        except Exception:
+            pass
 
 
 async def _invoke_openclaw_ws(ws_url: str, headers: Dict[str, str], payload: Dict[str, Any], request_timeout: float) -> str:
@@ -382,17 +581,15 @@ async def _invoke_openclaw_ws(ws_url: str, headers: Dict[str, str], payload: Dic
     # 2) send connect request (type=req, method=connect)
     # 3) send agent method request (typically method=agent)
     # 4) consume matching response frame
-    token = os.getenv("OPENCLAW_API_AUTH_TOKEN", "").strip()
-    client_id = os.getenv("OPENCLAW_WS_CLIENT_ID", "cli").strip() or "cli"
-    client_mode = os.getenv("OPENCLAW_WS_CLIENT_MODE", "cli").strip() or "cli"
-    role = os.getenv("OPENCLAW_WS_ROLE", "operator").strip() or "operator"
-    raw_scopes = os.getenv(
-        "OPENCLAW_WS_SCOPES",
-        "operator.admin,operator.approvals,operator.pairing,operator.read,operator.write",
-    )
-    scopes = [s.strip() for s in raw_scopes.split(",") if s.strip()]
-    agent_method = os.getenv("OPENCLAW_WS_AGENT_METHOD", "agent").strip() or "agent"
-    origin = os.getenv("OPENCLAW_WS_ORIGIN", "").strip()
+    # Steps 1-2 run once per pooled socket; later calls start at step 3.
+    cfg = _OPENCLAW_CONFIG
+    token = cfg.api_token
+    client_id = cfg.ws_client_id
+    client_mode = cfg.ws_client_mode
+    role = cfg.ws_role
+    scopes = list(cfg.ws_scopes)
+    agent_method = cfg.ws_agent_method
+    origin = cfg.ws_origin
 
     ws_headers: Dict[str, str] = {}
     if origin:
@@ -401,7 +598,7 @@ async def _invoke_openclaw_ws(ws_url: str, headers: Dict[str, str], payload: Dic
     async def _recv_json(ws: Any, timeout: float) -> Dict[str, Any]:
         raw = await asyncio.wait_for(ws.recv(), timeout=timeout)
         try:
-            obj = json.loads(raw)
+            obj = orjson.loads(raw)
         except Exception:
             raise HTTPException(status_code=502, detail="openclaw_ws_invalid_json")
         if not isinstance(obj, dict):
@@ -411,7 +608,7 @@ async def _invoke_openclaw_ws(ws_url: str, headers: Dict[str, str], payload: Dic
     async def _request(ws: Any, method: str, params: Dict[str, Any], timeout: float) -> Dict[str, Any]:
         req_id = str(uuid.uuid4())
         req = {"type": "req", "id": req_id, "method": method, "params": params}
-        await asyncio.wait_for(ws.send(json.dumps(req)), timeout=timeout)
+        await asyncio.wait_for(ws.send(_dumps(req)), timeout=timeout)
         while True:
             frame = await _recv_json(ws, timeout)
             if frame.get("type") != "res":
@@ -420,14 +617,14 @@ async def _invoke_openclaw_ws(ws_url: str, headers: Dict[str, str], payload: Dic
                 continue
             return frame
 
-    try:
+    async def _connect() -> Any:
         # websockets>=15 uses additional_headers; keep a fallback for older versions.
         try:
             ws = await websockets.connect(ws_url, additional_headers=ws_headers, open_timeout=request_timeout)
         except TypeError:
             ws = await websockets.connect(ws_url, extra_headers=list(ws_headers.items()), open_timeout=request_timeout)
 
-        async with ws:
+        try:
             first = await _recv_json(ws, request_timeout)
             if first.get("type") != "event" or first.get("event") != "connect.challenge":
                 raise HTTPException(status_code=502, detail="openclaw_ws_missing_connect_challenge")
@@ -452,18 +649,43 @@ async def _invoke_openclaw_ws(ws_url: str, headers: Dict[str, str], payload: Dic
             if not bool(connect_res.get("ok")):
                 err = (connect_res.get("error") or {}).get("message") or "connect_failed"
                 raise HTTPException(status_code=502, detail=f"openclaw_ws_connect_failed: {err}")
+        except BaseException:
+            await ws.close()
+            raise
+        return ws
 
-            # New OpenClaw gateway exposes "agent". Some installations still expose
-            # "agent.exec"; method is env-configurable.
-            agent_res = await _request(ws, agent_method, payload, request_timeout)
-            if not bool(agent_res.get("ok")):
-                err = (agent_res.get("error") or {}).get("message") or "agent_method_failed"
-                raise HTTPException(status_code=502, detail=f"openclaw_ws_agent_failed: {err}")
-            body = agent_res.get("payload")
-    except asyncio.TimeoutError:
-        raise HTTPException(status_code=504, detail=f"openclaw_ws_timeout: {payload.get('agent')}")
-    except Exception as exc:
-        raise HTTPException(status_code=502, detail=f"openclaw_ws_invoke_failed: {exc}")
+    ws = None
+    try:
+        ws = _checkout_openclaw_ws()
+        reused = ws is not None
+        while True:
+            if ws is None:
+                ws = await _connect()
+            try:
+                # New OpenClaw gateway exposes "agent". Some installations still expose
+                # "agent.exec"; method is env-configurable.
+                agent_res = await _request(ws, agent_method, payload, request_timeout)
+                break
+            except websockets.exceptions.ConnectionClosed:
+                # A parked socket may have been closed by the gateway while idle; redo the handshake once.
+                ws = None
+                if not reused:
+                    raise
+                reused = False
+    except BaseException as exc:
+        if ws is not None:
+            await ws.close()
+        if isinstance(exc, asyncio.TimeoutError):
+            raise HTTPException(status_code=504, detail=f"openclaw_ws_timeout: {payload.get('agent')}")
+        if isinstance(exc, Exception) and not isinstance(exc, HTTPException):
+            raise HTTPException(status_code=502, detail=f"openclaw_ws_invoke_failed: {exc}")
+        raise
+
+    await _checkin_openclaw_ws(ws)
+    if not bool(agent_res.get("ok")):
+        err = (agent_res.get("error") or {}).get("message") or "agent_method_failed"
+        raise HTTPException(status_code=502, detail=f"openclaw_ws_agent_failed: {err}")
+    body = agent_res.get("payload")
 
     # common response shapes: direct payload, {result: ...}, {body: ...}, {data: ...}
     if isinstance(body, dict):
@@ -477,46 +699,60 @@ async def _invoke_openclaw_ws(ws_url: str, headers: Dict[str, str], payload: Dic
     return _extract_openclaw_text(body)
 
 
+async def _run_cli(cmd: List[str], timeout_sec: int) -> Tuple[int, str, str]:
+    """Run `cmd` without blocking the event loop; returns (returncode, stdout, stderr)."""
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except NotImplementedError:
+        # The selector loop main.py installs on Windows has no subprocess support.
+        done = await asyncio.to_thread(
+            subprocess.run, cmd, capture_output=True, text=True, timeout=timeout_sec, check=False
+        )
+        return done.returncode, done.stdout, done.stderr
+
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout_sec)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+    return proc.returncode, stdout.decode("utf-8", errors="replace"), stderr.decode("utf-8", errors="replace")
+
+
+@lru_cache(maxsize=32)
+def _openclaw_agent_cmd_prefix(runtime_agent_id: str) -> Tuple[str, ...]:
+    # Everything but the message is fixed per agent; the binary was resolved at import.
+    return (_OPENCLAW_CONFIG.bin_path, "agent", "--agent", runtime_agent_id, "--json")
+
+
 async def _invoke_openclaw_local_cli(runtime_agent_id: str, user_message: str, timeout_sec: int) -> str:
-    openclaw_bin = os.getenv("OPENCLAW_BIN", "/home/ubuntu/.npm-global/bin/openclaw").strip()
-
-    cmd = [
-        openclaw_bin,
-        "agent",
-        "--agent",
-        runtime_agent_id,
-        "--message",
-        user_message,
-        "--json",
-    ]
+    if not _OPENCLAW_CONFIG.bin_path:
+        raise HTTPException(status_code=503, detail=f"openclaw_bin_not_found: {_OPENCLAW_CONFIG.bin}")
+
+    cmd = [*_openclaw_agent_cmd_prefix(runtime_agent_id), "--message", user_message]
 
     try:
-        proc = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout_sec,
-            check=False,
-        )
-    except subprocess.TimeoutExpired:
+        returncode, stdout, stderr = await _run_cli(cmd, timeout_sec)
+    except (asyncio.TimeoutError, subprocess.TimeoutExpired):
         raise HTTPException(status_code=504, detail=f"openclaw_agent_timeout: {runtime_agent_id}")
     except Exception as exc:
         raise HTTPException(status_code=502, detail=f"openclaw_agent_invoke_failed: {exc}")
 
-    if proc.returncode != 0:
-        err = (proc.stderr or proc.stdout or "")[:1000]
+    if returncode != 0:
+        err = (stderr or stdout or "")[:1000]
         raise HTTPException(status_code=502, detail=f"openclaw_agent_error_{runtime_agent_id}: {err}")
 
-    raw_output = (proc.stdout or "").strip()
+    raw_output = (stdout or "").strip()
     if not raw_output:
         raise HTTPException(status_code=502, detail=f"openclaw_agent_empty_output: {runtime_agent_id}")
 
-    content = _extract_openclaw_text(raw_output)
-    try:
-        parsed = json.loads(content)
-        content = _extract_openclaw_text(parsed) or content
-    except Exception:
-        pass
+    # --json output is decoded once with orjson and the text pulled from the envelope;
+    # raw_output is already a stripped string, so it goes straight to the unwrap.
+    content = _unwrap_json_text(raw_output)
 
     if not content:
         raise HTTPException(status_code=502, detail=f"openclaw_agent_missing_insight: {runtime_agent_id}")
@@ -545,7 +781,7 @@ def _extract_first_json_object(raw_text: str) -> Optional[Dict[str, Any]]:
     if not text:
         return None
     try:
-        loaded = json.loads(text)
+        loaded = orjson.loads(text)
         if isinstance(loaded, dict):
             return loaded
     except Exception:
@@ -555,7 +791,7 @@ def _extract_first_json_object(raw_text: str) -> Optional[Dict[str, Any]]:
     if fenced:
         candidate = fenced.group(1).strip()
         try:
-            loaded = json.loads(candidate)
+            loaded = orjson.loads(candidate)
             if isinstance(loaded, dict):
                 return loaded
         except Exception:
@@ -566,7 +802,7 @@ def _extract_first_json_object(raw_text: str) -> Optional[Dict[str, Any]]:
     if start >= 0 and end > start:
         candidate = text[start : end + 1]
         try:
-            loaded = json.loads(candidate)
+            loaded = orjson.loads(candidate)
             if isinstance(loaded, dict):
                 return loaded
         except Exception:
@@ -584,6 +820,18 @@ def _normalize_text_list(value: Any) -> List[str]:
     return out
 
 
+def _compact_restructuring_actions(actions: Any) -> List[Dict[str, Any]]:
+    # Agents only need the template name and content; rule/template UUIDs are noise
+    # that every chain step would otherwise re-serialize and pay tokens for.
+    if not isinstance(actions, list):
+        return []
+    return [
+        {"template_name": a.get("template_name"), "payload": a.get("payload")}
+        for a in actions
+        if isinstance(a, dict)
+    ]
+
+
 def _build_fixed_strategos_context(snapshot: Dict[str, Any], intake_ctx: Dict[str, Any]) -> Dict[str, Any]:
     score_breakdown = snapshot.get("score_breakdown") if isinstance(snapshot, dict) else {}
     if not isinstance(score_breakdown, dict):
@@ -610,7 +858,7 @@ def _build_fixed_strategos_context(snapshot: Dict[str, Any], intake_ctx: Dict[st
         },
         "triggered_rules": triggered_rules,
         "top_coefficient_contributions": _top_coefficients(snapshot),
-        "restructuring_actions": snapshot.get("restructuring_actions") or [],
+        "restructuring_actions": _compact_restructuring_actions(snapshot.get("restructuring_actions")),
         "normalized_input_metrics": intake_ctx.get("input") or {},
         "metric_source": intake_ctx.get("metric_source") or {},
         "assumption_profile": intake_ctx.get("assumption_profile"),
@@ -632,7 +880,7 @@ async def _load_session_intake_context(session_id: str, db: AsyncSession) -> Dic
         if not payload_raw:
             continue
         try:
-            payload = json.loads(payload_raw)
+            payload = payload_raw if isinstance(payload_raw, dict) else orjson.loads(payload_raw)
         except Exception:
             continue
         if not isinstance(payload, dict):
@@ -930,7 +1178,7 @@ def _coerce_schema_invalid_step_output(
 
 
 async def _invoke_agent_text(runtime_agent_id: str, user_message: str, timeout_sec: int) -> str:
-    execution_mode = os.getenv("OPENCLAW_EXECUTION_MODE", "remote_http").strip().lower()
+    execution_mode = _OPENCLAW_CONFIG.execution_mode
     if execution_mode in {"remote_http", "remote", "http"}:
         return await _invoke_openclaw_remote(runtime_agent_id, user_message, timeout_sec)
     if execution_mode in {"local_cli", "cli"}:
@@ -941,6 +1189,7 @@ async def _invoke_agent_text(runtime_agent_id: str, user_message: str, timeout_s
 async def _run_chain_step(
     step_id: str,
     role: str,
+    profile: Tuple[str, str, str],
     step_index: int,
     ceo_request: str,
     snapshot: Dict[str, Any],
@@ -948,14 +1197,13 @@ async def _run_chain_step(
     history: List[Dict[str, Any]],
     trace_id: str,
 ) -> Dict[str, Any]:
-    runtime_agent_id, model, role_prompt = _resolve_runtime_profile(step_id, role)
-    if runtime_agent_id == "":
-        raise HTTPException(status_code=503, detail=f"runtime_agent_mapping_missing_for_{step_id}")
+    runtime_agent_id, model, role_prompt = profile
 
-    timeout_sec = int(os.getenv("OPENCLAW_AGENT_TIMEOUT_SECONDS", "120"))
-    allow_fallback = _env_flag("OPENCLAW_ALLOW_DETERMINISTIC_FALLBACK", default=True)
-    remote_retries = _env_int("OPENCLAW_REMOTE_RETRIES", default=0, minimum=0, maximum=5)
-    execution_mode = os.getenv("OPENCLAW_EXECUTION_MODE", "remote_http").strip().lower()
+    cfg = _OPENCLAW_CONFIG
+    timeout_sec = cfg.agent_timeout_seconds
+    allow_fallback = cfg.allow_fallback
+    remote_retries = cfg.remote_retries
+    execution_mode = cfg.execution_mode
 
     handoff_inputs = _build_step_inputs(step_id, ceo_request, fixed_context, history)
     output_contract = _build_output_contract(step_id)
@@ -975,8 +1223,8 @@ async def _run_chain_step(
         f"{role_prompt}\n\n"
         f"{handover_template}\n\n"
         "You must return strict JSON only (no markdown fences, no additional commentary).\n"
-        f"Use this exact output contract: {json.dumps(output_contract)}\n\n"
-        f"{json.dumps(chain_payload)}"
+        f"Use this exact output contract: {_dumps(output_contract)}\n\n"
+        f"{_dumps(chain_payload)}"
     )
 
     started = time.perf_counter()
@@ -1031,7 +1279,7 @@ async def _run_chain_step(
             warning = detail
             source = "deterministic_fallback"
             structured = _fallback_structured_output(step_id, role, fixed_context, handoff_inputs, detail)
-            raw_text = json.dumps(structured)
+            raw_text = _dumps(structured)
             break
 
     latency_ms = int((time.perf_counter() - started) * 1000)
@@ -1055,135 +1303,6 @@ async def _run_chain_step(
     }
 
 
-async def _build_agent_insight(agent_id: str, role: str, snapshot: Dict[str, Any]) -> Dict[str, Any]:
-    runtime_agent_id, model, role_prompt = _resolve_runtime_profile(agent_id, role)
-    timeout_sec = int(os.getenv("OPENCLAW_AGENT_TIMEOUT_SECONDS", "90"))
-    execution_mode = os.getenv("OPENCLAW_EXECUTION_MODE", "remote_http").strip().lower()
-    allow_fallback = os.getenv("OPENCLAW_ALLOW_DETERMINISTIC_FALLBACK", "true").strip().lower() in {
-        "1",
-        "true",
-        "yes",
-        "on",
-    }
-
-    if runtime_agent_id == "":
-        raise HTTPException(status_code=503, detail=f"runtime_agent_mapping_missing_for_{agent_id}")
-
-    evidence = _extract_snapshot_evidence(snapshot)
-    score_breakdown = snapshot.get("score_breakdown") if isinstance(snapshot, dict) else {}
-    if not isinstance(score_breakdown, dict):
-        score_breakdown = {}
-    coefficient_items = score_breakdown.get("coefficient_contributions")
-    if not isinstance(coefficient_items, list):
-        coefficient_items = []
-
-    compact_coefficients: List[Dict[str, Any]] = []
-    sortable_coefficients: List[Tuple[float, Dict[str, Any]]] = []
-    for raw in coefficient_items:
-        if not isinstance(raw, dict):
-            continue
-        name = str(raw.get("name") or "coefficient")
-        contribution = raw.get("contribution")
-        error = raw.get("error")
-        try:
-            numeric_contribution = float(contribution)
-        except Exception:
-            numeric_contribution = 0.0
-        item = {
-            "name": name,
-            "contribution": numeric_contribution,
-            "error": error,
-        }
-        sortable_coefficients.append((abs(numeric_contribution), item))
-
-    if sortable_coefficients:
-        sortable_coefficients.sort(key=lambda pair: pair[0], reverse=True)
-        compact_coefficients = [item for _, item in sortable_coefficients[:8]]
-
-    agent_payload = {
-        "agent_id": agent_id,
-        "runtime_agent_id": runtime_agent_id,
-        "role": role,
-        "model": model,
-        "deterministic_summary": {
-            "state": snapshot.get("state"),
-            "total_score": score_breakdown.get("total_score"),
-            "state_score": score_breakdown.get("state_score"),
-            "weighted_input_score": score_breakdown.get("weighted_input_score"),
-            "rule_impact_score": score_breakdown.get("rule_impact_score"),
-            "triggered_conditions": evidence.get("triggered_conditions") or [],
-            "restructuring_actions": evidence.get("restructuring_actions") or [],
-            "top_coefficient_contributions": compact_coefficients,
-        },
-        "instructions": [
-            "Respond as this advisory agent only.",
-            "Use deterministic artifacts only; do not invent deterministic values.",
-            "Return strict JSON: {\"insight\": string}.",
-        ],
-    }
-
-    user_message = (
-        f"{role_prompt}\n\n"
-        "Use only the deterministic STRATEGOS payload below.\n"
-        "Return strict JSON with one key: insight.\n\n"
-        f"{json.dumps(agent_payload)}"
-    )
-
-    insight_text = ""
-    failure_detail = ""
-    remote_retries = _env_int("OPENCLAW_REMOTE_RETRIES", default=0, minimum=0, maximum=5)
-    attempt = 0
-
-    while True:
-        try:
-            if execution_mode in {"remote_http", "remote", "http"}:
-                insight_text = await _invoke_openclaw_remote(runtime_agent_id, user_message, timeout_sec)
-            elif execution_mode in {"local_cli", "cli"}:
-                insight_text = await _invoke_openclaw_local_cli(runtime_agent_id, user_message, timeout_sec)
-            elif execution_mode in {"deterministic_fallback", "fallback"}:
-                insight_text = _build_deterministic_fallback_insight(role, evidence)
-            else:
-                raise HTTPException(status_code=503, detail=f"unsupported_openclaw_execution_mode: {execution_mode}")
-
-            lowered_insight = (insight_text or "").lower()
-            if "api rate limit" in lowered_insight or "try again later" in lowered_insight:
-                raise HTTPException(
-                    status_code=502,
-                    detail=f"openclaw_remote_rate_limited: {runtime_agent_id}",
-                )
-            break
-        except HTTPException as exc:
-            failure_detail = str(exc.detail)
-            should_retry = (
-                execution_mode in {"remote_http", "remote", "http"}
-                and attempt < remote_retries
-                and _is_retryable_remote_error(failure_detail)
-            )
-            if should_retry:
-                attempt += 1
-                await asyncio.sleep(min(1.5 * attempt, 4.0))
-                continue
-            if allow_fallback:
-                insight_text = _build_deterministic_fallback_insight(role, evidence)
-                break
-            raise
-
-    if not insight_text:
-        if allow_fallback:
-            insight_text = _build_deterministic_fallback_insight(role, evidence)
-        else:
-            raise HTTPException(status_code=502, detail=f"openclaw_agent_missing_insight: {runtime_agent_id}")
-
-    return {
-        "agent_id": agent_id,
-        "role": role,
-        "insight": insight_text,
-        "evidence": evidence,
-        "source": execution_mode,
-        "warning": failure_detail or None,
-    }
-
-
 class SkillCreateSessionRequest(BaseModel):
     tenant_id: str
     model_version_id: str
@@ -1193,55 +1312,46 @@ class SkillCreateSessionRequest(BaseModel):
 class SkillRunEngineRequest(BaseModel):
     tenant_id: Optional[str] = None
     model_version_id: Optional[str] = None
-    session_id: Optional[str] = None
+    session_id: Optional[uuid.UUID] = None
     input: Dict[str, Any] = Field(default_factory=dict)
 
 
-def _parse_snapshot_payload(raw_snapshot: Optional[str]) -> Optional[Dict[str, Any]]:
-    if not raw_snapshot:
-        return None
-    try:
-        payload = json.loads(raw_snapshot)
-    except Exception:
-        return None
+# The session's latest snapshot as a SQL expression: the {"version", "latest"} envelope's
+# "latest", or the document itself for pre-envelope rows.
+_LATEST_SNAPSHOT = type_coerce(
+    func.coalesce(models.TransformationSession.snapshot["latest"], models.TransformationSession.snapshot),
+    models.JSONDocument,
+)
 
-    if isinstance(payload, dict) and isinstance(payload.get("latest"), dict):
-        return payload.get("latest")
-    if isinstance(payload, dict):
-        return payload
-    return None
 
+def _latest_snapshot_field(*keys: str) -> Any:
+    expr = _LATEST_SNAPSHOT
+    for key in keys:
+        expr = expr[key]
+    return expr.label(keys[-1])
 
-def _append_snapshot_history(existing_raw: Optional[str], snapshot: Dict[str, Any]) -> str:
-    existing_payload: Dict[str, Any] = {}
-    if existing_raw:
-        try:
-            existing_payload = json.loads(existing_raw)
-        except Exception:
-            existing_payload = {
-                "version": 0,
-                "latest": None,
-                "history": [],
-                "legacy_snapshot": existing_raw,
-            }
 
-    old_version = int(existing_payload.get("version") or 0)
-    new_version = old_version + 1
-    old_history = existing_payload.get("history")
-    if not isinstance(old_history, list):
-        old_history = []
+async def _fetch_latest_snapshot_fields(db: AsyncSession, sid: uuid.UUID, *fields: Any) -> Any:
+    # Only the requested sub-documents leave the database, not the whole snapshot.
+    res = await db.execute(
+        select(models.TransformationSession.snapshot.isnot(None).label("has_snapshot"), *fields)
+        .where(models.TransformationSession.id == sid)
+    )
+    row = res.first()
+    if row is None:
+        raise HTTPException(status_code=404, detail="session_not_found")
+    if not row.has_snapshot:
+        raise HTTPException(status_code=404, detail="session_snapshot_not_found")
+    return row
 
-    event = {
-        "version": new_version,
-        "created_at": datetime.now(timezone.utc).isoformat(),
-        "snapshot": snapshot,
-    }
-    packed = {
-        "version": new_version,
-        "latest": snapshot,
-        "history": [*old_history, event],
-    }
-    return json.dumps(packed)
+
+def _parse_snapshot_payload(raw_snapshot: Any) -> Optional[Dict[str, Any]]:
+    # The JSONB column hands back decoded documents; anything that is not an object
+    # (legacy text kept as a JSON string by the 0007 migration) has no snapshot.
+    if not isinstance(raw_snapshot, dict):
+        return None
+    latest = raw_snapshot.get("latest")
+    return latest if isinstance(latest, dict) else raw_snapshot
 
 
 @router.post("/advisory/skills/create_session")
@@ -1269,16 +1379,10 @@ async def skill_create_session(payload: SkillCreateSessionRequest, db: AsyncSess
 
 @router.post("/advisory/skills/run_engine")
 async def skill_run_engine(payload: SkillRunEngineRequest, db: AsyncSession = Depends(get_session)):
-    session_obj = None
-    session_uuid = None
-    if payload.session_id:
-        try:
-            session_uuid = uuid.UUID(payload.session_id)
-        except Exception:
-            raise HTTPException(status_code=400, detail="invalid_session_id")
-        session_obj = await db.get(models.TransformationSession, session_uuid)
-        if session_obj is None:
-            raise HTTPException(status_code=404, detail="session_not_found")
+    session_uuid = payload.session_id
+    session_key = str(session_uuid) if session_uuid else None
+    if session_uuid and not await session_exists(db, session_uuid):
+        raise HTTPException(status_code=404, detail="session_not_found")
 
     snapshot = await run_deterministic_engine(
         db,
@@ -1305,27 +1409,19 @@ async def skill_run_engine(payload: SkillRunEngineRequest, db: AsyncSession = De
             tenant_id=tenant_uuid,
             actor="openclaw_skill",
             action="OPENCLAW_RUN_ENGINE",
-            payload=json.dumps(
-                {
-                    "model_version_id": payload.model_version_id,
-                    "session_id": payload.session_id,
-                    "input": payload.input,
-                    "state": snapshot.get("state") if isinstance(snapshot, dict) else None,
-                    "total_score": (snapshot.get("score_breakdown") or {}).get("total_score") if isinstance(snapshot, dict) else None,
-                    "error": snapshot.get("error") if isinstance(snapshot, dict) else None,
-                }
-            ),
+            payload={
+                "model_version_id": payload.model_version_id,
+                "session_id": session_key,
+                "input": payload.input,
+                "state": snapshot.get("state") if isinstance(snapshot, dict) else None,
+                "total_score": (snapshot.get("score_breakdown") or {}).get("total_score") if isinstance(snapshot, dict) else None,
+                "error": snapshot.get("error") if isinstance(snapshot, dict) else None,
+            },
         )
     )
 
-    if payload.session_id and isinstance(snapshot, dict) and not snapshot.get("error"):
-        packed = _append_snapshot_history(session_obj.snapshot if session_obj else None, snapshot)
-        await db.execute(
-            models.TransformationSession.__table__
-            .update()
-            .where(models.TransformationSession.id == session_uuid)
-            .values(snapshot=packed)
-        )
+    if session_uuid and isinstance(snapshot, dict) and not snapshot.get("error"):
+        await record_snapshot(db, session_uuid, snapshot)
 
     await db.commit()
 
@@ -1334,7 +1430,7 @@ async def skill_run_engine(payload: SkillRunEngineRequest, db: AsyncSession = De
 
     return format_response(
         {
-            "session_id": payload.session_id,
+            "session_id": session_key,
             "state": snapshot.get("state") if isinstance(snapshot, dict) else None,
             "total_score": (snapshot.get("score_breakdown") or {}).get("total_score") if isinstance(snapshot, dict) else None,
             "snapshot": snapshot,
@@ -1343,85 +1439,56 @@ async def skill_run_engine(payload: SkillRunEngineRequest, db: AsyncSession = De
 
 
 @router.get("/advisory/skills/state/{session_id}")
-async def skill_fetch_state(session_id: str, db: AsyncSession = Depends(get_session)):
-    try:
-        sid = uuid.UUID(session_id)
-    except Exception:
-        raise HTTPException(status_code=400, detail="invalid_session_id")
-
-    session_obj = await db.get(models.TransformationSession, sid)
-    if session_obj is None:
-        raise HTTPException(status_code=404, detail="session_not_found")
+async def skill_fetch_state(session_id: uuid.UUID, db: AsyncSession = Depends(get_session)):
 
-    latest = _parse_snapshot_payload(session_obj.snapshot)
-    if not latest:
-        raise HTTPException(status_code=404, detail="session_snapshot_not_found")
+    row = await _fetch_latest_snapshot_fields(
+        db,
+        session_id,
+        models.TransformationSession.latest_state.label("state"),
+        models.TransformationSession.latest_total_score.label("total_score"),
+    )
 
     return format_response(
         {
-            "session_id": session_id,
-            "state": latest.get("state"),
-            "total_score": (latest.get("score_breakdown") or {}).get("total_score"),
+            "session_id": str(session_id),
+            "state": row.state,
+            "total_score": row.total_score,
         }
     )
 
 
 @router.get("/advisory/skills/contributions/{session_id}")
-async def skill_fetch_contributions(session_id: str, db: AsyncSession = Depends(get_session)):
-    try:
-        sid = uuid.UUID(session_id)
-    except Exception:
-        raise HTTPException(status_code=400, detail="invalid_session_id")
+async def skill_fetch_contributions(session_id: uuid.UUID, db: AsyncSession = Depends(get_session)):
 
-    session_obj = await db.get(models.TransformationSession, sid)
-    if session_obj is None:
-        raise HTTPException(status_code=404, detail="session_not_found")
-
-    latest = _parse_snapshot_payload(session_obj.snapshot)
-    if not latest:
-        raise HTTPException(status_code=404, detail="session_snapshot_not_found")
+    row = await _fetch_latest_snapshot_fields(db, session_id, _latest_snapshot_field("contributions"), _latest_snapshot_field("scores"))
 
     return format_response(
         {
-            "session_id": session_id,
-            "contributions": latest.get("contributions") or [],
-            "scores": latest.get("scores") or {},
+            "session_id": str(session_id),
+            "contributions": row.contributions or [],
+            "scores": row.scores or {},
         }
     )
 
 
 @router.get("/advisory/skills/restructuring/{session_id}")
-async def skill_fetch_restructuring(session_id: str, db: AsyncSession = Depends(get_session)):
-    try:
-        sid = uuid.UUID(session_id)
-    except Exception:
-        raise HTTPException(status_code=400, detail="invalid_session_id")
+async def skill_fetch_restructuring(session_id: uuid.UUID, db: AsyncSession = Depends(get_session)):
 
-    session_obj = await db.get(models.TransformationSession, sid)
-    if session_obj is None:
-        raise HTTPException(status_code=404, detail="session_not_found")
-
-    latest = _parse_snapshot_payload(session_obj.snapshot)
-    if not latest:
-        raise HTTPException(status_code=404, detail="session_snapshot_not_found")
+    row = await _fetch_latest_snapshot_fields(db, session_id, _latest_snapshot_field("state"), _latest_snapshot_field("restructuring_actions"))
 
     return format_response(
         {
-            "session_id": session_id,
-            "state": latest.get("state"),
-            "restructuring_actions": latest.get("restructuring_actions") or [],
+            "session_id": str(session_id),
+            "state": row.state,
+            "restructuring_actions": row.restructuring_actions or [],
         }
     )
 
 
 @router.get("/advisory/skills/board_insights/{session_id}")
-async def skill_board_insights(session_id: str, db: AsyncSession = Depends(get_session)):
-    try:
-        sid = uuid.UUID(session_id)
-    except Exception:
-        raise HTTPException(status_code=400, detail="invalid_session_id")
-
-    session_obj = await db.get(models.TransformationSession, sid)
+async def skill_board_insights(session_id: uuid.UUID, db: AsyncSession = Depends(get_session)):
+    session_key = str(session_id)
+    session_obj = await db.get(models.TransformationSession, session_id)
     if session_obj is None:
         raise HTTPException(status_code=404, detail="session_not_found")
 
@@ -1429,21 +1496,37 @@ async def skill_board_insights(session_id: str, db: AsyncSession = Depends(get_s
     if not latest:
         raise HTTPException(status_code=404, detail="session_snapshot_not_found")
 
-    intake_ctx = await _load_session_intake_context(session_id, db)
+    intake_ctx = await _load_session_intake_context(session_key, db)
     if not intake_ctx.get("ceo_request"):
         intake_ctx["ceo_request"] = str(session_obj.name or "")
-    intake_ctx["session_id"] = session_id
+    intake_ctx["session_id"] = session_key
+    # End the read transaction so the pooled connection is not held idle through the
+    # agent chain (minutes with remote agents); the audit insert below checks one out again.
+    await db.commit()
     fixed_context = _build_fixed_strategos_context(latest, intake_ctx)
     trace_id = str(uuid.uuid4())
     started = time.perf_counter()
 
+    # Resolve every step's runtime profile up front so a missing agent mapping fails
+    # the request before any agent has been called, not minutes into the chain.
     roles = _board_role_lookup()
-    history: List[Dict[str, Any]] = []
-    for idx, step_id in enumerate(AGENT_CHAIN_ORDER, start=1):
+    chain_steps: List[Tuple[str, str, Tuple[str, str, str]]] = []
+    for step_id in AGENT_CHAIN_ORDER:
         role = roles.get(step_id) or step_id.replace("_", " ")
+        profile = _resolve_runtime_profile(step_id, role)
+        if profile[0] == "":
+            raise HTTPException(status_code=503, detail=f"runtime_agent_mapping_missing_for_{step_id}")
+        chain_steps.append((step_id, role, profile))
+
+    history: List[Dict[str, Any]] = []
+    # Deliberately sequential: each step's handoff inputs (_build_step_inputs) read
+    # the previous step's output, so AGENT_CHAIN_ORDER is a strict dependency chain
+    # and there are no independent agent calls to overlap.
+    for idx, (step_id, role, profile) in enumerate(chain_steps, start=1):
         step_result = await _run_chain_step(
             step_id=step_id,
             role=role,
+            profile=profile,
             step_index=idx,
             ceo_request=str(intake_ctx.get("ceo_request") or ""),
             snapshot=latest,
@@ -1471,25 +1554,23 @@ async def skill_board_insights(session_id: str, db: AsyncSession = Depends(get_s
             tenant_id=session_obj.tenant_id,
             actor="advisory_chain",
             action="OPENCLAW_CHAIN_RUN",
-            payload=json.dumps(
-                {
-                    "session_id": session_id,
-                    "trace_id": trace_id,
-                    "flow_version": FLOW_VERSION,
-                    "state": latest.get("state"),
-                    "steps": len(history),
-                    "fallback_count": fallback_count,
-                    "warning_count": warning_count,
-                    "total_latency_ms": total_latency_ms,
-                }
-            ),
+            payload={
+                "session_id": session_key,
+                "trace_id": trace_id,
+                "flow_version": FLOW_VERSION,
+                "state": latest.get("state"),
+                "steps": len(history),
+                "fallback_count": fallback_count,
+                "warning_count": warning_count,
+                "total_latency_ms": total_latency_ms,
+            },
         )
     )
     await db.commit()
 
     return format_response(
         {
-            "session_id": session_id,
+            "session_id": session_key,
             "state": latest.get("state"),
             "insights": history,
             "executive_memo": executive_memo,
@@ -1511,7 +1592,13 @@ async def skill_list_model_versions(
     active_only: bool = Query(default=True),
     db: AsyncSession = Depends(get_session),
 ):
-    q = select(models.ModelVersion)
+    q = select(
+        models.ModelVersion.id,
+        models.ModelVersion.tenant_id,
+        models.ModelVersion.name,
+        models.ModelVersion.description,
+        models.ModelVersion.is_active,
+    )
     if tenant_id:
         try:
             tid = uuid.UUID(tenant_id)
@@ -1519,10 +1606,10 @@ async def skill_list_model_versions(
             raise HTTPException(status_code=400, detail="invalid_tenant_id")
         q = q.where(models.ModelVersion.tenant_id == tid)
     if active_only:
-        q = q.where(models.ModelVersion.is_active == True)
+        q = q.where(models.ModelVersion.is_active)
 
     res = await db.execute(q)
-    rows = res.scalars().all()
+    rows = res.all()
     return format_response(
         {
             "model_versions": [
@@ -1550,35 +1637,54 @@ async def skill_show_rules(
     except Exception:
         raise HTTPException(status_code=400, detail="invalid_model_version_id")
 
-    q = select(models.Rule).where(models.Rule.model_version_id == mv)
+    q = select(
+        models.Rule.id,
+        models.Rule.name,
+        models.Rule.description,
+        models.Rule.is_active,
+    ).where(models.Rule.model_version_id == mv)
     if active_only:
-        q = q.where(models.Rule.is_active == True)
+        q = q.where(models.Rule.is_active)
     res = await db.execute(q)
-    rules = res.scalars().all()
+    rules = res.all()
+
+    # Rule has no ORM relationships, so batch the children with IN (...) and group here;
+    # plain column rows keep the three queries free of ORM hydration.
+    conditions_by_rule: Dict[uuid.UUID, List[Dict[str, Any]]] = defaultdict(list)
+    impacts_by_rule: Dict[uuid.UUID, List[Dict[str, Any]]] = defaultdict(list)
+    rule_ids = [rule.id for rule in rules]
+    if rule_ids:
+        cond_res = await db.execute(
+            select(
+                models.RuleCondition.rule_id,
+                models.RuleCondition.id,
+                models.RuleCondition.expression,
+                models.RuleCondition.is_active,
+            ).where(models.RuleCondition.rule_id.in_(rule_ids))
+        )
+        for rule_id, cid, expression, is_active in cond_res.all():
+            conditions_by_rule[rule_id].append({"id": str(cid), "expression": expression, "is_active": bool(is_active)})
+        imp_res = await db.execute(
+            select(
+                models.RuleImpact.rule_id,
+                models.RuleImpact.id,
+                models.RuleImpact.impact,
+                models.RuleImpact.is_active,
+            ).where(models.RuleImpact.rule_id.in_(rule_ids))
+        )
+        for rule_id, iid, impact, is_active in imp_res.all():
+            impacts_by_rule[rule_id].append({"id": str(iid), "impact": impact, "is_active": bool(is_active)})
 
     out: List[Dict[str, Any]] = []
     for rule in rules:
-        cond_q = select(models.RuleCondition).where(models.RuleCondition.rule_id == rule.id)
-        imp_q = select(models.RuleImpact).where(models.RuleImpact.rule_id == rule.id)
-        cond_res = await db.execute(cond_q)
-        imp_res = await db.execute(imp_q)
-        conditions = cond_res.scalars().all()
-        impacts = imp_res.scalars().all()
-
         out.append(
             {
                 "id": str(rule.id),
                 "name": rule.name,
                 "description": rule.description,
                 "is_active": bool(rule.is_active),
-                "conditions": [
-                    {"id": str(c.id), "expression": c.expression, "is_active": bool(c.is_active)}
-                    for c in conditions
-                ],
-                "impacts": [
-                    {"id": str(i.id), "impact": i.impact, "is_active": bool(i.is_active)}
-                    for i in impacts
-                ],
+                "conditions": conditions_by_rule.get(rule.id, []),
+                "impacts": impacts_by_rule.get(rule.id, []),
             }
         )
 
@@ -4,12 +4,11 @@ from typing import Optional, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import insert
 import uuid
-import json
-from datetime import datetime, timezone
 
 from app.core.response import format_response
 from app.db.session import get_session
 from app.services.engine import run_deterministic_engine
+from app.services.snapshots import record_snapshot, session_exists
 from app.db import models
 
 router = APIRouter()
@@ -18,7 +17,7 @@ router = APIRouter()
 class EngineRunRequest(BaseModel):
     tenant_id: Optional[str] = None
     model_version_id: Optional[str] = None
-    session_id: Optional[str] = None
+    session_id: Optional[uuid.UUID] = None
     input: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Input variables for rule evaluation")
 
 
@@ -36,9 +35,11 @@ class EngineSnapshot(BaseModel):
 
 @router.post(
     "/engine/run",
-    response_model=EngineSnapshot,
+    # EngineSnapshot only documents the response: as a response_model it would
+    # re-validate and copy the whole snapshot the engine just built on every run.
     responses={
         200: {
+            "model": EngineSnapshot,
             "description": "Engine snapshot",
             "content": {
                 "application/json": {
@@ -64,18 +65,10 @@ class EngineSnapshot(BaseModel):
     },
 )
 async def run_engine(req: EngineRunRequest, db: AsyncSession = Depends(get_session)):
-    # Validate basic inputs
-    session_obj = None
-    session_uuid = None
-    if req.session_id:
-        try:
-            session_uuid = uuid.UUID(str(req.session_id))
-        except Exception:
-            raise HTTPException(status_code=400, detail="invalid_session_id")
-        # ensure session exists
-        session_obj = await db.get(models.TransformationSession, session_uuid)
-        if session_obj is None:
-            raise HTTPException(status_code=404, detail="session_not_found")
+    # session_id arrives already parsed by the request model; ensure the session exists
+    session_uuid = req.session_id
+    if session_uuid and not await session_exists(db, session_uuid):
+        raise HTTPException(status_code=404, detail="session_not_found")
 
     snapshot = await run_deterministic_engine(db, model_version_id=req.model_version_id, input_data=req.input)
 
@@ -95,7 +88,7 @@ async def run_engine(req: EngineRunRequest, db: AsyncSession = Depends(get_sessi
 
     audit_payload = {
         "model_version_id": req.model_version_id,
-        "session_id": req.session_id,
+        "session_id": str(session_uuid) if session_uuid else None,
         "input": req.input or {},
         "state": snapshot.get("state") if isinstance(snapshot, dict) else None,
         "total_score": (snapshot.get("score_breakdown") or {}).get("total_score") if isinstance(snapshot, dict) else None,
@@ -106,51 +99,14 @@ async def run_engine(req: EngineRunRequest, db: AsyncSession = Depends(get_sessi
             tenant_id=tenant_uuid,
             actor="engine_api",
             action="ENGINE_RUN",
-            payload=json.dumps(audit_payload),
+            payload=audit_payload,
         )
     )
 
     # Persist versioned snapshot history if session provided
-    if req.session_id and isinstance(snapshot, dict) and not snapshot.get("error"):
-        existing_payload: Dict[str, Any] = {}
-        if session_obj and session_obj.snapshot:
-            try:
-                existing_payload = json.loads(session_obj.snapshot)
-            except Exception:
-                existing_payload = {
-                    "version": 0,
-                    "latest": None,
-                    "history": [],
-                    "legacy_snapshot": session_obj.snapshot,
-                }
-
-        old_version = int(existing_payload.get("version") or 0)
-        new_version = old_version + 1
-        old_history = existing_payload.get("history") or []
-        if not isinstance(old_history, list):
-            old_history = []
-
-        event = {
-            "version": new_version,
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "snapshot": snapshot,
-        }
-        packed = {
-            "version": new_version,
-            "latest": snapshot,
-            "history": [*old_history, event],
-        }
-
-        stmt = (
-            models.TransformationSession.__table__
-            .update()
-            .where(models.TransformationSession.id == session_uuid)
-            .values(snapshot=json.dumps(packed))
-        )
-        await db.execute(stmt)
-        await db.commit()
-    else:
-        await db.commit()
+    if session_uuid and isinstance(snapshot, dict) and not snapshot.get("error"):
+        await record_snapshot(db, session_uuid, snapshot)
+    await db.commit()
 
     if snapshot.get("error"):
         raise HTTPException(status_code=400, detail=snapshot)
@@ -11,18 +11,20 @@ works without any external LLM dependency.
 
 import re
 import uuid
-import json
+from functools import lru_cache
 from typing import Dict, Any, Optional, List, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
-from sqlalchemy import insert, select
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.response import format_response
 from app.db import models
 from app.db.session import get_session
+from app.services.active_model import resolve_active_model_version
 from app.services.engine import run_deterministic_engine
+from app.services.snapshots import create_session_with_snapshot
 
 router = APIRouter()
 
@@ -31,41 +33,46 @@ router = APIRouter()
 # Each pattern maps to a metric name and a normaliser.
 
 _PATTERNS: List[Tuple[str, str, float]] = [
+    # Backtracking is kept linear in the input: patterns that open with the number
+    # only start at the beginning of a digit run (lookbehind), and adjacent optional
+    # whitespace runs are possessive (\s*+) since nothing after them can start with
+    # whitespace. Without both, a few KB of digits or spaces cost seconds of CPU on
+    # the event loop. The same \s*+ rule applies to the tables below.
     # revenue / cost are normalized to millions
-    (r"(?:\$\s*)?([\d,.]+)\s*(?:bn|billion|b)\b(?:[^\.\n]{0,40})?(?:revenue|turnover|sales)", "revenue", 1000.0),
-    (r"(?:\$\s*)?([\d,.]+)\s*(?:m|million)\b(?:[^\.\n]{0,40})?(?:revenue|turnover|sales)", "revenue", 1.0),
-    (r"(?:revenue|turnover|sales)\s*(?:of|at|around|≈|~|is|=|:)?\s*\$?\s*([\d,.]+)\s*(bn|billion|b|m|million)?", "revenue", 1.0),
+    (r"(?:\$\s*+)?(?<![\d,.])([\d,.]+)\s*(?:bn|billion|b)\b(?:[^\.\n]{0,40})?(?:revenue|turnover|sales)", "revenue", 1000.0),
+    (r"(?:\$\s*+)?(?<![\d,.])([\d,.]+)\s*(?:m|million)\b(?:[^\.\n]{0,40})?(?:revenue|turnover|sales)", "revenue", 1.0),
+    (r"(?:revenue|turnover|sales)\s*+(?:of|at|around|≈|~|is|=|:)?\s*+\$?\s*+([\d,.]+)\s*(bn|billion|b|m|million)?", "revenue", 1.0),
 
-    (r"(?:\$\s*)?([\d,.]+)\s*(?:bn|billion|b)\s*(?:annual\s+|total\s+|operating\s+)?(?:costs?|opex|expenditure|capex)\b", "cost", 1000.0),
-    (r"(?:\$\s*)?([\d,.]+)\s*(?:m|million)\s*(?:annual\s+|total\s+|operating\s+)?(?:costs?|opex|expenditure|capex)\b", "cost", 1.0),
-    (r"(?:cost|opex|expenditure|capex|operating\s+costs?)\s*(?:of|at|around|≈|~|is|=|:)?\s*\$?\s*([\d,.]+)\s*(bn|billion|b|m|million)?", "cost", 1.0),
+    (r"(?:\$\s*+)?(?<![\d,.])([\d,.]+)\s*(?:bn|billion|b)\s*(?:annual\s+|total\s+|operating\s+)?(?:costs?|opex|expenditure|capex)\b", "cost", 1000.0),
+    (r"(?:\$\s*+)?(?<![\d,.])([\d,.]+)\s*(?:m|million)\s*(?:annual\s+|total\s+|operating\s+)?(?:costs?|opex|expenditure|capex)\b", "cost", 1.0),
+    (r"(?:cost|opex|expenditure|capex|operating\s+costs?)\s*+(?:of|at|around|≈|~|is|=|:)?\s*+\$?\s*+([\d,.]+)\s*(bn|billion|b|m|million)?", "cost", 1.0),
 
     # profitability / debt
-    (r"([\d,.]+)\s*%\s*(?:margin|ebitda|operating\s+margin)", "margin", 0.01),
-    (r"(?:margin|ebitda)\s*(?:of|at|around|≈|~|is|=|:)?\s*([\d,.]+)\s*%", "margin", 0.01),
-    (r"(?:margin|ebitda)\s*(?:of|at|around|≈|~|is|=|:)?\s*(0\.\d+)", "margin", 1.0),
+    (r"(?<![\d,.])([\d,.]+)\s*%\s*(?:margin|ebitda|operating\s+margin)", "margin", 0.01),
+    (r"(?:margin|ebitda)\s*+(?:of|at|around|≈|~|is|=|:)?\s*+([\d,.]+)\s*%", "margin", 0.01),
+    (r"(?:margin|ebitda)\s*+(?:of|at|around|≈|~|is|=|:)?\s*+(0\.\d+)", "margin", 1.0),
 
-    (r"(?:technical?\s*d(?:ebt|et)|tech\s*d(?:ebt|et)|legacy\s*d(?:ebt|et))\s*(?:of|at|around|≈|~|score|is|=|:)?\s*([\d,.]+)\s*%?", "technical_debt", 1.0),
-    (r"([\d,.]+)\s*%?\s*(?:technical?\s*d(?:ebt|et)|tech\s*d(?:ebt|et)|legacy\s*d(?:ebt|et))", "technical_debt", 1.0),
+    (r"(?:technical?\s*+d(?:ebt|et)|tech\s*+d(?:ebt|et)|legacy\s*+d(?:ebt|et))\s*+(?:of|at|around|≈|~|score|is|=|:)?\s*+([\d,.]+)\s*%?", "technical_debt", 1.0),
+    (r"(?<![\d,.])([\d,.]+)\s*+%?\s*+(?:technical?\s*+d(?:ebt|et)|tech\s*+d(?:ebt|et)|legacy\s*+d(?:ebt|et))", "technical_debt", 1.0),
 
     # growth / customer / ops / governance
-    (r"(?:revenue\s+growth|growth|yoy\s+growth)\s*(?:of|at|around|≈|~|is|=|:)?\s*([-\d,.]+)\s*%", "revenue_growth_yoy_pct", 1.0),
-    (r"([-\d,.]+)\s*%\s*(?:revenue\s+growth|growth)", "revenue_growth_yoy_pct", 1.0),
-    (r"(?:churn|customer\s+churn)\s*(?:of|at|around|≈|~|is|=|:)?\s*([\d,.]+)\s*%", "customer_churn_pct", 1.0),
-    (r"(?:nps|net\s+promoter\s+score)\s*(?:of|at|around|≈|~|is|=|:)?\s*([-\d,.]+)", "net_promoter_score", 1.0),
-    (r"(?:cloud\s+adoption)\s*(?:of|at|around|≈|~|is|=|:)?\s*([\d,.]+)\s*%", "cloud_adoption_pct", 1.0),
-    (r"(?:release\s+frequency)\s*(?:of|at|around|≈|~|is|=|:)?\s*([\d,.]+)", "release_frequency_per_month", 1.0),
-    (r"(?:lead\s*time|lead\s*time\s*days)\s*(?:of|at|around|≈|~|is|=|:)?\s*([\d,.]+)", "lead_time_days", 1.0),
-    (r"(?:change\s+failure\s+rate)\s*(?:of|at|around|≈|~|is|=|:)?\s*([\d,.]+)\s*%", "change_failure_rate_pct", 1.0),
-    (r"(?:p1\s+incidents?)\s*(?:of|at|around|≈|~|is|=|:)?\s*([\d,.]+)", "p1_incidents_per_month", 1.0),
-    (r"(?:automation\s+coverage)\s*(?:of|at|around|≈|~|is|=|:)?\s*([\d,.]+)\s*%", "automation_coverage_pct", 1.0),
-    (r"(?:high\s+cyber\s+findings|cyber\s+findings)\s*(?:of|at|around|≈|~|is|=|:)?\s*([\d,.]+)", "cyber_findings_open_high", 1.0),
-    (r"(?:regulatory\s+findings)\s*(?:of|at|around|≈|~|is|=|:)?\s*([\d,.]+)", "regulatory_findings_open", 1.0),
-    (r"(?:critical\s+role\s+attrition|attrition)\s*(?:of|at|around|≈|~|is|=|:)?\s*([\d,.]+)\s*%", "critical_role_attrition_pct", 1.0),
-    (r"(?:vendor\s+concentration)\s*(?:of|at|around|≈|~|is|=|:)?\s*([\d,.]+)\s*%", "vendor_concentration_pct", 1.0),
-    (r"(?:top\s+customer\s+concentration|customer\s+concentration)\s*(?:of|at|around|≈|~|is|=|:)?\s*([\d,.]+)\s*%", "top_customer_concentration_pct", 1.0),
-    (r"(?:digital\s+capex(?:\s+as\s+)?(?:%|percent)\s+of\s+revenue)\s*(?:of|at|around|≈|~|is|=|:)?\s*([\d,.]+)", "digital_capex_pct_of_revenue", 1.0),
-    (r"(?:cash\s+conversion\s+cycle)\s*(?:of|at|around|≈|~|is|=|:)?\s*([\d,.]+)", "cash_conversion_cycle_days", 1.0),
+    (r"(?:revenue\s+growth|growth|yoy\s+growth)\s*+(?:of|at|around|≈|~|is|=|:)?\s*+([-\d,.]+)\s*%", "revenue_growth_yoy_pct", 1.0),
+    (r"(?<![-\d,.])([-\d,.]+)\s*%\s*(?:revenue\s+growth|growth)", "revenue_growth_yoy_pct", 1.0),
+    (r"(?:churn|customer\s+churn)\s*+(?:of|at|around|≈|~|is|=|:)?\s*+([\d,.]+)\s*%", "customer_churn_pct", 1.0),
+    (r"(?:nps|net\s+promoter\s+score)\s*+(?:of|at|around|≈|~|is|=|:)?\s*+([-\d,.]+)", "net_promoter_score", 1.0),
+    (r"(?:cloud\s+adoption)\s*+(?:of|at|around|≈|~|is|=|:)?\s*+([\d,.]+)\s*%", "cloud_adoption_pct", 1.0),
+    (r"(?:release\s+frequency)\s*+(?:of|at|around|≈|~|is|=|:)?\s*+([\d,.]+)", "release_frequency_per_month", 1.0),
+    (r"(?:lead\s*+time|lead\s*+time\s*+days)\s*+(?:of|at|around|≈|~|is|=|:)?\s*+([\d,.]+)", "lead_time_days", 1.0),
+    (r"(?:change\s+failure\s+rate)\s*+(?:of|at|around|≈|~|is|=|:)?\s*+([\d,.]+)\s*%", "change_failure_rate_pct", 1.0),
+    (r"(?:p1\s+incidents?)\s*+(?:of|at|around|≈|~|is|=|:)?\s*+([\d,.]+)", "p1_incidents_per_month", 1.0),
+    (r"(?:automation\s+coverage)\s*+(?:of|at|around|≈|~|is|=|:)?\s*+([\d,.]+)\s*%", "automation_coverage_pct", 1.0),
+    (r"(?:high\s+cyber\s+findings|cyber\s+findings)\s*+(?:of|at|around|≈|~|is|=|:)?\s*+([\d,.]+)", "cyber_findings_open_high", 1.0),
+    (r"(?:regulatory\s+findings)\s*+(?:of|at|around|≈|~|is|=|:)?\s*+([\d,.]+)", "regulatory_findings_open", 1.0),
+    (r"(?:critical\s+role\s+attrition|attrition)\s*+(?:of|at|around|≈|~|is|=|:)?\s*+([\d,.]+)\s*%", "critical_role_attrition_pct", 1.0),
+    (r"(?:vendor\s+concentration)\s*+(?:of|at|around|≈|~|is|=|:)?\s*+([\d,.]+)\s*%", "vendor_concentration_pct", 1.0),
+    (r"(?:top\s+customer\s+concentration|customer\s+concentration)\s*+(?:of|at|around|≈|~|is|=|:)?\s*+([\d,.]+)\s*%", "top_customer_concentration_pct", 1.0),
+    (r"(?:digital\s+capex(?:\s+as\s+)?(?:%|percent)\s+of\s+revenue)\s*+(?:of|at|around|≈|~|is|=|:)?\s*+([\d,.]+)", "digital_capex_pct_of_revenue", 1.0),
+    (r"(?:cash\s+conversion\s+cycle)\s*+(?:of|at|around|≈|~|is|=|:)?\s*+([\d,.]+)", "cash_conversion_cycle_days", 1.0),
 ]
 
 _PROFILE_DEFAULTS: Dict[str, Dict[str, float]] = {
@@ -153,16 +160,33 @@ _PROFILE_ALIASES = {
     "raw": "none",
 }
 
+# Every metric extraction can produce; each profile defines all of them.
+_KNOWN_METRICS = frozenset(_PROFILE_DEFAULTS["balanced"])
+
 _STRESSED_HINTS = ["critical", "crisis", "distress", "severe", "high debt", "legacy burden", "declining", "pressure"]
 _GROWTH_HINTS = ["high growth", "strong growth", "healthy", "stable", "modern", "scaling", "expanding"]
 _NO_DEFAULT_HINTS = ["no defaults", "no assumptions", "raw input only", "as-is"]
 
+# All hint phrases in one alternation, one named group per profile, so the text is
+# scanned once instead of once per phrase. No phrase is a prefix of another, and
+# the lookahead lets every occurrence be seen even where phrases overlap. Hints
+# must start a word, so "unstable" or "unhealthy" do not read as growth, but may
+# take a suffix, so "distressed", "pressures" and "modernizing" still count.
+_PROFILE_HINT_RE = re.compile(
+    r"(?=\b(?:"
+    + "|".join(
+        f"(?P<{profile}>{'|'.join(re.escape(h) for h in hints)})"
+        for profile, hints in (("none", _NO_DEFAULT_HINTS), ("stressed", _STRESSED_HINTS), ("growth", _GROWTH_HINTS))
+    )
+    + "))"
+)
+
 _TEXTUAL_OVERRIDES: Dict[str, List[Tuple[str, float]]] = {
     "technical_debt": [
-        (r"very\s+high\s+(?:technical\s+)?d(?:ebt|et)|massive\s+tech\s+d(?:ebt|et)|legacy\s+stack|(?:technical\s+|tech\s+)?d(?:ebt|et)\s*(?:is|at|around|:)?\s*very\s+high", 85.0),
-        (r"high\s+(?:technical\s+)?d(?:ebt|et)|significant\s+tech\s+d(?:ebt|et)|(?:technical\s+|tech\s+)?d(?:ebt|et)\s*(?:is|at|around|:)?\s*high", 72.0),
-        (r"moderate\s+(?:technical\s+)?d(?:ebt|et)|some\s+tech\s+d(?:ebt|et)|(?:technical\s+|tech\s+)?d(?:ebt|et)\s*(?:is|at|around|:)?\s*moderate", 50.0),
-        (r"low\s+(?:technical\s+)?d(?:ebt|et)|minimal\s+d(?:ebt|et)|clean\s+stack|(?:technical\s+|tech\s+)?d(?:ebt|et)\s*(?:is|at|around|:)?\s*low", 25.0),
+        (r"very\s+high\s+(?:technical\s+)?d(?:ebt|et)|massive\s+tech\s+d(?:ebt|et)|legacy\s+stack|(?:technical\s+|tech\s+)?d(?:ebt|et)\s*+(?:is|at|around|:)?\s*+very\s+high", 85.0),
+        (r"high\s+(?:technical\s+)?d(?:ebt|et)|significant\s+tech\s+d(?:ebt|et)|(?:technical\s+|tech\s+)?d(?:ebt|et)\s*+(?:is|at|around|:)?\s*+high", 72.0),
+        (r"moderate\s+(?:technical\s+)?d(?:ebt|et)|some\s+tech\s+d(?:ebt|et)|(?:technical\s+|tech\s+)?d(?:ebt|et)\s*+(?:is|at|around|:)?\s*+moderate", 50.0),
+        (r"low\s+(?:technical\s+)?d(?:ebt|et)|minimal\s+d(?:ebt|et)|clean\s+stack|(?:technical\s+|tech\s+)?d(?:ebt|et)\s*+(?:is|at|around|:)?\s*+low", 25.0),
     ],
     "margin": [
         (r"thin\s+margin|wafer[-\s]?thin|barely\s+profitable|break[-\s]?even", 0.07),
@@ -179,28 +203,67 @@ _TEXTUAL_OVERRIDES: Dict[str, List[Tuple[str, float]]] = {
 }
 
 _EXPLICIT_LABEL_PATTERNS: List[Tuple[str, str]] = [
-    (r"\brevenue\s*[:=]\s*\$?\s*([\d,.]+)\s*(m|million|bn|billion|b)?\b", "revenue"),
-    (r"\b(?:operating\s+)?costs?\s*[:=]\s*\$?\s*([\d,.]+)\s*(m|million|bn|billion|b)?\b", "cost"),
-    (r"\b(?:margin|operating\s+margin)\s*[:=]\s*([\d,.]+)\s*%?\b", "margin"),
-    (r"\b(?:technical\s+debt|tech\s+debt)\s*[:=]\s*([\d,.]+)\s*%?\b", "technical_debt"),
-    (r"\b(?:revenue\s+growth|growth|yoy\s+growth)\s*[:=]\s*([-\d,.]+)\s*%?\b", "revenue_growth_yoy_pct"),
-    (r"\b(?:customer\s+churn|churn)\s*[:=]\s*([\d,.]+)\s*%?\b", "customer_churn_pct"),
-    (r"\b(?:nps|net\s+promoter\s+score)\s*[:=]\s*([-\d,.]+)\b", "net_promoter_score"),
-    (r"\bcloud\s+adoption\s*[:=]\s*([\d,.]+)\s*%?\b", "cloud_adoption_pct"),
-    (r"\brelease\s+frequency\s*[:=]\s*([\d,.]+)\b", "release_frequency_per_month"),
-    (r"\blead\s*time(?:\s*days)?\s*[:=]\s*([\d,.]+)\b", "lead_time_days"),
-    (r"\bchange\s+failure\s+rate\s*[:=]\s*([\d,.]+)\s*%?\b", "change_failure_rate_pct"),
-    (r"\bp1\s+incidents?\s*[:=]\s*([\d,.]+)\b", "p1_incidents_per_month"),
-    (r"\bautomation\s+coverage\s*[:=]\s*([\d,.]+)\s*%?\b", "automation_coverage_pct"),
-    (r"\b(?:high\s+)?cyber\s+findings\s*[:=]\s*([\d,.]+)\b", "cyber_findings_open_high"),
-    (r"\bregulatory\s+findings\s*[:=]\s*([\d,.]+)\b", "regulatory_findings_open"),
-    (r"\b(?:critical\s+role\s+)?attrition\s*[:=]\s*([\d,.]+)\s*%?\b", "critical_role_attrition_pct"),
-    (r"\bvendor\s+concentration\s*[:=]\s*([\d,.]+)\s*%?\b", "vendor_concentration_pct"),
-    (r"\b(?:top\s+customer\s+)?customer\s+concentration\s*[:=]\s*([\d,.]+)\s*%?\b", "top_customer_concentration_pct"),
-    (r"\bdigital\s+capex(?:\s+as\s+%?\s+of\s+revenue)?\s*[:=]\s*([\d,.]+)\s*%?\b", "digital_capex_pct_of_revenue"),
-    (r"\bcash\s+conversion\s+cycle\s*[:=]\s*([\d,.]+)\b", "cash_conversion_cycle_days"),
+    (r"\brevenue\s*+[:=]\s*+\$?\s*+([\d,.]+)\s*(m|million|bn|billion|b)?\b", "revenue"),
+    (r"\b(?:operating\s+)?costs?\s*+[:=]\s*+\$?\s*+([\d,.]+)\s*(m|million|bn|billion|b)?\b", "cost"),
+    (r"\b(?:margin|operating\s+margin)\s*+[:=]\s*+([\d,.]+)\s*%?\b", "margin"),
+    (r"\b(?:technical\s+debt|tech\s+debt)\s*+[:=]\s*+([\d,.]+)\s*%?\b", "technical_debt"),
+    (r"\b(?:revenue\s+growth|growth|yoy\s+growth)\s*+[:=]\s*+([-\d,.]+)\s*%?\b", "revenue_growth_yoy_pct"),
+    (r"\b(?:customer\s+churn|churn)\s*+[:=]\s*+([\d,.]+)\s*%?\b", "customer_churn_pct"),
+    (r"\b(?:nps|net\s+promoter\s+score)\s*+[:=]\s*+([-\d,.]+)\b", "net_promoter_score"),
+    (r"\bcloud\s+adoption\s*+[:=]\s*+([\d,.]+)\s*%?\b", "cloud_adoption_pct"),
+    (r"\brelease\s+frequency\s*+[:=]\s*+([\d,.]+)\b", "release_frequency_per_month"),
+    (r"\blead\s*+time(?:\s*+days)?\s*+[:=]\s*+([\d,.]+)\b", "lead_time_days"),
+    (r"\bchange\s+failure\s+rate\s*+[:=]\s*+([\d,.]+)\s*%?\b", "change_failure_rate_pct"),
+    (r"\bp1\s+incidents?\s*+[:=]\s*+([\d,.]+)\b", "p1_incidents_per_month"),
+    (r"\bautomation\s+coverage\s*+[:=]\s*+([\d,.]+)\s*%?\b", "automation_coverage_pct"),
+    (r"\b(?:high\s+)?cyber\s+findings\s*+[:=]\s*+([\d,.]+)\b", "cyber_findings_open_high"),
+    (r"\bregulatory\s+findings\s*+[:=]\s*+([\d,.]+)\b", "regulatory_findings_open"),
+    (r"\b(?:critical\s+role\s+)?attrition\s*+[:=]\s*+([\d,.]+)\s*%?\b", "critical_role_attrition_pct"),
+    (r"\bvendor\s+concentration\s*+[:=]\s*+([\d,.]+)\s*%?\b", "vendor_concentration_pct"),
+    (r"\b(?:top\s+customer\s+)?customer\s+concentration\s*+[:=]\s*+([\d,.]+)\s*%?\b", "top_customer_concentration_pct"),
+    (r"\bdigital\s+capex(?:\s+as\s+%?\s+of\s+revenue)?\s*+[:=]\s*+([\d,.]+)\s*%?\b", "digital_capex_pct_of_revenue"),
+    (r"\bcash\s+conversion\s+cycle\s*+[:=]\s*+([\d,.]+)\b", "cash_conversion_cycle_days"),
 ]
 
+# Compiled once at import; extract_metrics calls the bound .search of each.
+_EXPLICIT_LABEL_RES = [(re.compile(pattern, re.IGNORECASE), metric) for pattern, metric in _EXPLICIT_LABEL_PATTERNS]
+_PATTERN_RES = [(re.compile(pattern, re.IGNORECASE), metric, multiplier) for pattern, metric, multiplier in _PATTERNS]
+_TEXTUAL_OVERRIDE_RES = {
+    metric: [(re.compile(pattern, re.IGNORECASE), replacement) for pattern, replacement in rules]
+    for metric, rules in _TEXTUAL_OVERRIDES.items()
+}
+
+# Every explicit-label and natural-language pattern for a metric contains one of
+# that metric's keywords, so a single scan for all keywords tells extract_metrics
+# which metrics can match at all; the per-metric patterns then only run for those.
+# The zero-width lookahead keeps one keyword hit from consuming the next.
+_METRIC_KEYWORDS: Dict[str, str] = {
+    "revenue": r"revenue|turnover|sales",
+    "cost": r"cost|opex|expenditure|capex",
+    "margin": r"margin|ebitda",
+    "technical_debt": r"tech|legacy",
+    "revenue_growth_yoy_pct": r"growth",
+    "customer_churn_pct": r"churn",
+    "net_promoter_score": r"nps|net\s+promoter",
+    "cloud_adoption_pct": r"cloud",
+    "release_frequency_per_month": r"release",
+    "lead_time_days": r"lead",
+    "change_failure_rate_pct": r"failure",
+    "p1_incidents_per_month": r"p1",
+    "automation_coverage_pct": r"automation",
+    "cyber_findings_open_high": r"cyber",
+    "regulatory_findings_open": r"regulatory",
+    "critical_role_attrition_pct": r"attrition",
+    "vendor_concentration_pct": r"vendor",
+    "top_customer_concentration_pct": r"customer",
+    "digital_capex_pct_of_revenue": r"digital",
+    "cash_conversion_cycle_days": r"cash",
+}
+_METRIC_KEYWORD_RE = re.compile(
+    "(?=" + "|".join(f"(?P<{metric}>{keywords})" for metric, keywords in _METRIC_KEYWORDS.items()) + ")",
+    re.IGNORECASE,
+)
+
 
 def _unit_multiplier(unit: Optional[str]) -> float:
     if not unit:
@@ -242,12 +305,14 @@ def _resolve_assumption_profile(text: str, requested_profile: Optional[str]) ->
     if requested in _PROFILE_DEFAULTS:
         return requested
 
-    lowered = (text or "").lower()
-    if any(h in lowered for h in _NO_DEFAULT_HINTS):
-        return "none"
-    if any(h in lowered for h in _STRESSED_HINTS):
+    hinted = set()
+    for match in _PROFILE_HINT_RE.finditer((text or "").lower()):
+        if match.lastgroup == "none":
+            return "none"
+        hinted.add(match.lastgroup)
+    if "stressed" in hinted:
         return "stressed"
-    if any(h in lowered for h in _GROWTH_HINTS):
+    if "growth" in hinted:
         return "growth"
     return "balanced"
 
@@ -272,15 +337,45 @@ def _sanitize_metric(metric: str, value: float) -> float:
     return round(n, 2)
 
 
-def extract_metrics(text: str, assumption_profile: Optional[str] = None) -> Tuple[Dict[str, float], str, Dict[str, str]]:
-    """Deterministic regex extraction with optional profile-based default filling."""
+def _fill_defaults(
+    extracted: Dict[str, float],
+    metric_source: Dict[str, str],
+    raw_text: str,
+    assumption_profile: Optional[str],
+) -> Tuple[Dict[str, float], str, Dict[str, str]]:
+    resolved_profile = _resolve_assumption_profile(raw_text, assumption_profile)
+
+    # Fill missing metrics using profile defaults unless profile="none".
+    if resolved_profile != "none":
+        defaults = _PROFILE_DEFAULTS.get(resolved_profile, _PROFILE_DEFAULTS["balanced"])
+        for metric, default_value in defaults.items():
+            if metric in extracted:
+                continue
+            extracted[metric] = default_value
+            metric_source[metric] = f"profile_default:{resolved_profile}"
+
+    # Final sanitation pass.
+    sanitized: Dict[str, float] = {}
+    for metric, raw_value in extracted.items():
+        try:
+            sanitized[metric] = _sanitize_metric(metric, float(raw_value))
+        except Exception:
+            continue
+
+    return sanitized, resolved_profile, metric_source
+
+
+def _extract_metrics_uncached(text: str, assumption_profile: Optional[str]) -> Tuple[Dict[str, float], str, Dict[str, str]]:
     extracted: Dict[str, float] = {}
     metric_source: Dict[str, str] = {}
     raw_text = text or ""
+    mentioned = {match.lastgroup for match in _METRIC_KEYWORD_RE.finditer(raw_text)}
 
     # Prefer explicit "Metric: value" blocks first.
-    for pattern, metric in _EXPLICIT_LABEL_PATTERNS:
-        match = re.search(pattern, raw_text, flags=re.IGNORECASE)
+    for pattern, metric in _EXPLICIT_LABEL_RES:
+        if metric not in mentioned:
+            continue
+        match = pattern.search(raw_text)
         if not match:
             continue
 
@@ -299,11 +394,15 @@ def extract_metrics(text: str, assumption_profile: Optional[str] = None) -> Tupl
             extracted[metric] = value
         metric_source[metric] = "explicit_input"
 
+    # A fully labelled block (the frontend confirmation payload) needs nothing else.
+    if len(extracted) >= len(_KNOWN_METRICS):
+        return _fill_defaults(extracted, metric_source, raw_text, assumption_profile)
+
     # Then apply natural-language patterns for still-missing metrics.
-    for pattern, metric, multiplier in _PATTERNS:
-        if metric in extracted:
+    for pattern, metric, multiplier in _PATTERN_RES:
+        if metric in extracted or metric not in mentioned:
             continue
-        match = re.search(pattern, raw_text, flags=re.IGNORECASE)
+        match = pattern.search(raw_text)
         if not match:
             continue
         raw = match.group(1).replace(",", "")
@@ -317,35 +416,39 @@ def extract_metrics(text: str, assumption_profile: Optional[str] = None) -> Tupl
             continue
 
     # Qualitative text overrides (e.g., "high technical debt").
-    for metric, rules in _TEXTUAL_OVERRIDES.items():
+    for metric, rules in _TEXTUAL_OVERRIDE_RES.items():
         if metric in extracted:
             continue
         for pattern, replacement in rules:
-            if re.search(pattern, raw_text, flags=re.IGNORECASE):
+            if pattern.search(raw_text):
                 extracted[metric] = replacement
                 metric_source[metric] = "qualitative_override"
                 break
 
-    resolved_profile = _resolve_assumption_profile(raw_text, assumption_profile)
+    return _fill_defaults(extracted, metric_source, raw_text, assumption_profile)
 
-    # Fill missing metrics using profile defaults unless profile="none".
-    if resolved_profile != "none":
-        defaults = _PROFILE_DEFAULTS.get(resolved_profile, _PROFILE_DEFAULTS["balanced"])
-        for metric, default_value in defaults.items():
-            if metric in extracted:
-                continue
-            extracted[metric] = default_value
-            metric_source[metric] = f"profile_default:{resolved_profile}"
 
-    # Final sanitation pass.
-    sanitized: Dict[str, float] = {}
-    for metric, raw_value in extracted.items():
-        try:
-            sanitized[metric] = _sanitize_metric(metric, float(raw_value))
-        except Exception:
-            continue
+# Retries and repeated confirmation submissions resend identical text. Results are
+# stored as tuples so callers always get fresh dicts; very long texts bypass the
+# cache so it cannot pin large request bodies in memory.
+_EXTRACT_CACHE_MAX_TEXT = 16_384
 
-    return sanitized, resolved_profile, metric_source
+
+@lru_cache(maxsize=1024)
+def _extract_metrics_cached(
+    text: str, assumption_profile: Optional[str]
+) -> Tuple[Tuple[Tuple[str, float], ...], str, Tuple[Tuple[str, str], ...]]:
+    extracted, resolved_profile, metric_source = _extract_metrics_uncached(text, assumption_profile)
+    return tuple(extracted.items()), resolved_profile, tuple(metric_source.items())
+
+
+def extract_metrics(text: str, assumption_profile: Optional[str] = None) -> Tuple[Dict[str, float], str, Dict[str, str]]:
+    """Deterministic regex extraction with optional profile-based default filling."""
+    text = text or ""
+    if len(text) > _EXTRACT_CACHE_MAX_TEXT:
+        return _extract_metrics_uncached(text, assumption_profile)
+    extracted, resolved_profile, metric_source = _extract_metrics_cached(text, assumption_profile)
+    return dict(extracted), resolved_profile, dict(metric_source)
 
 
 def generate_advisory_summary(
@@ -356,22 +459,23 @@ def generate_advisory_summary(
 ) -> str:
     """Generate a structured advisory narrative from engine output."""
     state = snapshot.get("state", "NORMAL")
-    sb = snapshot.get("score_breakdown", {})
+    sb = snapshot.get("score_breakdown") or {}
     total = sb.get("total_score", 0)
-    coeffs = sb.get("coefficient_contributions", [])
+    coeffs = sb.get("coefficient_contributions") or []
     triggered = snapshot.get("triggered_rule_count", 0)
     rule_count = snapshot.get("rule_count", 0)
-    restructuring = snapshot.get("restructuring_actions", [])
-
-    lines = []
-    lines.append(f"STRATEGOS Diagnostic Summary")
-    lines.append(f"{'=' * 40}")
-    lines.append(f"")
-    lines.append(f"Enterprise State: {state}")
-    lines.append(f"Composite Transformation Score: {total:.2f}")
-    lines.append(f"Rules Evaluated: {rule_count} | Triggered: {triggered}")
-    lines.append(f"Assumption Profile: {assumption_profile}")
-    lines.append(f"")
+    restructuring = snapshot.get("restructuring_actions") or []
+
+    lines = [
+        "STRATEGOS Diagnostic Summary",
+        "=" * 40,
+        "",
+        f"Enterprise State: {state}",
+        f"Composite Transformation Score: {total:.2f}",
+        f"Rules Evaluated: {rule_count} | Triggered: {triggered}",
+        f"Assumption Profile: {assumption_profile}",
+        "",
+    ]
 
     if coeffs:
         lines.append("Metric Contributions:")
@@ -384,33 +488,35 @@ def generate_advisory_summary(
         lines.append("")
 
     if state == "CRITICAL_ZONE":
-        lines.append("⚠ CRITICAL_ZONE Assessment:")
-        lines.append("  The enterprise exhibits transformation urgency requiring immediate executive attention.")
-        lines.append("  Multiple risk thresholds have been breached simultaneously.")
+        lines.extend((
+            "⚠ CRITICAL_ZONE Assessment:",
+            "  The enterprise exhibits transformation urgency requiring immediate executive attention.",
+            "  Multiple risk thresholds have been breached simultaneously.",
+        ))
         if restructuring:
             lines.append(f"  {len(restructuring)} restructuring directive(s) activated:")
             for r in restructuring:
-                payload = r.get("payload", {})
-                if isinstance(payload, str):
-                    try:
-                        payload = json.loads(payload)
-                    except Exception:
-                        payload = {}
+                # The engine decodes template payloads when it builds the snapshot;
+                # anything still not a dict was not a JSON object to begin with.
+                payload = r.get("payload")
+                if not isinstance(payload, dict):
+                    payload = {}
                 lines.append(f"    → {r.get('template_name', 'Action')} (Owner: {payload.get('owner', 'TBD')}, Horizon: {payload.get('horizon', 'TBD')})")
     elif state == "ELEVATED_RISK":
-        lines.append("⚡ ELEVATED_RISK Assessment:")
-        lines.append("  The enterprise shows elevated transformation pressure.")
-        lines.append("  Proactive intervention is recommended before state escalation.")
+        lines.extend((
+            "⚡ ELEVATED_RISK Assessment:",
+            "  The enterprise shows elevated transformation pressure.",
+            "  Proactive intervention is recommended before state escalation.",
+        ))
     else:
-        lines.append("✓ NORMAL Assessment:")
-        lines.append("  The enterprise operates within acceptable transformation parameters.")
-        lines.append("  Continue monitoring key metrics for early-warning signals.")
+        lines.extend((
+            "✓ NORMAL Assessment:",
+            "  The enterprise operates within acceptable transformation parameters.",
+            "  Continue monitoring key metrics for early-warning signals.",
+        ))
 
-    lines.append("")
-    lines.append("Extracted Input Metrics:")
-    for k, v in extracted.items():
-        source = metric_source.get(k, "unknown")
-        lines.append(f"  {k}: {v} [{source}]")
+    lines.extend(("", "Extracted Input Metrics:"))
+    lines.extend(f"  {k}: {v} [{metric_source.get(k, 'unknown')}]" for k, v in extracted.items())
 
     return "\n".join(lines)
 
@@ -423,11 +529,24 @@ class IntakeRequest(BaseModel):
         description="Optional default profile for missing metrics: balanced | growth | stressed | none",
     )
     text: str = Field(..., min_length=5, description="Natural language enterprise description")
+    include_summary: bool = Field(
+        default=False,
+        description="Also return the plain-text advisory_summary built from the snapshot",
+    )
+
+
+# Built once; each request only binds its values. Core table insert, since an
+# ORM-enabled insert given a parameter dict would go down the bulk path.
+_INSERT_AUDIT_LOG = insert(models.AuditLog.__table__)
 
 
 @router.post("/intake")
 async def natural_language_intake(payload: IntakeRequest, db: AsyncSession = Depends(get_session)):
-    """Accept natural language, extract metrics, run engine, return advisory."""
+    """Accept natural language, extract metrics, run engine, return the snapshot.
+
+    The plain-text ``advisory_summary`` is only built and returned when
+    ``include_summary`` is set; the UI renders from the snapshot itself.
+    """
 
     # 1. Extract structured metrics from natural language
     extracted, resolved_profile, metric_source = extract_metrics(payload.text, payload.assumption_profile)
@@ -446,25 +565,26 @@ async def natural_language_intake(payload: IntakeRequest, db: AsyncSession = Dep
 
     # If no model_version_id provided, pick the first active one
     if not model_version_id:
-        q = select(models.ModelVersion).where(models.ModelVersion.is_active == True)
-        if tenant_uuid:
-            q = q.where(models.ModelVersion.tenant_id == tenant_uuid)
-        q = q.limit(1)
-        res = await db.execute(q)
-        mv = res.scalars().first()
-        # Fallback for demo/local flows where auth tenant may not match seeded tenant.
-        if not mv and tenant_uuid:
-            fallback_q = select(models.ModelVersion).where(models.ModelVersion.is_active == True).limit(1)
-            fallback_res = await db.execute(fallback_q)
-            mv = fallback_res.scalars().first()
-        if mv:
-            model_version_id = str(mv.id)
+        active = await resolve_active_model_version(db, tenant_uuid)
+        if active:
+            mv_id, mv_tenant_id = active
+            model_version_id = str(mv_id)
             # Keep requested tenant for session visibility in customer-facing UI,
             # even when model-version fallback uses a different seeded tenant.
-            tenant_uuid = requested_tenant_uuid or mv.tenant_id
+            tenant_uuid = requested_tenant_uuid or mv_tenant_id
         else:
             raise HTTPException(status_code=404, detail="no_active_model_version")
 
+    # 3. Run deterministic engine. It only reads, so nothing is written for a
+    # failed run and the session insert can carry the snapshot directly. Running
+    # it before the tenant fallback also loads the model version into the
+    # session's identity map, so the ``db.get`` below needs no query.
+    snapshot = await run_deterministic_engine(
+        db,
+        model_version_id=model_version_id,
+        input_data=extracted,
+    )
+
     if not tenant_uuid:
         # Fallback: get tenant from model version
         try:
@@ -477,51 +597,30 @@ async def natural_language_intake(payload: IntakeRequest, db: AsyncSession = Dep
     if not tenant_uuid:
         raise HTTPException(status_code=400, detail="could_not_resolve_tenant")
 
-    # 3. Create session
-    session_name = (payload.text[:80] + "…") if len(payload.text) > 80 else payload.text
-    stmt = (
-        insert(models.TransformationSession)
-        .values(
-            tenant_id=tenant_uuid,
-            model_version_id=uuid.UUID(model_version_id),
-            name=session_name,
-        )
-        .returning(models.TransformationSession.id)
-    )
-    res = await db.execute(stmt)
-    session_id = res.scalar()
-
-    # 4. Run deterministic engine
-    snapshot = await run_deterministic_engine(
-        db,
-        model_version_id=model_version_id,
-        input_data=extracted,
-    )
-
     if isinstance(snapshot, dict) and snapshot.get("error"):
-        await db.commit()
         raise HTTPException(status_code=400, detail=snapshot)
 
-    # 5. Persist snapshot to session
-    packed = json.dumps({
-        "version": 1,
-        "latest": snapshot,
-        "history": [{"version": 1, "created_at": str(uuid.uuid4())[:8], "snapshot": snapshot}],
-    })
-    await db.execute(
-        models.TransformationSession.__table__
-        .update()
-        .where(models.TransformationSession.id == session_id)
-        .values(snapshot=packed)
+    # 4. Create session with its first snapshot
+    # The audit copy is cut once and the session name is taken from it; slicing a
+    # string no longer than the limit returns it as-is, so short texts copy nothing.
+    original_text = payload.text[:500]
+    session_name = original_text if len(original_text) <= 80 else original_text[:80] + "…"
+    session_id = await create_session_with_snapshot(
+        db,
+        tenant_id=tenant_uuid,
+        model_version_id=uuid.UUID(model_version_id),
+        name=session_name,
+        snapshot=snapshot,
     )
 
-    # 6. Audit log
+    # 5. Audit log
     await db.execute(
-        insert(models.AuditLog).values(
-            tenant_id=tenant_uuid,
-            actor="intake_api",
-            action="ENGINE_RUN",
-            payload=json.dumps({
+        _INSERT_AUDIT_LOG,
+        {
+            "tenant_id": tenant_uuid,
+            "actor": "intake_api",
+            "action": "ENGINE_RUN",
+            "payload": {
                 "model_version_id": model_version_id,
                 "session_id": str(session_id),
                 "input": extracted,
@@ -530,21 +629,23 @@ async def natural_language_intake(payload: IntakeRequest, db: AsyncSession = Dep
                 "source": "natural_language_intake",
                 "assumption_profile": resolved_profile,
                 "metric_source": metric_source,
-                "original_text": payload.text[:500],
-            }),
-        )
+                "original_text": original_text,
+            },
+        },
     )
 
     await db.commit()
 
-    # 7. Generate advisory summary
-    advisory = generate_advisory_summary(snapshot, extracted, resolved_profile, metric_source)
-
-    return format_response({
+    response = {
         "session_id": str(session_id),
         "extracted_input": extracted,
         "assumption_profile_used": resolved_profile,
         "metric_source": metric_source,
         "snapshot": snapshot,
-        "advisory_summary": advisory,
-    })
+    }
+
+    # 6. Generate advisory summary on request
+    if payload.include_summary:
+        response["advisory_summary"] = generate_advisory_summary(snapshot, extracted, resolved_profile, metric_source)
+
+    return format_response(response)
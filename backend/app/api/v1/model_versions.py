@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.response import format_response
 from app.db import models
 from app.db.session import get_session
+from app.services.active_model import invalidate_active_model_versions
 
 router = APIRouter()
 
@@ -39,6 +40,8 @@ async def create_model_version(payload: ModelVersionCreate, db: AsyncSession = D
     )
     res = await db.execute(stmt)
     await db.commit()
+    if payload.is_active:
+        invalidate_active_model_versions()
     mv_id = res.scalar()
     return format_response({"model_version_id": str(mv_id)})
 
@@ -58,7 +61,7 @@ async def list_model_versions(
         q = q.where(models.ModelVersion.tenant_id == tid)
 
     if active_only:
-        q = q.where(models.ModelVersion.is_active == True)
+        q = q.where(models.ModelVersion.is_active)
 
     res = await db.execute(q)
     items = res.scalars().all()
@@ -97,4 +100,5 @@ async def activate_model_version(model_version_id: str, db: AsyncSession = Depen
     )
     await db.execute(update(models.ModelVersion).where(models.ModelVersion.id == mv_id).values(is_active=True))
     await db.commit()
+    invalidate_active_model_versions()
     return format_response({"model_version_id": str(mv_id), "is_active": True})
@@ -5,16 +5,17 @@ from a session's deterministic engine snapshot.
 """
 
 import csv
+import heapq
 import io
-import json
 import uuid
 from datetime import datetime, timezone
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core import json
 from app.db import models
 from app.db.session import get_session
 
@@ -67,6 +68,16 @@ def _safe_float(value: object, default: float = 0.0) -> float:
         return default
 
 
+def _unpack(snapshot: dict) -> Tuple[dict, List[dict], List[dict], List[dict]]:
+    sb = snapshot.get("score_breakdown") or {}
+    return (
+        sb,
+        sb.get("coefficient_contributions") or [],
+        snapshot.get("contributions") or [],
+        snapshot.get("restructuring_actions") or [],
+    )
+
+
 def _to_plain_english_rule(expression: str) -> str:
     raw = (expression or "").strip()
     if not raw:
@@ -92,12 +103,18 @@ def _to_plain_english_rule(expression: str) -> str:
     return out[0].upper() + out[1:]
 
 
-def _build_csv(session_id: str, snapshot: dict) -> str:
-    """Build CSV export from deterministic snapshot."""
+def _iter_csv(session_id: str, snapshot: dict) -> Iterator[bytes]:
+    """Stream the CSV export from deterministic snapshot, one encoded section at a time."""
     output = io.StringIO()
     writer = csv.writer(output)
 
-    sb = snapshot.get("score_breakdown", {}) or {}
+    def flush() -> bytes:
+        chunk = output.getvalue().encode("utf-8")
+        output.seek(0)
+        output.truncate(0)
+        return chunk
+
+    sb, coeffs, contribs, actions = _unpack(snapshot)
     writer.writerow(["STRATEGOS Executive Data Export"])
     writer.writerow(["Session ID", session_id])
     writer.writerow([])
@@ -109,8 +126,8 @@ def _build_csv(session_id: str, snapshot: dict) -> str:
     writer.writerow(["Rules Evaluated", snapshot.get("rule_count", "N/A")])
     writer.writerow(["Rules Triggered", snapshot.get("triggered_rule_count", "N/A")])
     writer.writerow([])
+    yield flush()
 
-    coeffs = sb.get("coefficient_contributions", []) or []
     if coeffs:
         writer.writerow(["Coefficient Contributions"])
         writer.writerow(["Driver", "Mode", "Contribution", "Error"])
@@ -124,8 +141,8 @@ def _build_csv(session_id: str, snapshot: dict) -> str:
                 ]
             )
         writer.writerow([])
+        yield flush()
 
-    contribs = snapshot.get("contributions", []) or []
     if contribs:
         writer.writerow(["Rule Condition Detail"])
         writer.writerow(["Rule Triggered", "Result", "Error"])
@@ -138,8 +155,8 @@ def _build_csv(session_id: str, snapshot: dict) -> str:
                 ]
             )
         writer.writerow([])
+        yield flush()
 
-    actions = snapshot.get("restructuring_actions", []) or []
     if actions:
         writer.writerow(["Restructuring Actions"])
         writer.writerow(["Template", "Payload"])
@@ -148,7 +165,7 @@ def _build_csv(session_id: str, snapshot: dict) -> str:
             if isinstance(payload, dict):
                 payload = json.dumps(payload)
             writer.writerow([a.get("template_name", ""), payload])
-    return output.getvalue()
+        yield flush()
 
 
 def _build_pdf(session_id: str, session_name: str, snapshot: dict) -> bytes:
@@ -185,7 +202,7 @@ def _build_pdf(session_id: str, session_name: str, snapshot: dict) -> bytes:
         author="STRATEGOS",
     )
 
-    sb = snapshot.get("score_breakdown", {}) or {}
+    sb, coeffs, contribs, actions = _unpack(snapshot)
     state = str(snapshot.get("state") or "UNKNOWN")
     state_color = theme_green
     if state == "ELEVATED_RISK":
@@ -307,11 +324,11 @@ def _build_pdf(session_id: str, session_name: str, snapshot: dict) -> bytes:
     )
     elements.append(breakdown)
 
-    coeffs = sb.get("coefficient_contributions", []) or []
     if coeffs:
         elements.append(Paragraph("Top Coefficient Contributions", styles["section"]))
         coeff_rows: List[List[str]] = [["Driver", "Mode", "Contribution"]]
-        sorted_coeffs = sorted(coeffs, key=lambda c: abs(_safe_float(c.get("contribution"))), reverse=True)[:12]
+        # Only the top 12 drivers are shown; nlargest matches sorted(..., reverse=True)[:12].
+        sorted_coeffs = heapq.nlargest(12, coeffs, key=lambda c: abs(_safe_float(c.get("contribution"))))
         for c in sorted_coeffs:
             coeff_rows.append(
                 [
@@ -345,7 +362,6 @@ def _build_pdf(session_id: str, session_name: str, snapshot: dict) -> bytes:
         coeff_table.setStyle(coeff_style)
         elements.append(coeff_table)
 
-    contribs = snapshot.get("contributions", []) or []
     if contribs:
         elements.append(Paragraph("Rule Condition Detail", styles["section"]))
         rule_rows: List[List[object]] = [["Rule Triggered", "Result"]]
@@ -383,7 +399,6 @@ def _build_pdf(session_id: str, session_name: str, snapshot: dict) -> bytes:
         rule_table.setStyle(rule_style)
         elements.append(rule_table)
 
-    actions = snapshot.get("restructuring_actions", []) or []
     if actions:
         elements.append(Paragraph("Restructuring Roadmap", styles["section"]))
         action_rows: List[List[str]] = [["Action", "Owner", "Horizon"]]
@@ -456,7 +471,7 @@ async def generate_report(
         raise HTTPException(status_code=400, detail="session_has_no_snapshot")
 
     try:
-        snapshot_wrapper = json.loads(session_obj.snapshot)
+        snapshot_wrapper = session_obj.snapshot if isinstance(session_obj.snapshot, dict) else json.loads(session_obj.snapshot)
     except Exception:
         raise HTTPException(status_code=500, detail="invalid_snapshot_format")
 
@@ -465,9 +480,8 @@ async def generate_report(
     fmt = (format or "pdf").strip().lower()
 
     if fmt == "csv":
-        csv_data = _build_csv(str(sid), snapshot)
         return StreamingResponse(
-            io.BytesIO(csv_data.encode("utf-8")),
+            _iter_csv(str(sid), snapshot),
             media_type="text/csv",
             headers={"Content-Disposition": f'attachment; filename="strategos_{session_id}.csv"'},
         )
@@ -477,8 +491,10 @@ async def generate_report(
             pdf_data = _build_pdf(str(sid), session_name, snapshot)
         except RuntimeError as exc:
             raise HTTPException(status_code=500, detail=str(exc))
-        return StreamingResponse(
-            io.BytesIO(pdf_data),
+        # reportlab has already built the whole document; send it as one body instead of
+        # iterating a BytesIO, which would chunk the binary on newline bytes.
+        return Response(
+            content=pdf_data,
             media_type="application/pdf",
             headers={"Content-Disposition": f'attachment; filename="strategos_{session_id}_report.pdf"'},
         )
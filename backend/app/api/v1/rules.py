@@ -82,7 +82,7 @@ async def list_rules(
             raise HTTPException(status_code=400, detail="invalid_model_version_id")
         q = q.where(models.Rule.model_version_id == mv)
     if active_only:
-        q = q.where(models.Rule.is_active == True)
+        q = q.where(models.Rule.is_active)
 
     res = await db.execute(q)
     items = res.scalars().all()
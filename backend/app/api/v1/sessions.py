@@ -3,12 +3,13 @@ from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import insert, select, delete
 import uuid
-import json
 
+from app.core import json
 from app.core.response import format_response
 from app.db.session import get_session
 from app.db import models
 from app.services.engine import run_deterministic_engine
+from app.services.snapshots import load_snapshot_history
 
 router = APIRouter()
 
@@ -44,7 +45,15 @@ async def create_session(payload: SessionCreate, db: AsyncSession = Depends(get_
 @router.get("/sessions")
 async def list_sessions(tenant_id: str | None = None, db: AsyncSession = Depends(get_session)):
     """List all sessions, optionally filtered by tenant_id."""
-    q = select(models.TransformationSession).order_by(models.TransformationSession.created_at.desc())
+    # The snapshot itself is not listed; only whether one exists.
+    q = select(
+        models.TransformationSession.id,
+        models.TransformationSession.tenant_id,
+        models.TransformationSession.model_version_id,
+        models.TransformationSession.name,
+        models.TransformationSession.created_at,
+        models.TransformationSession.snapshot.isnot(None).label("has_snapshot"),
+    ).order_by(models.TransformationSession.created_at.desc())
     if tenant_id:
         try:
             tid = uuid.UUID(tenant_id)
@@ -53,7 +62,7 @@ async def list_sessions(tenant_id: str | None = None, db: AsyncSession = Depends
             raise HTTPException(status_code=400, detail="invalid_tenant_id")
     q = q.limit(100)
     res = await db.execute(q)
-    rows = res.scalars().all()
+    rows = res.all()
     sessions = []
     for s in rows:
         sessions.append({
@@ -62,27 +71,20 @@ async def list_sessions(tenant_id: str | None = None, db: AsyncSession = Depends
             "model_version_id": str(s.model_version_id),
             "name": s.name,
             "created_at": s.created_at.isoformat() if s.created_at else None,
-            "has_snapshot": bool(s.snapshot),
+            "has_snapshot": bool(s.has_snapshot),
         })
     return format_response({"sessions": sessions})
 
 
 @router.get("/sessions/{session_id}")
-async def get_session_detail(session_id: str, db: AsyncSession = Depends(get_session)):
+async def get_session_detail(session_id: uuid.UUID, db: AsyncSession = Depends(get_session)):
     """Get full session detail including snapshot."""
-    try:
-        sid = uuid.UUID(session_id)
-    except Exception:
-        raise HTTPException(status_code=400, detail="invalid_session_id")
-    session_obj = await db.get(models.TransformationSession, sid)
+    session_obj = await db.get(models.TransformationSession, session_id)
     if session_obj is None:
         raise HTTPException(status_code=404, detail="session_not_found")
-    snapshot_data = None
-    if session_obj.snapshot:
-        try:
-            snapshot_data = json.loads(session_obj.snapshot)
-        except Exception:
-            snapshot_data = {"raw": session_obj.snapshot}
+    snapshot_data = session_obj.snapshot or None
+    if snapshot_data is not None and not isinstance(snapshot_data, dict):
+        snapshot_data = {"raw": snapshot_data}
     return format_response({
         "id": str(session_obj.id),
         "tenant_id": str(session_obj.tenant_id),
@@ -94,40 +96,30 @@ async def get_session_detail(session_id: str, db: AsyncSession = Depends(get_ses
 
 
 @router.get("/sessions/{session_id}/snapshots")
-async def get_session_snapshots(session_id: str, db: AsyncSession = Depends(get_session)):
-    try:
-        sid = uuid.UUID(session_id)
-    except Exception:
-        raise HTTPException(status_code=400, detail="invalid_session_id")
-
-    session_obj = await db.get(models.TransformationSession, sid)
+async def get_session_snapshots(session_id: uuid.UUID, db: AsyncSession = Depends(get_session)):
+    session_obj = await db.get(models.TransformationSession, session_id)
     if session_obj is None:
         raise HTTPException(status_code=404, detail="session_not_found")
 
     if not session_obj.snapshot:
-        return format_response({"session_id": str(sid), "version": 0, "latest": None, "history": []})
+        return format_response({"session_id": str(session_id), "version": 0, "latest": None, "history": []})
 
-    try:
-        payload = json.loads(session_obj.snapshot)
-    except Exception:
+    payload = session_obj.snapshot
+    if not isinstance(payload, dict):
         payload = {
             "version": 0,
             "latest": None,
-            "history": [],
             "legacy_snapshot": session_obj.snapshot,
         }
 
-    return format_response({"session_id": str(sid), **payload})
+    # History lives in snapshot_events; the session row only carries the latest run.
+    history = await load_snapshot_history(db, session_id)
+    return format_response({"session_id": str(session_id), **payload, "history": history})
 
 
 @router.get("/sessions/{session_id}/replay")
-async def replay_session(session_id: str, db: AsyncSession = Depends(get_session)):
-    try:
-        sid = uuid.UUID(session_id)
-    except Exception:
-        raise HTTPException(status_code=400, detail="invalid_session_id")
-
-    session_obj = await db.get(models.TransformationSession, sid)
+async def replay_session(session_id: uuid.UUID, db: AsyncSession = Depends(get_session)):
+    session_obj = await db.get(models.TransformationSession, session_id)
     if session_obj is None:
         raise HTTPException(status_code=404, detail="session_not_found")
 
@@ -140,11 +132,11 @@ async def replay_session(session_id: str, db: AsyncSession = Depends(get_session
         parsed = None
         if row.payload:
             try:
-                parsed = json.loads(row.payload)
+                parsed = row.payload if isinstance(row.payload, dict) else json.loads(row.payload)
             except Exception:
                 parsed = {"raw": row.payload}
 
-        if isinstance(parsed, dict) and parsed.get("session_id") == str(sid):
+        if isinstance(parsed, dict) and parsed.get("session_id") == str(session_id):
             replay_events.append(
                 {
                     "audit_log_id": str(row.id),
@@ -158,7 +150,7 @@ async def replay_session(session_id: str, db: AsyncSession = Depends(get_session
 
     return format_response(
         {
-            "session_id": str(sid),
+            "session_id": str(session_id),
             "event_count": len(replay_events),
             "events": replay_events,
         }
@@ -166,13 +158,8 @@ async def replay_session(session_id: str, db: AsyncSession = Depends(get_session
 
 
 @router.get("/sessions/replay/audit/{audit_log_id}")
-async def replay_by_audit_id(audit_log_id: str, db: AsyncSession = Depends(get_session)):
-    try:
-        aid = uuid.UUID(audit_log_id)
-    except Exception:
-        raise HTTPException(status_code=400, detail="invalid_audit_log_id")
-
-    row = await db.get(models.AuditLog, aid)
+async def replay_by_audit_id(audit_log_id: uuid.UUID, db: AsyncSession = Depends(get_session)):
+    row = await db.get(models.AuditLog, audit_log_id)
     if row is None:
         raise HTTPException(status_code=404, detail="audit_log_not_found")
 
@@ -182,7 +169,7 @@ async def replay_by_audit_id(audit_log_id: str, db: AsyncSession = Depends(get_s
     parsed_payload: dict = {}
     if row.payload:
         try:
-            parsed_payload = json.loads(row.payload)
+            parsed_payload = row.payload if isinstance(row.payload, dict) else json.loads(row.payload)
         except Exception:
             parsed_payload = {"raw": row.payload}
 
@@ -213,13 +200,8 @@ async def replay_by_audit_id(audit_log_id: str, db: AsyncSession = Depends(get_s
 
 
 @router.delete("/sessions/{session_id}")
-async def delete_session(session_id: str, tenant_id: str | None = None, db: AsyncSession = Depends(get_session)):
-    try:
-        sid = uuid.UUID(session_id)
-    except Exception:
-        raise HTTPException(status_code=400, detail="invalid_session_id")
-
-    session_obj = await db.get(models.TransformationSession, sid)
+async def delete_session(session_id: uuid.UUID, tenant_id: str | None = None, db: AsyncSession = Depends(get_session)):
+    session_obj = await db.get(models.TransformationSession, session_id)
     if session_obj is None:
         raise HTTPException(status_code=404, detail="session_not_found")
 
@@ -231,8 +213,8 @@ async def delete_session(session_id: str, tenant_id: str | None = None, db: Asyn
         if session_obj.tenant_id != tid:
             raise HTTPException(status_code=403, detail="session_tenant_mismatch")
 
-    await db.execute(delete(models.TransformationScenario).where(models.TransformationScenario.session_id == sid))
-    await db.execute(delete(models.TransformationSession).where(models.TransformationSession.id == sid))
+    # Scenarios go with the session via ON DELETE CASCADE.
+    await db.execute(delete(models.TransformationSession).where(models.TransformationSession.id == session_id))
     await db.commit()
 
-    return format_response({"session_id": str(sid), "deleted": True})
+    return format_response({"session_id": str(session_id), "deleted": True})
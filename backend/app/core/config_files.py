@@ -0,0 +1,54 @@
+"""JSON config files under openclaw/ shared by the admin and advisory routers."""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+import orjson
+
+
+# path -> (st_mtime_ns, parsed payload). Callers may mutate the cached payload
+# only on their way to write_json_config, which re-seeds the entry anyway.
+_JSON_CACHE: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
+
+
+def load_json_config(path: Path, default: Dict[str, Any]) -> Dict[str, Any]:
+    """Parsed JSON object at `path`, re-read only when its mtime changes; `default` if missing or invalid."""
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        _JSON_CACHE.pop(path, None)
+        return default
+    cached = _JSON_CACHE.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    try:
+        payload = orjson.loads(path.read_bytes())
+        if isinstance(payload, dict):
+            _JSON_CACHE[path] = (mtime_ns, payload)
+            return payload
+    except Exception:
+        pass
+    return default
+
+
+def write_json_config(path: Path, payload: Dict[str, Any]) -> None:
+    """Atomically replace `path`: readers see either the old file or the new one."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2) + b"\n")
+            fh.flush()
+            os.fsync(fh.fileno())
+        # mkstemp creates 0600 files; keep the permissions the config already had.
+        if path.exists():
+            os.chmod(tmp_name, path.stat().st_mode & 0o7777)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    # Cache a fresh top-level object: callers memoize views keyed on payload identity,
+    # and the one passed in may be the previously cached payload mutated in place.
+    _JSON_CACHE[path] = (path.stat().st_mtime_ns, dict(payload))
@@ -0,0 +1,17 @@
+"""orjson-backed drop-in for the parts of the stdlib json module the app uses.
+
+Modules import it as ``from app.core import json`` so call sites keep reading
+``json.loads`` / ``json.dumps``.
+"""
+
+from typing import Any
+
+import orjson
+
+JSONDecodeError = orjson.JSONDecodeError
+
+loads = orjson.loads
+
+
+def dumps(value: Any) -> str:
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
@@ -1,5 +1,19 @@
 from typing import Any, Dict
 
+import orjson
+from fastapi.responses import JSONResponse
+
 
 def format_response(data: Any = None, meta: Dict = None):
     return {"status": "success", "data": data or {}, "meta": meta or {}}
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson straight to bytes.
+
+    Defined here rather than imported from fastapi.responses, whose copy is
+    deprecated in current FastAPI releases.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
@@ -0,0 +1,50 @@
+"""Small bounded TTL cache for per-tenant lookups keyed by client-supplied ids.
+
+Entries expire after ``ttl`` seconds and the cache never holds more than
+``maxsize`` of them: expired entries are dropped on insert, then the least
+recently used ones until the cache is back under its bound.
+"""
+
+from collections import OrderedDict
+from typing import Any, Generic, Hashable, Optional, Tuple, TypeVar
+import time
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[V]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry[0]:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: Hashable, value: V) -> None:
+        now = time.monotonic()
+        self._entries[key] = (now + self.ttl, value)
+        self._entries.move_to_end(key)
+        # Insertion order tracks use, so expired entries are found from the front.
+        while len(self._entries) > 1:
+            oldest_key, (expires_at, _) = next(iter(self._entries.items()))
+            if len(self._entries) <= self.maxsize and expires_at > now:
+                break
+            del self._entries[oldest_key]
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -1,101 +1,131 @@
 import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text
-from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime, timezone
+from sqlalchemy import JSON, Column, String, Boolean, DateTime, Float, ForeignKey, Index, Integer, Text, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
 from .base import Base
 
 
+def _utcnow():
+    return datetime.now(timezone.utc)
+
+
+# Structured payloads are JSONB on Postgres; plain JSON keeps SQLite (tests, local bootstrap) working.
+JSONDocument = JSON(none_as_null=True).with_variant(JSONB(none_as_null=True), "postgresql")
+
+
 class Tenant(Base):
     __tablename__ = "tenants"
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String(255), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), default=_utcnow, nullable=False)
 
 
 class ModelVersion(Base):
     __tablename__ = "model_versions"
+    __table_args__ = (Index("ix_model_versions_active_tenant_id", "tenant_id", postgresql_where=text("is_active")),)
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    tenant_id = Column(UUID(as_uuid=True), nullable=False)
+    tenant_id = Column(UUID(as_uuid=True), nullable=False, index=True)
     name = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), default=_utcnow, nullable=False)
+    updated_at = Column(DateTime(timezone=True), default=_utcnow, onupdate=_utcnow)
     is_active = Column(Boolean, default=True)
 
 
 class Metric(Base):
     __tablename__ = "metrics"
+    __table_args__ = (
+        Index("ix_metrics_tenant_id_model_version_id", "tenant_id", "model_version_id"),
+        Index("ix_metrics_tenant_id_created_at", "tenant_id", text("created_at DESC")),
+        Index("ix_metrics_active_model_version_id", "model_version_id", postgresql_where=text("is_active")),
+    )
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     tenant_id = Column(UUID(as_uuid=True), nullable=False)
     model_version_id = Column(UUID(as_uuid=True), ForeignKey("model_versions.id"), nullable=True)
     name = Column(String(255), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), default=_utcnow, nullable=False)
+    updated_at = Column(DateTime(timezone=True), default=_utcnow, onupdate=_utcnow)
     is_active = Column(Boolean, default=True)
 
 
 class Coefficient(Base):
     __tablename__ = "coefficients"
+    __table_args__ = (
+        Index("ix_coefficients_tenant_id_model_version_id", "tenant_id", "model_version_id"),
+        Index("ix_coefficients_tenant_id_created_at", "tenant_id", text("created_at DESC")),
+        Index("ix_coefficients_active_model_version_id", "model_version_id", postgresql_where=text("is_active")),
+    )
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     tenant_id = Column(UUID(as_uuid=True), nullable=False)
     model_version_id = Column(UUID(as_uuid=True), ForeignKey("model_versions.id"), nullable=True)
     name = Column(String(255), nullable=False)
-    value = Column(String(255), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    value = Column(Text, nullable=False)
+    created_at = Column(DateTime(timezone=True), default=_utcnow, nullable=False)
+    updated_at = Column(DateTime(timezone=True), default=_utcnow, onupdate=_utcnow)
     is_active = Column(Boolean, default=True)
 
 
 class Rule(Base):
     __tablename__ = "rules"
+    __table_args__ = (
+        Index("ix_rules_tenant_id_model_version_id", "tenant_id", "model_version_id"),
+        Index("ix_rules_active_model_version_id", "model_version_id", postgresql_where=text("is_active")),
+        Index("ix_rules_active_tenant_id", "tenant_id", postgresql_where=text("is_active")),
+    )
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     tenant_id = Column(UUID(as_uuid=True), nullable=False)
-    model_version_id = Column(UUID(as_uuid=True), ForeignKey("model_versions.id"), nullable=False)
+    model_version_id = Column(UUID(as_uuid=True), ForeignKey("model_versions.id"), nullable=False, index=True)
     name = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), default=_utcnow, nullable=False)
+    updated_at = Column(DateTime(timezone=True), default=_utcnow, onupdate=_utcnow)
     is_active = Column(Boolean, default=True)
 
 
 class RuleCondition(Base):
     __tablename__ = "rule_conditions"
+    __table_args__ = (
+        Index("ix_rule_conditions_tenant_id_rule_id", "tenant_id", "rule_id"),
+        Index("ix_rule_conditions_active_rule_id", "rule_id", postgresql_where=text("is_active")),
+    )
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     tenant_id = Column(UUID(as_uuid=True), nullable=False)
-    rule_id = Column(UUID(as_uuid=True), ForeignKey("rules.id"), nullable=False)
+    rule_id = Column(UUID(as_uuid=True), ForeignKey("rules.id"), nullable=False, index=True)
     expression = Column(Text, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), default=_utcnow, nullable=False)
     is_active = Column(Boolean, default=True)
 
 
 class RuleImpact(Base):
     __tablename__ = "rule_impacts"
+    __table_args__ = (Index("ix_rule_impacts_active_rule_id", "rule_id", postgresql_where=text("is_active")),)
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     tenant_id = Column(UUID(as_uuid=True), nullable=False)
-    rule_id = Column(UUID(as_uuid=True), ForeignKey("rules.id"), nullable=False)
+    rule_id = Column(UUID(as_uuid=True), ForeignKey("rules.id"), nullable=False, index=True)
     impact = Column(Text, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), default=_utcnow, nullable=False)
     is_active = Column(Boolean, default=True)
 
 
 class StateDefinition(Base):
     __tablename__ = "state_definitions"
+    __table_args__ = (Index("ix_state_definitions_tenant_id", "tenant_id"),)
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     tenant_id = Column(UUID(as_uuid=True), nullable=False)
     name = Column(String(128), nullable=False)
     description = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), default=_utcnow, nullable=False)
 
 
 class StateThreshold(Base):
     __tablename__ = "state_thresholds"
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     tenant_id = Column(UUID(as_uuid=True), nullable=False)
-    state_definition_id = Column(UUID(as_uuid=True), ForeignKey("state_definitions.id"), nullable=False)
-    threshold = Column(String(255), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    state_definition_id = Column(UUID(as_uuid=True), ForeignKey("state_definitions.id"), nullable=False, index=True)
+    threshold = Column(Text, nullable=False)
+    created_at = Column(DateTime(timezone=True), default=_utcnow, nullable=False)
 
 
 class RestructuringTemplate(Base):
@@ -103,45 +133,75 @@ class RestructuringTemplate(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     tenant_id = Column(UUID(as_uuid=True), nullable=False)
     name = Column(String(255), nullable=False)
-    payload = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    payload = Column(JSONDocument, nullable=True)
+    created_at = Column(DateTime(timezone=True), default=_utcnow, nullable=False)
 
 
 class RestructuringRule(Base):
     __tablename__ = "restructuring_rules"
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     tenant_id = Column(UUID(as_uuid=True), nullable=False)
-    template_id = Column(UUID(as_uuid=True), ForeignKey("restructuring_templates.id"), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    template_id = Column(UUID(as_uuid=True), ForeignKey("restructuring_templates.id"), nullable=False, index=True)
+    created_at = Column(DateTime(timezone=True), default=_utcnow, nullable=False)
 
 
 class TransformationSession(Base):
     __tablename__ = "transformation_sessions"
+    __table_args__ = (
+        Index("ix_transformation_sessions_tenant_id_created_at", "tenant_id", text("created_at DESC")),
+        Index("ix_transformation_sessions_tenant_id_latest_state", "tenant_id", "latest_state"),
+    )
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     tenant_id = Column(UUID(as_uuid=True), nullable=False)
-    model_version_id = Column(UUID(as_uuid=True), ForeignKey("model_versions.id"), nullable=False)
+    model_version_id = Column(UUID(as_uuid=True), ForeignKey("model_versions.id"), nullable=False, index=True)
     name = Column(String(255), nullable=True)
-    snapshot = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    snapshot = Column(JSONDocument, nullable=True)
+    # Copied out of the latest snapshot on every write so state reads skip the document.
+    latest_state = Column(Text, nullable=True)
+    latest_total_score = Column(Float, nullable=True)
+    created_at = Column(DateTime(timezone=True), default=_utcnow, nullable=False)
+
+
+class SnapshotEvent(Base):
+    # Append-only engine run history; the session row keeps only the latest snapshot.
+    __tablename__ = "snapshot_events"
+    __table_args__ = (Index("ix_snapshot_events_session_id_version", "session_id", "version", unique=True),)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    session_id = Column(UUID(as_uuid=True), ForeignKey("transformation_sessions.id", ondelete="CASCADE"), nullable=False)
+    version = Column(Integer, nullable=False)
+    snapshot = Column(JSONDocument, nullable=True)
+    created_at = Column(DateTime(timezone=True), default=_utcnow, nullable=False)
 
 
 class TransformationScenario(Base):
     __tablename__ = "transformation_scenarios"
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     tenant_id = Column(UUID(as_uuid=True), nullable=False)
-    session_id = Column(UUID(as_uuid=True), ForeignKey("transformation_sessions.id"), nullable=False)
+    session_id = Column(UUID(as_uuid=True), ForeignKey("transformation_sessions.id", ondelete="CASCADE"), nullable=False, index=True)
     name = Column(String(255), nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), default=_utcnow, nullable=False)
 
 
 class AuditLog(Base):
+    # Range-partitioned by month on created_at in Postgres (physical PK is
+    # (id, created_at)); ids are uuid4 so the ORM keeps addressing rows by id.
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        Index(
+            "ix_audit_logs_tenant_id_created_at",
+            "tenant_id",
+            text("created_at DESC"),
+            postgresql_where=text("tenant_id IS NOT NULL"),
+        ),
+        Index("ix_audit_logs_created_at_brin", "created_at", postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
+        Index("ix_audit_logs_payload_gin", "payload", postgresql_using="gin", postgresql_ops={"payload": "jsonb_path_ops"}),
+    )
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     tenant_id = Column(UUID(as_uuid=True), nullable=True)
-    actor = Column(String(255), nullable=True)
-    action = Column(String(255), nullable=False)
-    payload = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    actor = Column(Text, nullable=True)
+    action = Column(Text, nullable=False)
+    payload = Column(JSONDocument, nullable=True)
+    created_at = Column(DateTime(timezone=True), default=_utcnow, nullable=False)
 
 
 class AppUser(Base):
@@ -1,12 +1,17 @@
 import os
 import sys
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.pool import NullPool
 
+from app.core import json
+
 
 DATABASE_URL = os.getenv("DATABASE_URL") or os.getenv("SUPABASE_DB_URL")
-engine_kwargs = {"echo": False}
+# JSON/JSONB bind values (audit payloads, snapshots) are encoded once, by orjson,
+# on their way to the driver instead of through the stdlib encoder.
+engine_kwargs = {"echo": False, "json_serializer": json.dumps, "json_deserializer": json.loads}
 
 if DATABASE_URL and DATABASE_URL.startswith("postgresql://"):
     DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
@@ -40,7 +45,26 @@ if DATABASE_URL and DATABASE_URL.startswith("postgresql+asyncpg://"):
 
 default_url = "sqlite+aiosqlite:///./strategos_dev.db"
 
+
+
+def enable_sqlite_foreign_keys(async_engine: AsyncEngine) -> None:
+    """Turn on FK enforcement for SQLite connections, which is off by default.
+
+    Session children (scenarios, snapshot events) are removed by ON DELETE
+    CASCADE, so the local and test databases need it as much as Postgres.
+    """
+    if async_engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(async_engine.sync_engine, "connect")
+    def _set_foreign_keys(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
 engine = create_async_engine(DATABASE_URL or default_url, **engine_kwargs)
+enable_sqlite_foreign_keys(engine)
 AsyncSessionLocal = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
 
 async def get_session() -> AsyncSession:
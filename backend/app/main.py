@@ -4,14 +4,17 @@ import sys
 if sys.platform == "win32":
     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from app.core.response import ORJSONResponse
 from app.api.v1.health import router as health_router
 from app.api.v1.sessions import router as sessions_router
 from app.api.v1.engine import router as engine_router
 from app.api.v1.rules import router as rules_router
 from app.api.v1.model_versions import router as model_versions_router
 from app.api.v1.states import router as states_router
-from app.api.v1.advisory import router as advisory_router
+from app.api.v1.advisory import close_openclaw_http_client, close_openclaw_ws_pool, router as advisory_router
 from app.api.v1.intake import router as intake_router
 from app.api.v1.reports import router as reports_router
 from app.api.v1.admin import router as admin_router
@@ -19,12 +22,21 @@ from app.api.v1.auth import router as auth_router
 
 from fastapi.middleware.cors import CORSMiddleware
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await close_openclaw_http_client()
+    await close_openclaw_ws_pool()
+
+
 app = FastAPI(
     title="STRATEGOS",
     description="Deterministic transformation modeling platform",
     openapi_url="/api/v1/openapi.json",
     docs_url="/api/v1/docs",
     redoc_url="/api/v1/redoc",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -0,0 +1,50 @@
+from typing import Optional, Tuple
+import uuid
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.ttl_cache import TTLCache
+from app.db import models
+
+
+# Intake resolves the active model version on every request, but it only changes
+# when a version is created active or activated. Entries live for a short TTL so
+# other workers pick up an activation without a shared invalidation channel;
+# writes in this process drop the cache at once. Only found versions are cached,
+# and a tenant without its own version shares the ``None`` (any tenant) entry, so
+# unknown tenant ids sent by clients never become keys.
+_ACTIVE_MV_CACHE: TTLCache[Tuple[uuid.UUID, uuid.UUID]] = TTLCache(maxsize=1024, ttl=60.0)
+
+_ACTIVE_MV = select(models.ModelVersion.id, models.ModelVersion.tenant_id).where(models.ModelVersion.is_active)
+
+
+def invalidate_active_model_versions() -> None:
+    # Cleared wholesale: a tenant without its own version resolves to another tenant's.
+    _ACTIVE_MV_CACHE.clear()
+
+
+async def _lookup(db: AsyncSession, tenant_id: Optional[uuid.UUID]) -> Optional[Tuple[uuid.UUID, uuid.UUID]]:
+    cached = _ACTIVE_MV_CACHE.get(tenant_id)
+    if cached is not None:
+        return cached
+    q = _ACTIVE_MV if tenant_id is None else _ACTIVE_MV.where(models.ModelVersion.tenant_id == tenant_id)
+    row = (await db.execute(q.limit(1))).first()
+    if row is None:
+        return None
+    _ACTIVE_MV_CACHE.set(tenant_id, (row.id, row.tenant_id))
+    return row.id, row.tenant_id
+
+
+async def resolve_active_model_version(
+    db: AsyncSession, tenant_id: Optional[uuid.UUID]
+) -> Optional[Tuple[uuid.UUID, uuid.UUID]]:
+    """Return ``(model_version_id, tenant_id)`` of the tenant's active version.
+
+    Falls back to any active version when the tenant has none, for demo and
+    local flows where the auth tenant does not match the seeded one.
+    """
+    if tenant_id:
+        found = await _lookup(db, tenant_id)
+        if found is not None:
+            return found
+    return await _lookup(db, None)
@@ -1,10 +1,10 @@
 from typing import Optional, Dict, Any, List, Tuple
 import ast
-import json
 import uuid
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core import json
 from app.db import models
 
 
@@ -126,7 +126,7 @@ async def run_deterministic_engine(db: AsyncSession, model_version_id: Optional[
     else:
         # Prefer the active model version with the most active rules so that
         # deterministic behavior is driven by the richest configured rule-pack.
-        q = select(models.ModelVersion).where(models.ModelVersion.is_active == True)
+        q = select(models.ModelVersion).where(models.ModelVersion.is_active)
         res = await db.execute(q)
         active_versions = res.scalars().all()
         if not active_versions:
@@ -138,7 +138,7 @@ async def run_deterministic_engine(db: AsyncSession, model_version_id: Optional[
             for candidate in active_versions:
                 rq = select(models.Rule).where(
                     models.Rule.model_version_id == candidate.id,
-                    models.Rule.is_active == True,
+                    models.Rule.is_active,
                 )
                 rr = await db.execute(rq)
                 rule_count = len(rr.scalars().all())
@@ -156,7 +156,7 @@ async def run_deterministic_engine(db: AsyncSession, model_version_id: Optional[
         return {"error": "no_model_version", "message": "No active ModelVersion found"}
 
     # Load rules for model version
-    rules_q = select(models.Rule).where(models.Rule.model_version_id == mv.id, models.Rule.is_active == True)
+    rules_q = select(models.Rule).where(models.Rule.model_version_id == mv.id, models.Rule.is_active)
     rules_res = await db.execute(rules_q)
     rules = rules_res.scalars().all()
 
@@ -164,7 +164,7 @@ async def run_deterministic_engine(db: AsyncSession, model_version_id: Optional[
     rule_ids = [r.id for r in rules]
     conditions: List[models.RuleCondition] = []
     if rule_ids:
-        condition_q = select(models.RuleCondition).where(models.RuleCondition.rule_id.in_(rule_ids), models.RuleCondition.is_active == True)
+        condition_q = select(models.RuleCondition).where(models.RuleCondition.rule_id.in_(rule_ids), models.RuleCondition.is_active)
         cond_res = await db.execute(condition_q)
         conditions = cond_res.scalars().all()
 
@@ -172,7 +172,7 @@ async def run_deterministic_engine(db: AsyncSession, model_version_id: Optional[
     coefficient_configs: List[Dict[str, Any]] = []
     coeff_q = select(models.Coefficient).where(
         models.Coefficient.model_version_id == mv.id,
-        models.Coefficient.is_active == True,
+        models.Coefficient.is_active,
     )
     coeff_res = await db.execute(coeff_q)
     coefficients = coeff_res.scalars().all()
@@ -227,7 +227,7 @@ async def run_deterministic_engine(db: AsyncSession, model_version_id: Optional[
         if rule_ids:
             impact_q = select(models.RuleImpact).where(
                 models.RuleImpact.rule_id.in_(rule_ids),
-                models.RuleImpact.is_active == True,
+                models.RuleImpact.is_active,
             )
             impact_res = await db.execute(impact_q)
             impacts = impact_res.scalars().all()
@@ -264,7 +264,7 @@ async def run_deterministic_engine(db: AsyncSession, model_version_id: Optional[
     metric_values: Dict[str, float] = {}
     metric_q = select(models.Metric).where(
         models.Metric.model_version_id == mv.id,
-        models.Metric.is_active == True,
+        models.Metric.is_active,
     )
     metric_res = await db.execute(metric_q)
     metric_items = metric_res.scalars().all()
@@ -414,7 +414,7 @@ async def run_deterministic_engine(db: AsyncSession, model_version_id: Optional[
                 if template is None:
                     continue
                 parsed_payload: Any = template.payload
-                if template.payload:
+                if isinstance(template.payload, str) and template.payload:
                     try:
                         parsed_payload = json.loads(template.payload)
                     except Exception:
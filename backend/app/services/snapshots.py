@@ -0,0 +1,144 @@
+from typing import Any, Dict, List
+import os
+import uuid
+from sqlalchemy import bindparam, delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import models
+
+
+# Events kept per session; older versions are pruned as new ones land. 0 keeps everything.
+SNAPSHOT_HISTORY_MAX = int(os.getenv("SNAPSHOT_HISTORY_MAX", "50"))
+
+
+# Statements are built once at import; per call only the bound values change, so
+# SQLAlchemy's compiled cache is hit without rebuilding the statement first.
+# They target the Core tables: ORM-enabled DML would treat a parameter dict as a
+# bulk operation keyed on primary key.
+_EVENTS = models.SnapshotEvent.__table__
+_SESSIONS = models.TransformationSession.__table__
+
+_SESSION_EXISTS = select(models.TransformationSession.id).where(
+    models.TransformationSession.id == bindparam("sid")
+)
+
+# Taken before allocating a version: concurrent runs on one session queue on the
+# session row, so each one's MAX(version) sees the previous run's committed event.
+_LOCK_SESSION = select(_SESSIONS.c.id).where(_SESSIONS.c.id == bindparam("sid")).with_for_update()
+
+# Version allocation and the insert share one statement: INSERT ... SELECT MAX()+1 RETURNING.
+_INSERT_NEXT_EVENT = (
+    insert(_EVENTS)
+    .from_select(
+        ["session_id", "version", "snapshot"],
+        select(
+            bindparam("sid", type_=_EVENTS.c.session_id.type),
+            func.coalesce(func.max(_EVENTS.c.version), 0) + 1,
+            bindparam("snap", type_=_EVENTS.c.snapshot.type),
+        ).where(_EVENTS.c.session_id == bindparam("sid")),
+    )
+    .returning(_EVENTS.c.version)
+)
+
+_PRUNE_EVENTS = delete(_EVENTS).where(
+    _EVENTS.c.session_id == bindparam("sid"),
+    _EVENTS.c.version <= bindparam("oldest"),
+)
+
+# Plain table inserts; the columns come from the parameter dict at execution.
+_INSERT_SESSION = insert(_SESSIONS)
+_INSERT_EVENT = insert(_EVENTS)
+
+_SET_LATEST_SNAPSHOT = (
+    update(_SESSIONS)
+    .where(_SESSIONS.c.id == bindparam("sid"))
+    .values(
+        snapshot=bindparam("snap", type_=_SESSIONS.c.snapshot.type),
+        latest_state=bindparam("state", type_=_SESSIONS.c.latest_state.type),
+        latest_total_score=bindparam("total_score", type_=_SESSIONS.c.latest_total_score.type),
+    )
+)
+
+
+def _summary_fields(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    state = snapshot.get("state")
+    total_score = (snapshot.get("score_breakdown") or {}).get("total_score")
+    return {
+        "state": state if isinstance(state, str) else None,
+        "total_score": total_score if isinstance(total_score, (int, float)) and not isinstance(total_score, bool) else None,
+    }
+
+
+async def session_exists(db: AsyncSession, session_id: uuid.UUID) -> bool:
+    """Check for the session by primary key without loading its snapshot document."""
+    res = await db.execute(_SESSION_EXISTS, {"sid": session_id})
+    return res.first() is not None
+
+
+async def record_snapshot(db: AsyncSession, session_id: uuid.UUID, snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    """Append an engine snapshot to the session's history and make it the latest.
+
+    The history row is a single INSERT and the session row only ever holds
+    ``{"version", "latest"}`` plus the latest state and total score columns, so
+    the cost of a run no longer grows with the number of earlier runs. The
+    caller owns the commit, which also releases the session row lock taken here.
+    """
+    await db.execute(_LOCK_SESSION, {"sid": session_id})
+    res = await db.execute(_INSERT_NEXT_EVENT, {"sid": session_id, "snap": snapshot})
+    version = int(res.scalar_one())
+
+    if SNAPSHOT_HISTORY_MAX > 0 and version > SNAPSHOT_HISTORY_MAX:
+        await db.execute(_PRUNE_EVENTS, {"sid": session_id, "oldest": version - SNAPSHOT_HISTORY_MAX})
+
+    packed = {"version": version, "latest": snapshot}
+    await db.execute(_SET_LATEST_SNAPSHOT, {"sid": session_id, "snap": packed, **_summary_fields(snapshot)})
+    return packed
+
+
+async def create_session_with_snapshot(
+    db: AsyncSession,
+    *,
+    tenant_id: uuid.UUID,
+    model_version_id: uuid.UUID,
+    name: str | None,
+    snapshot: Dict[str, Any],
+) -> uuid.UUID:
+    """Create a session whose first snapshot is already known.
+
+    A new session has no history, so the row goes in at version 1 with its
+    latest columns filled and only the event insert follows; there is no
+    version lookup, prune or follow-up UPDATE. The caller owns the commit.
+    """
+    session_id = uuid.uuid4()
+    summary = _summary_fields(snapshot)
+    await db.execute(
+        _INSERT_SESSION,
+        {
+            "id": session_id,
+            "tenant_id": tenant_id,
+            "model_version_id": model_version_id,
+            "name": name,
+            "snapshot": {"version": 1, "latest": snapshot},
+            "latest_state": summary["state"],
+            "latest_total_score": summary["total_score"],
+        },
+    )
+    await db.execute(_INSERT_EVENT, {"session_id": session_id, "version": 1, "snapshot": snapshot})
+    return session_id
+
+
+async def load_snapshot_history(db: AsyncSession, session_id: uuid.UUID) -> List[Dict[str, Any]]:
+    """Return the session's snapshot events oldest first, in the legacy ``history`` shape."""
+    res = await db.execute(
+        select(models.SnapshotEvent.version, models.SnapshotEvent.created_at, models.SnapshotEvent.snapshot)
+        .where(models.SnapshotEvent.session_id == session_id)
+        .order_by(models.SnapshotEvent.version)
+    )
+    return [
+        {
+            "version": version,
+            "created_at": created_at.isoformat() if created_at else None,
+            "snapshot": snapshot,
+        }
+        for version, created_at, snapshot in res.all()
+    ]
@@ -1,7 +1,6 @@
 import os
 import sys
 import uuid
-import json
 import asyncio
 from pathlib import Path
 if sys.platform == "win32":
@@ -299,7 +298,7 @@ async def main():
                     id=tid,
                     tenant_id=tenant_id,
                     name=t["name"],
-                    payload=json.dumps(t["payload"]),
+                    payload=t["payload"],
                 )
             )
             await conn.execute(
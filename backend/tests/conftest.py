@@ -22,6 +22,8 @@ def _create_tables():
     import uuid
 
     engine = create_async_engine(os.environ["DATABASE_URL"], echo=False)
+    from app.db.session import enable_sqlite_foreign_keys
+    enable_sqlite_foreign_keys(engine)
 
     async def _init():
         async with engine.begin() as conn:
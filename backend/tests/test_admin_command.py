@@ -0,0 +1,189 @@
+import uuid
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+client = TestClient(app)
+
+
+def _command(tenant_id: str, text: str) -> dict:
+    resp = client.post("/api/v1/admin/command", json={"tenant_id": tenant_id, "text": text})
+    assert resp.status_code == 200
+    return resp.json()["data"]
+
+
+def test_admin_command_help_and_fallback():
+    tenant_id = str(uuid.uuid4())
+
+    assert _command(tenant_id, "help")["action"] == "help"
+    assert _command(tenant_id, "make me a sandwich")["action"] == "unrecognized"
+
+
+def test_admin_command_model_and_rule_lifecycle():
+    # A tenant of its own keeps model activation from leaking into other tests.
+    tenant_id = str(uuid.uuid4())
+
+    created = _command(tenant_id, 'Create a new model version called "Admin Flow Model"')
+    assert created["action"] == "model_version_created"
+    assert created["name"] == "Admin Flow Model"
+
+    activated = _command(tenant_id, 'Activate model version "admin flow"')
+    assert activated["action"] == "model_version_activated"
+    assert activated["model_version_id"] == created["model_version_id"]
+
+    listed = _command(tenant_id, "Show all model versions")
+    assert listed["action"] == "list_model_versions"
+    assert [mv["is_active"] for mv in listed["model_versions"]] == [True]
+
+    missing = _command(tenant_id, 'Activate model version "100%"')
+    assert missing["action"] == "error"
+    assert "Admin Flow Model" in missing["message"]
+
+    rule = _command(tenant_id, 'Create a rule called "High Debt Warning" when technical_debt > 80 then set state_impact +15')
+    assert rule["action"] == "rule_created"
+    assert rule["name"] == "High Debt Warning"
+
+    rules = _command(tenant_id, "Show all rules")
+    assert rules["action"] == "list_rules"
+    assert len(rules["rules"]) == 1
+    assert rules["rules"][0]["conditions"][0]["expression"] == "technical_debt > 80"
+    assert rules["rules"][0]["impacts"][0]["impact"] == "+15"
+
+    overview = _command(tenant_id, "Show platform overview")
+    assert overview["action"] == "platform_overview"
+    assert overview["overview"]["model_versions"] == 1
+    assert overview["overview"]["active_rules"] == 1
+    assert overview["overview"]["active_model_version"]["id"] == created["model_version_id"]
+
+    deactivated = _command(tenant_id, 'Deactivate rule "high debt"')
+    assert deactivated["action"] == "rule_deactivated"
+    assert deactivated["rule_id"] == rule["rule_id"]
+    assert _command(tenant_id, "Show platform overview")["overview"]["active_rules"] == 0
+
+    missing = _command(tenant_id, 'Deactivate rule "high debt"')
+    assert missing["action"] == "error"
+
+
+def test_json_config_cache_tracks_writes(tmp_path):
+    from app.core import config_files
+
+    path = tmp_path / "board.json"
+    assert config_files.load_json_config(path, {"agents": []}) == {"agents": []}
+
+    config_files.write_json_config(path, {"agents": [{"id": "cfo"}]})
+    loaded = config_files.load_json_config(path, {"agents": []})
+    assert loaded == {"agents": [{"id": "cfo"}]}
+    assert config_files.load_json_config(path, {"agents": []}) is loaded
+
+    path.write_text('{"agents": []}\n', encoding="utf-8")
+    config_files._JSON_CACHE[path] = (-1, loaded)
+    assert config_files.load_json_config(path, {"agents": []}) == {"agents": []}
+
+
+def test_admin_command_list_states_includes_thresholds():
+    tenant_id = str(uuid.uuid4())
+    state = client.post("/api/v1/states", json={"tenant_id": tenant_id, "name": "STABLE", "description": "Calm"})
+    state_id = state.json()["data"]["state_definition_id"]
+    client.post(f"/api/v1/states/{state_id}/thresholds", json={"tenant_id": tenant_id, "threshold": "total_score <= 20"})
+    client.post("/api/v1/states", json={"tenant_id": tenant_id, "name": "EMPTY"})
+
+    listed = _command(tenant_id, "Show all states")
+    assert listed["action"] == "list_states"
+    thresholds = {s["name"]: [t["threshold"] for t in s["thresholds"]] for s in listed["states"]}
+    assert thresholds == {"STABLE": ["total_score <= 20"], "EMPTY": []}
+
+
+def test_admin_command_activate_switches_active_model():
+    tenant_id = str(uuid.uuid4())
+    first = _command(tenant_id, 'Create a new model version called "Baseline"')
+    second = _command(tenant_id, 'Create a new model version called "Stretch Plan"')
+
+    _command(tenant_id, 'Activate model version "baseline"')
+    switched = _command(tenant_id, 'Switch to model "stretch"')
+    assert switched["model_version_id"] == second["model_version_id"]
+
+    listed = _command(tenant_id, "Show all model versions")
+    active = {mv["id"]: mv["is_active"] for mv in listed["model_versions"]}
+    assert active == {first["model_version_id"]: False, second["model_version_id"]: True}
+
+
+def test_skill_catalog_is_memoized_per_file_version(tmp_path, monkeypatch):
+    from app.api.v1 import admin
+    from app.core.config_files import write_json_config
+
+    path = tmp_path / "skills.json"
+    path.write_text('{"skills": [{"id": " pricing "}, {"id": "ops"}, {"name": "no-id"}]}', encoding="utf-8")
+    monkeypatch.setattr(admin, "SKILLS_PATH", path)
+
+    assert admin._extract_skill_catalog() == ["pricing", "ops"]
+    assert admin._skill_catalog_set() is admin._skill_catalog_set()
+
+    write_json_config(path, {"skills": [{"id": "risk"}]})
+    assert admin._skill_catalog_set() == frozenset({"risk"})
+
+
+def test_admin_agent_crud(tmp_path, monkeypatch):
+    from app.api.v1 import admin
+
+    from app.api.v1 import advisory
+
+    monkeypatch.setattr(admin, "BOARD_PATH", tmp_path / "board.json")
+    monkeypatch.setattr(advisory, "BOARD_AGENTS_PATH", tmp_path / "board.json")
+
+    created = client.post("/api/v1/admin/agents", json={"id": "cfo", "role": "Finance lead", "skills": ["a", " a ", "b"]})
+    assert created.status_code == 200
+    assert created.json()["data"]["agent"]["skills"] == ["a", "b"]
+    assert client.post("/api/v1/admin/agents", json={"id": "cfo", "role": "Again"}).status_code == 409
+    client.post("/api/v1/admin/agents", json={"id": "cto", "role": "Tech lead"})
+
+    updated = client.put("/api/v1/admin/agents/cfo/skills", json={"skills": ["not-a-real-skill"]})
+    assert updated.status_code == 200
+    assert updated.json()["data"]["unknown_skills"] == ["not-a-real-skill"]
+
+    listed = client.get("/api/v1/admin/agents").json()["data"]["agents"]
+    assert [(a["id"], a["skills"]) for a in listed] == [("cfo", ["not-a-real-skill"]), ("cto", [])]
+
+    # The advisory router's derived role map sees admin edits to the shared board file.
+    assert advisory._board_role_lookup() == {"cfo": "Finance lead", "cto": "Tech lead"}
+
+    assert client.delete("/api/v1/admin/agents/cfo").status_code == 200
+    assert advisory._board_role_lookup() == {"cto": "Tech lead"}
+    assert client.delete("/api/v1/admin/agents/cfo").status_code == 404
+    assert [a["id"] for a in client.get("/api/v1/admin/agents").json()["data"]["agents"]] == ["cto"]
+
+
+def test_clause_to_expression_examples():
+    from app.api.v1.admin import _clause_to_expression
+
+    assert _clause_to_expression("cost is 20% higher than revenue") == "cost > (revenue * 1.2)"
+    assert _clause_to_expression("margin is 10 percent lower than target_margin") == "margin < (target_margin * 0.9)"
+    assert _clause_to_expression("operating costs exceed 50% of revenue") == "cost > (revenue * 0.5)"
+    assert _clause_to_expression("profit margin drops below 5%") == "margin < 0.05"
+    assert _clause_to_expression("technical debt at least 80") == "technical_debt >= 80"
+    assert _clause_to_expression("revenue no more than 1,000") == "revenue <= 1000"
+    assert _clause_to_expression("something weird") == "something weird"
+
+
+def test_platform_overview_falls_back_to_latest_session_model():
+    import os
+
+    tenant_id = str(uuid.uuid4())
+    mv_id = os.environ["TEST_MODEL_VERSION_ID"]
+    resp = client.post("/api/v1/sessions", json={"tenant_id": tenant_id, "model_version_id": mv_id})
+    assert resp.status_code == 200
+
+    overview = _command(tenant_id, "Show platform overview")["overview"]
+    assert overview["active_model_version"]["id"] == mv_id
+    assert overview["model_versions"] == 1
+    assert overview["sessions"] == 1
+
+
+def test_admin_overview_cache_stays_bounded(monkeypatch):
+    from app.api.v1 import admin
+    from app.core.ttl_cache import TTLCache
+
+    monkeypatch.setattr(admin, "_OVERVIEW_CACHE", TTLCache(maxsize=3, ttl=5.0))
+    for _ in range(6):
+        _command(str(uuid.uuid4()), "show platform overview")
+    assert len(admin._OVERVIEW_CACHE) == 3
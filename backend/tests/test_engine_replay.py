@@ -1,7 +1,13 @@
+import asyncio
 import os
+import uuid
 
+import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import func, insert, select
 
+import app.db.session as session_mod
+from app.db import models
 from app.main import app
 
 
@@ -59,3 +65,194 @@ def test_session_snapshot_versioning_and_replay():
     assert payload["action"] == "ENGINE_RUN"
     # replay snapshot may contain deterministic error only if config missing
     assert "replay_snapshot" in payload
+
+
+def test_session_snapshot_history_is_stored_outside_session_row():
+    tenant_id = os.environ.get("TEST_TENANT_ID")
+    model_version_id = os.environ.get("TEST_MODEL_VERSION_ID")
+
+    create_resp = client.post(
+        "/api/v1/sessions",
+        json={"tenant_id": tenant_id, "model_version_id": model_version_id, "name": "history-session"},
+    )
+    session_id = create_resp.json()["data"]["session_id"]
+
+    for revenue in (1100, 900, 1000):
+        run = client.post(
+            "/api/v1/engine/run",
+            json={"tenant_id": tenant_id, "model_version_id": model_version_id, "session_id": session_id, "input": {"revenue": revenue}},
+        )
+        assert run.status_code == 200
+
+    detail = client.get(f"/api/v1/sessions/{session_id}").json()["data"]
+    assert detail["snapshot"]["version"] == 3
+    assert "history" not in detail["snapshot"]
+
+    snapshots = client.get(f"/api/v1/sessions/{session_id}/snapshots").json()["data"]
+    assert snapshots["version"] == 3
+    assert [event["version"] for event in snapshots["history"]] == [1, 2, 3]
+    assert snapshots["history"][-1]["snapshot"] == snapshots["latest"]
+
+    listed = client.get("/api/v1/sessions", params={"tenant_id": tenant_id}).json()["data"]["sessions"]
+    assert next(s for s in listed if s["id"] == session_id)["has_snapshot"] is True
+
+
+def test_session_snapshot_history_is_capped(monkeypatch):
+    from app.services import snapshots
+
+    monkeypatch.setattr(snapshots, "SNAPSHOT_HISTORY_MAX", 2)
+    tenant_id = os.environ.get("TEST_TENANT_ID")
+    model_version_id = os.environ.get("TEST_MODEL_VERSION_ID")
+
+    create_resp = client.post(
+        "/api/v1/sessions",
+        json={"tenant_id": tenant_id, "model_version_id": model_version_id, "name": "capped-session"},
+    )
+    session_id = create_resp.json()["data"]["session_id"]
+
+    for revenue in (1100, 900, 1000):
+        client.post(
+            "/api/v1/engine/run",
+            json={"tenant_id": tenant_id, "model_version_id": model_version_id, "session_id": session_id, "input": {"revenue": revenue}},
+        )
+
+    snapshots_data = client.get(f"/api/v1/sessions/{session_id}/snapshots").json()["data"]
+    assert snapshots_data["version"] == 3
+    assert [event["version"] for event in snapshots_data["history"]] == [2, 3]
+
+
+def test_concurrent_engine_runs_get_distinct_versions():
+    import httpx
+
+    tenant_id = os.environ.get("TEST_TENANT_ID")
+    model_version_id = os.environ.get("TEST_MODEL_VERSION_ID")
+    create_resp = client.post(
+        "/api/v1/sessions",
+        json={"tenant_id": tenant_id, "model_version_id": model_version_id, "name": "concurrent-session"},
+    )
+    session_id = create_resp.json()["data"]["session_id"]
+
+    async def run_twice():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as ac:
+            return await asyncio.gather(*(
+                ac.post(
+                    "/api/v1/engine/run",
+                    json={"tenant_id": tenant_id, "model_version_id": model_version_id, "session_id": session_id, "input": {"revenue": revenue}},
+                )
+                for revenue in (1100, 900)
+            ))
+
+    assert [r.status_code for r in asyncio.run(run_twice())] == [200, 200]
+    history = client.get(f"/api/v1/sessions/{session_id}/snapshots").json()["data"]["history"]
+    assert [event["version"] for event in history] == [1, 2]
+
+
+def test_malformed_session_ids_are_rejected_before_the_handler():
+    assert client.get("/api/v1/sessions/not-a-uuid/snapshots").status_code == 422
+    run = client.post("/api/v1/engine/run", json={"session_id": "not-a-uuid", "input": {}})
+    assert run.status_code == 422
+
+
+def test_session_reports_render_latest_snapshot():
+    tenant_id = os.environ.get("TEST_TENANT_ID")
+    model_version_id = os.environ.get("TEST_MODEL_VERSION_ID")
+    create_resp = client.post(
+        "/api/v1/sessions",
+        json={"tenant_id": tenant_id, "model_version_id": model_version_id, "name": "csv-session"},
+    )
+    session_id = create_resp.json()["data"]["session_id"]
+    run = client.post(
+        "/api/v1/engine/run",
+        json={"tenant_id": tenant_id, "model_version_id": model_version_id, "session_id": session_id, "input": {"revenue": 900}},
+    )
+    assert run.status_code == 200
+
+    report = client.get(f"/api/v1/reports/{session_id}", params={"format": "csv"})
+    assert report.status_code == 200
+    assert report.headers["content-type"].startswith("text/csv")
+    lines = report.text.splitlines()
+    assert lines[0] == "STRATEGOS Executive Data Export"
+    assert f"Session ID,{session_id}" in lines
+    assert f"State Classification,{run.json()['state']}" in lines
+
+    pdf = client.get(f"/api/v1/reports/{session_id}", params={"format": "pdf"})
+    assert pdf.status_code == 200
+    assert pdf.headers["content-type"] == "application/pdf"
+    assert pdf.content.startswith(b"%PDF")
+
+
+def test_intake_creates_session_with_first_snapshot():
+    tenant_id = os.environ.get("TEST_TENANT_ID")
+    model_version_id = os.environ.get("TEST_MODEL_VERSION_ID")
+    intake = client.post(
+        "/api/v1/intake",
+        json={"tenant_id": tenant_id, "model_version_id": model_version_id, "text": "Revenue: 1200, cost: 800"},
+    )
+    assert intake.status_code == 200
+    data = intake.json()["data"]
+
+    snapshots = client.get(f"/api/v1/sessions/{data['session_id']}/snapshots").json()["data"]
+    assert snapshots["version"] == 1
+    assert snapshots["latest"] == data["snapshot"]
+    assert [h["version"] for h in snapshots["history"]] == [1]
+
+    replay = client.get(f"/api/v1/sessions/{data['session_id']}/replay").json()["data"]
+    assert replay["event_count"] == 1
+    assert "advisory_summary" not in data
+
+
+def test_intake_summary_is_opt_in():
+    model_version_id = os.environ.get("TEST_MODEL_VERSION_ID")
+    intake = client.post(
+        "/api/v1/intake",
+        json={"model_version_id": model_version_id, "text": "Revenue: 1200", "include_summary": True},
+    )
+    assert intake.status_code == 200
+    assert intake.json()["data"]["advisory_summary"].startswith("STRATEGOS Diagnostic Summary")
+
+
+def test_intake_resolves_tenant_from_model_version():
+    model_version_id = os.environ.get("TEST_MODEL_VERSION_ID")
+    intake = client.post("/api/v1/intake", json={"model_version_id": model_version_id, "text": "Revenue: 1200"})
+    assert intake.status_code == 200
+
+    missing = client.post("/api/v1/intake", json={"model_version_id": "00000000-0000-0000-0000-000000000000", "text": "Revenue: 1200"})
+    assert missing.status_code == 400
+    assert missing.json()["detail"] == "could_not_resolve_tenant"
+
+
+
+async def _add_scenario(session_id: uuid.UUID) -> None:
+    async with session_mod.AsyncSessionLocal() as db:
+        await db.execute(
+            insert(models.TransformationScenario).values(
+                tenant_id=uuid.UUID(os.environ["TEST_TENANT_ID"]), session_id=session_id, name="scenario"
+            )
+        )
+        await db.commit()
+
+
+async def _count_children(session_id: uuid.UUID) -> tuple:
+    async with session_mod.AsyncSessionLocal() as db:
+        counts = []
+        for model in (models.SnapshotEvent, models.TransformationScenario):
+            res = await db.execute(select(func.count()).select_from(model).where(model.session_id == session_id))
+            counts.append(res.scalar_one())
+        return tuple(counts)
+
+
+@pytest.mark.parametrize("via_admin", [False, True])
+def test_deleting_a_session_removes_its_children(via_admin):
+    tenant_id = os.environ.get("TEST_TENANT_ID")
+    model_version_id = os.environ.get("TEST_MODEL_VERSION_ID")
+    intake = client.post("/api/v1/intake", json={"tenant_id": tenant_id, "model_version_id": model_version_id, "text": "Revenue: 1200"})
+    session_id = intake.json()["data"]["session_id"]
+    asyncio.run(_add_scenario(uuid.UUID(session_id)))
+    assert asyncio.run(_count_children(uuid.UUID(session_id))) == (1, 1)
+
+    if via_admin:
+        deleted = client.post("/api/v1/admin/command", json={"tenant_id": tenant_id, "text": f"delete session {session_id}"})
+        assert deleted.json()["data"]["action"] == "session_deleted"
+    else:
+        assert client.delete(f"/api/v1/sessions/{session_id}").status_code == 200
+    assert asyncio.run(_count_children(uuid.UUID(session_id))) == (0, 0)
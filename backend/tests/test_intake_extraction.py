@@ -0,0 +1,65 @@
+from app.api.v1.intake import extract_metrics, generate_advisory_summary
+
+
+def test_extract_metrics_prefers_explicit_labels():
+    metrics, profile, source = extract_metrics("Revenue: 950m\nCost: 1.2bn\nMargin: 18%\nTechnical debt: 60%", "none")
+    assert profile == "none"
+    assert metrics == {"revenue": 950.0, "cost": 1200.0, "margin": 0.18, "technical_debt": 60.0}
+    assert set(source.values()) == {"explicit_input"}
+
+
+def test_extract_metrics_parses_text_and_qualitative_overrides():
+    metrics, _, source = extract_metrics("We have $1.5bn revenue, 800m operating costs, margin of 12% and high technical debt.", "none")
+    assert metrics["revenue"] == 1500.0
+    assert metrics["cost"] == 800.0
+    assert metrics["margin"] == 0.12
+    assert metrics["technical_debt"] == 72.0
+    assert source["technical_debt"] == "qualitative_override"
+
+
+def test_extract_metrics_fills_profile_defaults():
+    metrics, profile, source = extract_metrics("A stable, scaling business with churn of 2.5%")
+    assert profile == "growth"
+    assert metrics["customer_churn_pct"] == 2.5
+    assert source["revenue"] == "profile_default:growth"
+
+
+def test_extract_metrics_stays_linear_on_pathological_input():
+    import time
+
+    started = time.perf_counter()
+    for text in ("cost " + "1," * 20000, "revenue " + " " * 40000 + "x", "5" + " " * 40000 + "x"):
+        extract_metrics(text, "none")
+    # Quadratic backtracking took tens of seconds on these inputs.
+    assert time.perf_counter() - started < 5.0
+
+
+def test_extract_metrics_cache_returns_independent_results():
+    first, _, first_source = extract_metrics("Revenue: 950m\nChurn: 2%", "none")
+    first["revenue"] = 0.0
+    first_source.clear()
+    second, _, second_source = extract_metrics("Revenue: 950m\nChurn: 2%", "none")
+    assert second == {"revenue": 950.0, "customer_churn_pct": 2.0}
+    assert second_source == {"revenue": "explicit_input", "customer_churn_pct": "explicit_input"}
+
+
+def test_profile_hints_match_at_word_starts_only():
+    assert extract_metrics("An unstable, unhealthy business")[1] == "balanced"
+    assert extract_metrics("A stable business under pressure")[1] == "stressed"
+    assert extract_metrics("The company is distressed")[1] == "stressed"
+    assert extract_metrics("Margin pressures mounting")[1] == "stressed"
+    assert extract_metrics("Critically underfunded operations")[1] == "stressed"
+    assert extract_metrics("We are modernizing the platform")[1] == "growth"
+
+
+def test_advisory_summary_reads_decoded_action_payloads():
+    snapshot = {
+        "state": "CRITICAL_ZONE",
+        "restructuring_actions": [
+            {"template_name": "Cost reset", "payload": {"owner": "CFO", "horizon": "90d"}},
+            {"template_name": "Legacy", "payload": "not json"},
+        ],
+    }
+    summary = generate_advisory_summary(snapshot, {}, "none", {})
+    assert "→ Cost reset (Owner: CFO, Horizon: 90d)" in summary
+    assert "→ Legacy (Owner: TBD, Horizon: TBD)" in summary
@@ -1,4 +1,5 @@
 import os
+import uuid
 from fastapi.testclient import TestClient
 
 from app.main import app
@@ -27,6 +28,37 @@ def test_model_versions_create_list_activate():
     assert activate_resp.json()["data"]["is_active"] is True
 
 
+def test_intake_follows_model_version_activation():
+    tenant_id = str(uuid.uuid4())
+
+    def intake_model_version():
+        intake = client.post("/api/v1/intake", json={"tenant_id": tenant_id, "text": "Revenue: 1200"})
+        assert intake.status_code == 200
+        session_id = intake.json()["data"]["session_id"]
+        return client.get(f"/api/v1/sessions/{session_id}").json()["data"]["model_version_id"]
+
+    first = client.post("/api/v1/models/versions", json={"tenant_id": tenant_id, "name": "mv-first"})
+    first_id = first.json()["data"]["model_version_id"]
+    assert intake_model_version() == first_id
+
+    second = client.post("/api/v1/models/versions", json={"tenant_id": tenant_id, "name": "mv-second", "is_active": False})
+    second_id = second.json()["data"]["model_version_id"]
+    assert intake_model_version() == first_id
+
+    client.patch(f"/api/v1/models/versions/{second_id}/activate")
+    assert intake_model_version() == second_id
+
+
+def test_intake_does_not_cache_unknown_tenants():
+    from app.services import active_model
+
+    tenant_ids = [uuid.uuid4() for _ in range(5)]
+    for tenant_id in tenant_ids:
+        intake = client.post("/api/v1/intake", json={"tenant_id": str(tenant_id), "text": "Revenue: 1200"})
+        assert intake.status_code == 200
+    assert all(active_model._ACTIVE_MV_CACHE.get(tenant_id) is None for tenant_id in tenant_ids)
+
+
 def test_states_and_thresholds_flow():
     tenant_id = os.environ.get("TEST_TENANT_ID")
 
@@ -64,11 +64,14 @@ def test_openclaw_skill_contract_flow():
     state_resp = client.get(f"/api/v1/advisory/skills/state/{session_id}")
     assert state_resp.status_code == 200
     assert "state" in state_resp.json()["data"]
+    assert state_resp.json()["data"]["state"] == run_data["state"]
+    assert state_resp.json()["data"]["total_score"] == run_data["total_score"]
 
     # 4) Fetch contributions
     contrib_resp = client.get(f"/api/v1/advisory/skills/contributions/{session_id}")
     assert contrib_resp.status_code == 200
     assert isinstance(contrib_resp.json()["data"].get("contributions"), list)
+    assert contrib_resp.json()["data"]["contributions"] == run_data["snapshot"]["contributions"]
 
     # 5) Fetch restructuring details
     restruct_resp = client.get(f"/api/v1/advisory/skills/restructuring/{session_id}")
@@ -86,3 +89,35 @@ def test_openclaw_skill_contract_flow():
     rules_data = show_rules.json()["data"].get("rules")
     assert isinstance(rules_data, list)
     assert len(rules_data) >= 1
+
+
+def test_openclaw_ws_pool_aborts_sockets_from_a_previous_loop():
+    import asyncio
+
+    from app.api.v1 import advisory
+
+    class _Transport:
+        aborted = False
+
+        def abort(self):
+            self.aborted = True
+
+    class _Socket:
+        def __init__(self):
+            self.transport = _Transport()
+
+        async def close(self):
+            pass
+
+    stale = _Socket()
+
+    async def park():
+        assert advisory._checkout_openclaw_ws() is None
+        await advisory._checkin_openclaw_ws(stale)
+
+    async def checkout():
+        return advisory._checkout_openclaw_ws()
+
+    asyncio.run(park())
+    assert asyncio.run(checkout()) is None
+    assert stale.transport.aborted
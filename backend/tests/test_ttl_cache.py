@@ -0,0 +1,30 @@
+from app.core.ttl_cache import TTLCache
+
+
+def test_ttl_cache_evicts_least_recently_used_past_its_bound():
+    cache = TTLCache(maxsize=3, ttl=60.0)
+    for key in range(3):
+        cache.set(key, str(key))
+    assert cache.get(0) == "0"
+
+    for key in range(3, 10):
+        cache.set(key, str(key))
+
+    assert len(cache) == 3
+    assert cache.get(0) is None
+    assert [cache.get(key) for key in (7, 8, 9)] == ["7", "8", "9"]
+
+
+def test_ttl_cache_drops_expired_entries_on_insert(monkeypatch):
+    from app.core import ttl_cache
+
+    now = [1000.0]
+    monkeypatch.setattr(ttl_cache.time, "monotonic", lambda: now[0])
+    cache = TTLCache(maxsize=10, ttl=5.0)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    now[0] += 6.0
+    cache.set("c", 3)
+    assert len(cache) == 1
+    assert cache.get("c") == 3
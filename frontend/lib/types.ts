@@ -87,5 +87,5 @@ export interface IntakeResponse {
   session_id: string;
   extracted_input: Record<string, number>;
   snapshot: EngineSnapshot;
-  advisory_summary: string;
+  advisory_summary?: string;
 }